@@ -66,11 +66,8 @@ def discover_azure_all_assets(account_name: Optional[str] = None, account_key: O
         for container_name_actual in containers_to_discover:
             try:
                 container_client = blob_service_client.get_container_client(container_name_actual)
-                blobs = container_client.list_blobs()
-                blob_list = list(blobs)
-                
                 container_assets = []
-                for blob in blob_list:
+                for blob in container_client.list_blobs():
                     key = blob.name
                     size = blob.size or 0
                     last_modified = blob.last_modified or datetime.now()
@@ -9,11 +9,12 @@ from google.cloud.eventarc_v1.types import Trigger, EventFilter, Destination, Cl
 from google.oauth2 import service_account
 from google.api_core import exceptions as google_exceptions
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 import uuid
 import db_helpers
+from thread_helpers import bounded_completions
 
 gcs_bp = Blueprint('gcs_bp', __name__)
 
@@ -23,6 +24,8 @@ class GCSConnectionTest(BaseModel):
     bucket_name: Optional[str] = None
     connection_name: str
 
+GCS_DISCOVERY_WORKERS = 20
+
 def discover_gcs_assets(service_account_json: str, project_id: str, bucket_name: Optional[str] = None, progress_callback=None) -> List[Dict[str, Any]]:
     assets = []
     
@@ -75,16 +78,6 @@ def discover_gcs_assets(service_account_json: str, project_id: str, bucket_name:
                 progress_callback(f'Discovering objects in bucket: {bucket_name_actual}...')
             
             try:
-                blobs = list(bucket.list_blobs())
-                
-                if progress_callback:
-                    progress_callback(f'   Found {len(blobs)} object(s) in bucket {bucket_name_actual}')
-                
-                if not blobs:
-                    if progress_callback:
-                        progress_callback(f' Completed bucket {bucket_name_actual}: 0 objects (empty bucket)')
-                    continue
-                
                 def process_blob(blob):
                     try:
                         key = blob.name
@@ -165,14 +158,12 @@ def discover_gcs_assets(service_account_json: str, project_id: str, bucket_name:
                         return None
                 
                 if progress_callback:
-                    progress_callback(f' Processing {len(blobs)} objects in parallel (20 concurrent)...')
+                    progress_callback(f' Processing objects in parallel ({GCS_DISCOVERY_WORKERS} concurrent)...')
                 
                 bucket_assets = []
                 processed_count = 0
-                with ThreadPoolExecutor(max_workers=20) as executor:
-                    futures = [executor.submit(process_blob, blob) for blob in blobs]
-                    
-                    for future in as_completed(futures):
+                with ThreadPoolExecutor(max_workers=GCS_DISCOVERY_WORKERS) as executor:
+                    for future in bounded_completions(executor, process_blob, bucket.list_blobs(), GCS_DISCOVERY_WORKERS * 4):
                         try:
                             asset = future.result()
                             if asset:
@@ -180,11 +171,16 @@ def discover_gcs_assets(service_account_json: str, project_id: str, bucket_name:
                                 processed_count += 1
                                 
                                 if progress_callback and processed_count % 10 == 0:
-                                    progress_callback(f'   Processed {processed_count}/{len(blobs)} objects in {bucket_name_actual}...')
+                                    progress_callback(f'   Processed {processed_count} objects in {bucket_name_actual}...')
                         except Exception as e:
                             print(f"  Error in future result: {e}")
                             continue
                 
+                if not bucket_assets:
+                    if progress_callback:
+                        progress_callback(f' Completed bucket {bucket_name_actual}: 0 objects (empty bucket)')
+                    continue
+                
                 assets.extend(bucket_assets)
                 
                 if progress_callback:
@@ -276,19 +276,25 @@ def compute_edge_confidence(relationship: str, column_lineage: List[ColumnLineag
         if any(t in trans_types for t in ["COUNT", "SUM", "JOIN", "DISTINCT"]):
             evidence.append("transformations:sql_ops")
     return (max(0.0, min(1.0, base)), evidence)
+PII_SENSITIVITY_PATTERNS = (
+    ('HIGH', ('ssn', 'social_security', 'passport', 'national_id', 'license_number',
+              'credit_card', 'account_number', 'password', 'secret', 'private_key')),
+    ('MEDIUM', ('email', 'phone', 'mobile', 'address', 'zip', 'postal', 'birth_date',
+                'birthday', 'age', 'gender', 'race', 'ethnicity')),
+    ('LOW', ('name', 'first_name', 'last_name', 'full_name', 'username', 'user_id')),
+)
+_PII_SENSITIVITY_RE = re.compile(
+    '(?:' + '|'.join(
+        f"(?=.*?(?P<{sensitivity}>{'|'.join(map(re.escape, patterns))}))"
+        for sensitivity, patterns in PII_SENSITIVITY_PATTERNS
+    ) + ')',
+    re.DOTALL
+)
 def detect_pii_in_column(column_name: str, description: str = '') -> tuple:
-    pii_patterns = {
-        'HIGH': ['ssn', 'social_security', 'passport', 'national_id', 'license_number', 
-                'credit_card', 'account_number', 'password', 'secret', 'private_key'],
-        'MEDIUM': ['email', 'phone', 'mobile', 'address', 'zip', 'postal', 'birth_date', 
-                  'birthday', 'age', 'gender', 'race', 'ethnicity'],
-        'LOW': ['name', 'first_name', 'last_name', 'full_name', 'username', 'user_id']
-    }
-    combined = f"{column_name} {description}".lower()
-    for sensitivity, patterns in pii_patterns.items():
-        if any(pattern in combined for pattern in patterns):
-            return True, sensitivity
-    return False, 'NONE'
+    match = _PII_SENSITIVITY_RE.match(f"{column_name} {description}".lower())
+    if match is None:
+        return False, 'NONE'
+    return True, match.lastgroup
 def get_enterprise_data_quality_score(column: Dict, table_metadata: Dict = None) -> int:
     score = 50  
     if column.get('nullable') == False:
@@ -719,14 +719,122 @@ def list_s3_buckets():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def _apply_pending_asset(db_session, pending_asset) -> Optional[str]:
+    from database import Asset
+    
+    pending_asset.status = 'accepted'
+    pending_asset.processed_at = datetime.utcnow()
+    
+    if pending_asset.change_type == 'deleted':
+        try:
+            existing_asset = db_session.query(Asset).filter(
+                Asset.id == pending_asset.asset_id
+            ).first()
+            if existing_asset:
+                db_session.delete(existing_asset)
+                print(f" Deleted asset {pending_asset.asset_id} from database")
+        except Exception as e:
+            print(f"Warning: Could not delete asset {pending_asset.asset_id} from database: {e}")
+        return None
+    
+    if not pending_asset.asset_data:
+        return None
+    
+    asset_data = pending_asset.asset_data.copy()
+    
+    if 'id' not in asset_data or not asset_data['id']:
+        asset_data['id'] = pending_asset.asset_id
+    
+    asset_data['discovered_at'] = datetime.utcnow().isoformat() + 'Z'
+    asset_data['status'] = 'active'
+    
+    if 'connector_id' not in asset_data:
+        asset_data['connector_id'] = pending_asset.connector_id
+    
+    if 'name' not in asset_data:
+        asset_data['name'] = pending_asset.name
+    
+    if 'type' not in asset_data:
+        asset_data['type'] = pending_asset.type
+    
+    if 'catalog' not in asset_data:
+        asset_data['catalog'] = pending_asset.catalog
+    
+    saved_asset_id = asset_data.get('id')
+    current_time = datetime.utcnow()
+    existing_asset = db_session.query(Asset).filter(Asset.id == saved_asset_id).first()
+    
+    if existing_asset:
+        existing_asset.discovered_at = current_time
+        existing_asset.sort_order = int(current_time.timestamp() * 1000)
+        
+        for key, value in asset_data.items():
+            if key == 'discovered_at':
+                continue
+            if key == 'schema':
+                setattr(existing_asset, 'schema_name', value)
+            elif key == 'metadata' or key == 'extra_data':
+                if isinstance(value, dict):
+                    existing_asset.extra_data = value
+            elif key not in ['id']:
+                if hasattr(existing_asset, key):
+                    setattr(existing_asset, key, value)
+        existing_asset.updated_at = current_time
+        existing_asset.status = 'active'
+    else:
+        new_asset_data = {
+            'id': saved_asset_id,
+            'name': asset_data.get('name'),
+            'type': asset_data.get('type'),
+            'catalog': asset_data.get('catalog'),
+            'schema_name': asset_data.get('schema', ''),
+            'connector_id': asset_data.get('connector_id'),
+            'status': asset_data.get('status', 'active'),
+            'sort_order': int(current_time.timestamp() * 1000),
+            'extra_data': asset_data
+        }
+        
+        discovered_at_str = asset_data['discovered_at']
+        try:
+            if discovered_at_str.endswith('Z'):
+                discovered_at_str = discovered_at_str[:-1] + '+00:00'
+            new_asset_data['discovered_at'] = datetime.fromisoformat(discovered_at_str)
+        except Exception as e:
+            print(f"  Error parsing discovered_at '{discovered_at_str}': {e}, using current time")
+            new_asset_data['discovered_at'] = current_time
+        
+        db_session.add(Asset(**new_asset_data))
+        print(f" Created new asset {saved_asset_id}")
+    
+    return saved_asset_id
+
+def _sync_cached_assets(saved_asset_ids: List[str], deleted_asset_ids: List[str]) -> None:
+    assets = current_app.config.get('discovered_assets')
+    if not isinstance(assets, list):
+        return
+    
+    refreshed = {asset['id']: asset for asset in db_helpers.load_assets_by_ids(saved_asset_ids)}
+    deleted = set(deleted_asset_ids) - refreshed.keys()
+    if deleted:
+        assets[:] = [asset for asset in assets if asset.get('id') not in deleted]
+    if refreshed:
+        for asset in assets:
+            fresh = refreshed.pop(asset.get('id'), None)
+            if fresh is not None:
+                asset.clear()
+                asset.update(fresh)
+        assets.extend(refreshed.values())
+    current_app.config['discovered_assets_generation'] = current_app.config.get('discovered_assets_generation', 0) + 1
+
+def _count_assets(db_session) -> int:
+    from database import Asset
+    from sqlalchemy import func
+    return db_session.query(func.count(Asset.id)).scalar() or 0
+
 @s3_bp.route('/accept-asset', methods=['POST'])
 def accept_pending_asset():
-    from database import PendingAsset, Asset
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
-    from config import Config
+    from database import PendingAsset
     
-    engine = None
     db_session = None
     
     try:
@@ -736,9 +844,7 @@ def accept_pending_asset():
         if not pending_id:
             return jsonify({'error': 'pending_id is required'}), 400
         
-        engine = create_engine(Config.SQLALCHEMY_DATABASE_URI)
-        Session = sessionmaker(bind=engine)
-        db_session = Session()
+        db_session = db_helpers.Session()
         
         pending_asset = db_session.query(PendingAsset).filter(
             PendingAsset.id == pending_id,
@@ -750,165 +856,125 @@ def accept_pending_asset():
             db_session = None
             return jsonify({'error': 'Pending asset not found'}), 404
         
-        if pending_asset.change_type == 'deleted':
-            pending_asset.status = 'accepted'
-            pending_asset.processed_at = datetime.utcnow()
+        is_delete = pending_asset.change_type == 'deleted'
+        deleted_asset_id = pending_asset.asset_id
+        
+        try:
+            saved_asset_id = _apply_pending_asset(db_session, pending_asset)
             db_session.commit()
-            
-            asset_deleted = False
-            try:
-                existing_asset = db_session.query(Asset).filter(
-                    Asset.id == pending_asset.asset_id
-                ).first()
-                if existing_asset:
-                    db_session.delete(existing_asset)
-                    db_session.commit()
-                    asset_deleted = True
-                    print(f" Deleted asset {pending_asset.asset_id} from database")
-            except Exception as e:
-                print(f"Warning: Could not delete asset {pending_asset.asset_id} from database: {e}")
-            
-            discovered_assets = db_helpers.load_assets()
-            assets_count = len(discovered_assets)
-            
+            if saved_asset_id:
+                print(f" Successfully saved asset {saved_asset_id} to database")
+        except Exception as save_error:
+            db_session.rollback()
+            print(f" Error saving asset: {save_error}")
+            import traceback
+            traceback.print_exc()
             db_session.close()
             db_session = None
+            return jsonify({
+                'success': False,
+                'error': f'Failed to save asset to database: {str(save_error)}'
+            }), 500
+        
+        assets_count = _count_assets(db_session)
+        db_session.close()
+        db_session = None
+        
+        _sync_cached_assets([saved_asset_id] if saved_asset_id else [], [deleted_asset_id] if is_delete else [])
+        
+        if is_delete:
             return jsonify({
                 'success': True, 
                 'message': 'Asset removed from inventory',
                 'assets_count': assets_count
             }), 200
         
-        saved_asset_id = None
-        if pending_asset.asset_data:
-            asset_data = pending_asset.asset_data.copy()
-            
-            if 'id' not in asset_data or not asset_data['id']:
-                asset_data['id'] = pending_asset.asset_id
-            
-            asset_data['discovered_at'] = datetime.utcnow().isoformat() + 'Z'
-            asset_data['status'] = 'active'
-            
-            if 'connector_id' not in asset_data:
-                asset_data['connector_id'] = pending_asset.connector_id
-            
-            if 'name' not in asset_data:
-                asset_data['name'] = pending_asset.name
-            
-            if 'type' not in asset_data:
-                asset_data['type'] = pending_asset.type
-            
-            if 'catalog' not in asset_data:
-                asset_data['catalog'] = pending_asset.catalog
-            
-            saved_asset_id = asset_data.get('id')
-            
+        return jsonify({
+            'success': True, 
+            'message': 'Asset accepted and added to inventory',
+            'assets_count': assets_count,
+            'asset_id': saved_asset_id
+        }), 200
+    except Exception as e:
+        if db_session is not None:
             try:
-                existing_asset = db_session.query(Asset).filter(Asset.id == saved_asset_id).first()
-                
-                if existing_asset:
-                    current_time = datetime.utcnow()
-                    existing_asset.discovered_at = current_time
-                    existing_asset.sort_order = int(current_time.timestamp() * 1000)
-                    
-                    for key, value in asset_data.items():
-                        if key == 'discovered_at':
-                            continue
-                        if key == 'schema':
-                            setattr(existing_asset, 'schema_name', value)
-                        elif key == 'metadata' or key == 'extra_data':
-                            if isinstance(value, dict):
-                                existing_asset.extra_data = value
-                        elif key not in ['id']:
-                            if hasattr(existing_asset, key):
-                                setattr(existing_asset, key, value)
-                    existing_asset.updated_at = current_time
-                    existing_asset.status = 'active'
-                else:
-                    from database import Asset as AssetModel
-                    
-                    current_time = datetime.utcnow()
-                    new_asset_data = {
-                        'id': saved_asset_id,
-                        'name': asset_data.get('name'),
-                        'type': asset_data.get('type'),
-                        'catalog': asset_data.get('catalog'),
-                        'schema_name': asset_data.get('schema', ''),
-                        'connector_id': asset_data.get('connector_id'),
-                        'status': asset_data.get('status', 'active'),
-                        'sort_order': int(current_time.timestamp() * 1000),
-                        'extra_data': asset_data
-                    }
-                    
-                    if 'discovered_at' in asset_data:
-                        discovered_at_str = asset_data['discovered_at']
-                        try:
-                            if discovered_at_str.endswith('Z'):
-                                discovered_at_str = discovered_at_str[:-1] + '+00:00'
-                            new_asset_data['discovered_at'] = datetime.fromisoformat(discovered_at_str)
-                        except Exception as e:
-                            print(f"  Error parsing discovered_at '{discovered_at_str}': {e}, using current time")
-                            new_asset_data['discovered_at'] = current_time
-                    else:
-                        new_asset_data['discovered_at'] = current_time
-                    
-                    new_asset = AssetModel(**new_asset_data)
-                    db_session.add(new_asset)
-                    print(f" Created new asset {saved_asset_id}")
-                
-                db_session.commit()
-                print(f" Successfully saved asset {saved_asset_id} to database")
-                
-            except Exception as save_error:
                 db_session.rollback()
-                print(f" Error saving asset {saved_asset_id}: {save_error}")
-                import traceback
-                traceback.print_exc()
                 db_session.close()
-                return jsonify({
-                    'success': False,
-                    'error': f'Failed to save asset to database: {str(save_error)}'
-                }), 500
+            except:
+                pass
+        print(f"Error accepting pending asset: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
+@s3_bp.route('/accept-bulk', methods=['POST'])
+def accept_pending_assets_bulk():
+    from database import PendingAsset
+    
+    db_session = None
+    
+    try:
+        data = request.get_json(silent=True) or {}
+        pending_ids = data.get('pending_ids') if isinstance(data, dict) else None
         
-        pending_asset.status = 'accepted'
-        pending_asset.processed_at = datetime.utcnow()
-        db_session.commit()
-        db_session.close()
+        if not pending_ids:
+            return jsonify({'error': 'pending_ids is required'}), 400
+        if not isinstance(pending_ids, list) or not all(isinstance(pending_id, str) and pending_id for pending_id in pending_ids):
+            return jsonify({'error': 'pending_ids must be a list of ids'}), 400
         
-        discovered_assets = db_helpers.load_assets()
-        assets_count = len(discovered_assets)
-        print(f" Reloaded {assets_count} assets from database after adding new asset")
+        db_session = db_helpers.Session()
         
-        if saved_asset_id:
-            saved_asset = next((a for a in discovered_assets if a.get('id') == saved_asset_id), None)
-            if saved_asset:
-                print(f"Verified saved asset in discovered_assets: {saved_asset.get('name')} (connector: {saved_asset.get('connector_id')})")
-                print(f"   Discovered at: {saved_asset.get('discovered_at')}")
-                print(f"   Sort order: {saved_asset.get('sort_order')}")
-            else:
-                print(f"WARNING: Saved asset {saved_asset_id} not found in discovered_assets list!")
+        pending_assets = db_session.query(PendingAsset).filter(
+            PendingAsset.id.in_(pending_ids),
+            PendingAsset.status == 'pending'
+        ).order_by(PendingAsset.created_at).all()
         
+        saved_asset_ids = []
+        deleted_asset_ids = []
         try:
-            current_app.config['discovered_assets'] = discovered_assets
-            print(f" Updated app.config['discovered_assets'] with {assets_count} assets")
-            
-        except Exception as e:
-            print(f"  Could not update app.config: {e}")
+            for pending_asset in pending_assets:
+                if pending_asset.change_type == 'deleted':
+                    deleted_asset_ids.append(pending_asset.asset_id)
+                saved_asset_id = _apply_pending_asset(db_session, pending_asset)
+                if saved_asset_id:
+                    saved_asset_ids.append(saved_asset_id)
+            db_session.commit()
+        except Exception as save_error:
+            db_session.rollback()
+            print(f" Error accepting pending assets: {save_error}")
+            import traceback
+            traceback.print_exc()
+            db_session.close()
+            db_session = None
+            return jsonify({
+                'success': False,
+                'error': f'Failed to save assets to database: {str(save_error)}'
+            }), 500
+        
+        assets_count = _count_assets(db_session)
+        db_session.close()
+        db_session = None
+        
+        _sync_cached_assets(saved_asset_ids, deleted_asset_ids)
+        print(f" Accepted {len(pending_assets)} pending assets ({len(saved_asset_ids)} saved, {len(deleted_asset_ids)} removed)")
         
+        found_ids = {pending_asset.id for pending_asset in pending_assets}
         return jsonify({
-            'success': True, 
-            'message': 'Asset accepted and added to inventory',
-            'assets_count': assets_count,
-            'asset_id': saved_asset_id
+            'success': True,
+            'accepted': len(pending_assets),
+            'asset_ids': saved_asset_ids,
+            'removed_asset_ids': deleted_asset_ids,
+            'not_found': [pending_id for pending_id in pending_ids if pending_id not in found_ids],
+            'assets_count': assets_count
         }), 200
     except Exception as e:
-        if 'db_session' in locals():
+        if db_session is not None:
             try:
                 db_session.rollback()
                 db_session.close()
             except:
                 pass
-        print(f"Error accepting pending asset: {e}")
+        print(f"Error accepting pending assets: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
@@ -2,7 +2,9 @@ from flask import Blueprint, request, jsonify, abort
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
 import base64
+import hashlib
 import json
 import os
 import re
@@ -13,6 +15,21 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 starburst_bp = Blueprint('starburst_bp', __name__)
 
+starburst_session = requests.Session()
+_starburst_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+starburst_session.mount('https://', _starburst_adapter)
+starburst_session.mount('http://', _starburst_adapter)
+_starburst_fetch_executor = ThreadPoolExecutor(max_workers=8)
+
+def starburst_get_with_fallback(primary_url: str, fallback_url: str, **kwargs):
+    primary = _starburst_fetch_executor.submit(starburst_session.get, primary_url, **kwargs)
+    fallback = _starburst_fetch_executor.submit(starburst_session.get, fallback_url, **kwargs)
+    response = primary.result()
+    if response.status_code == 200:
+        fallback.cancel()
+        return response
+    return fallback.result()
+
 def retry_api_call(func, max_retries=5, initial_delay=1, max_delay=30):
     for attempt in range(max_retries):
         try:
@@ -119,9 +136,27 @@ class StarburstColumnSearchResponse(BaseModel):
     columns: List[Dict[str, Any]]
     total: int
 
-def get_starburst_access_token(account_domain: str, client_id: str, client_secret: str) -> Optional[str]:
+STARBURST_TOKEN_REFRESH_MARGIN = 30
+STARBURST_TOKEN_DEFAULT_TTL = 300
+
+_starburst_token_cache: Dict[tuple, tuple] = {}
+
+def _starburst_token_key(base_url: str, client_id: str, client_secret: str) -> tuple:
+    return (base_url, client_id, hashlib.sha256(str(client_secret).encode()).hexdigest())
+
+def invalidate_starburst_access_token(account_domain: str, client_id: str, client_secret: str,
+                                      base_url: Optional[str] = None) -> None:
+    base_url = base_url or f"https://{account_domain}"
+    _starburst_token_cache.pop(_starburst_token_key(base_url, client_id, client_secret), None)
+
+def get_starburst_access_token(account_domain: str, client_id: str, client_secret: str,
+                               base_url: Optional[str] = None, verify: bool = True) -> Optional[str]:
+    base_url = base_url or f"https://{account_domain}"
+    cache_key = _starburst_token_key(base_url, client_id, client_secret)
+    cached = _starburst_token_cache.get(cache_key)
+    if cached and time.monotonic() < cached[1] - STARBURST_TOKEN_REFRESH_MARGIN:
+        return cached[0]
     try:
-        base_url = f"https://{account_domain}"
         token_url = f"{base_url}/oauth/v2/token"
         token_data = 'grant_type=client_credentials'
         auth_string = f"{client_id}:{client_secret}"
@@ -130,10 +165,17 @@ def get_starburst_access_token(account_domain: str, client_id: str, client_secre
             'Authorization': f'Basic {auth_b64}',
             'Content-Type': 'application/x-www-form-urlencoded'
         }
-        token_response = requests.post(token_url, headers=token_headers, data=token_data, timeout=30)
+        token_response = starburst_session.post(token_url, headers=token_headers, data=token_data, timeout=30, verify=verify)
         if token_response.status_code == 200:
             token_response_data = token_response.json()
-            return token_response_data.get('access_token')
+            access_token = token_response_data.get('access_token')
+            if access_token:
+                try:
+                    expires_in = float(token_response_data.get('expires_in') or STARBURST_TOKEN_DEFAULT_TTL)
+                except (TypeError, ValueError):
+                    expires_in = STARBURST_TOKEN_DEFAULT_TTL
+                _starburst_token_cache[cache_key] = (access_token, time.monotonic() + expires_in)
+            return access_token
         else:
             print(f" Failed to get access token: {token_response.status_code} - {token_response.text}")
             return None
@@ -368,30 +410,10 @@ def _get_starburst_client(connector_id: str):
         client_secret = config.get("client_secret")
 
 
+        token_cache_key = None
         if client_id and client_secret and not access_token:
-            import requests
-            try:
-                token_url = f"{base_url}/oauth/v2/token"
-                token_data = 'grant_type=client_credentials'
-                auth_string = f"{client_id}:{client_secret}"
-                auth_b64 = base64.b64encode(auth_string.encode()).decode()
-                token_headers = {
-                    'Authorization': f'Basic {auth_b64}',
-                    'Content-Type': 'application/x-www-form-urlencoded'
-                }
-                print(f" Getting Starburst access token from {token_url}")
-                token_response = requests.post(token_url, headers=token_headers, data=token_data, timeout=30)
-                print(f"Token response status: {token_response.status_code}")
-                if token_response.status_code == 200:
-                    token_response_data = token_response.json()
-                    access_token = token_response_data.get('access_token')
-                    print(f" Successfully got Starburst access token (first 20 chars): {access_token[:20] if access_token else 'None'}...")
-                else:
-                    print(f" Failed to get access token: {token_response.status_code} - {token_response.text}")
-            except Exception as token_error:
-                print(f" Error getting Starburst access token: {token_error}")
-                import traceback
-                traceback.print_exc()
+            access_token = get_starburst_access_token(config.get("account_domain"), client_id, client_secret, base_url=base_url)
+            token_cache_key = _starburst_token_key(base_url, client_id, client_secret)
 
         custom_headers = config.get("customHeaders", {})
         catalog = config.get("catalog")
@@ -402,6 +424,7 @@ def _get_starburst_client(connector_id: str):
             "username": username,
             "password": password,
             "access_token": access_token,
+            "token_cache_key": token_cache_key,
             "custom_headers": custom_headers,
             "catalog": catalog,
             "schema_name": schema_name,
@@ -450,6 +473,8 @@ def _starburst_request(
     except requests.exceptions.HTTPError as http_err:
         print(f"HTTP error occurred: {http_err}")
         print(f"Response content: {response.text}")
+        if response.status_code == 401 and client_config["token_cache_key"]:
+            _starburst_token_cache.pop(client_config["token_cache_key"], None)
         raise HTTPException(
             status_code=response.status_code,
             detail=f"Starburst API error: {http_err}. Details: {response.text}"
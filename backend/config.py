@@ -1,4 +1,11 @@
 import os
+try:
+    import orjson
+    def _orjson_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    JSON_ENGINE_OPTIONS = {'json_serializer': _orjson_dumps, 'json_deserializer': orjson.loads}
+except ImportError:
+    JSON_ENGINE_OPTIONS = {}
 class Config:
     MYSQL_USER = os.getenv("MYSQL_USER", "root")
     MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "Theepakk123")
@@ -12,7 +19,10 @@ class Config:
         'pool_recycle': 3600,
         'pool_pre_ping': True,
         'max_overflow': 20,
-        'pool_timeout': 30
+        'pool_timeout': 30,
+        **JSON_ENGINE_OPTIONS
     }
+    JSON_SORT_KEYS = False
+    JSONIFY_PRETTYPRINT_REGULAR = False
     SECRET_KEY = os.getenv("FLASK_SECRET_KEY", "super-secret-key")
     TORRO_LINEAGE_SIGNING_KEY = os.getenv('TORRO_LINEAGE_SIGNING_KEY', 'default-lineage-signing-key')
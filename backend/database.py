@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, String, Integer, DateTime, Boolean, Text, JSON, text, LargeBinary, ForeignKey
+from sqlalchemy import create_engine, Column, String, Integer, DateTime, Boolean, Text, JSON, text, LargeBinary, ForeignKey, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -27,8 +27,8 @@ class Asset(Base):
     type = Column(String(100), nullable=False)
     catalog = Column(String(255), nullable=True)
     schema_name = Column(String(255), nullable=True)
-    connector_id = Column(String(255), nullable=True)
-    discovered_at = Column(DateTime, default=datetime.utcnow)
+    connector_id = Column(String(255), nullable=True, index=True)
+    discovered_at = Column(DateTime, default=datetime.utcnow, index=True)
     status = Column(String(50), default="active")
     sort_order = Column(Integer, nullable=True)
     extra_data = Column(JSON, nullable=True)
@@ -88,7 +88,7 @@ class PendingAsset(Base):
     name = Column(String(255), nullable=False)
     type = Column(String(100), nullable=False)
     catalog = Column(String(255), nullable=True)
-    connector_id = Column(String(255), nullable=False)
+    connector_id = Column(String(255), nullable=False, index=True)
     change_type = Column(String(50), nullable=False)
     s3_event_type = Column(String(100), nullable=False)
     asset_id = Column(String(255), nullable=False)
@@ -173,6 +173,13 @@ def init_db():
         
         with current_app.app_context():
             db.create_all()
+            inspector = inspect(db.engine)
+            for model in (Asset, PendingAsset):
+                existing_indexes = {index['name'] for index in inspector.get_indexes(model.__tablename__)}
+                for index in model.__table__.indexes:
+                    if index.name not in existing_indexes:
+                        index.create(bind=db.engine)
+                        print(f" Created index {index.name}")
             print(" Database tables created successfully (including Hive Metastore tables)")
         return True
     except RuntimeError:
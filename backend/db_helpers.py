@@ -3,15 +3,19 @@ from database import (
     LineageSnapshot, CurationProposal, QueryLog, IntegrationData, User, PendingAsset,
 )
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import heapq
 import json
 from flask import request, abort, current_app
 from functools import wraps
 from flask_login import current_user
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, func, or_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import sessionmaker
 from config import Config
 
-engine = create_engine(Config.SQLALCHEMY_DATABASE_URI)
+engine = create_engine(Config.SQLALCHEMY_DATABASE_URI, **Config.SQLALCHEMY_ENGINE_OPTIONS)
+Session = sessionmaker(bind=engine)
 def save_connector(connector_data: Dict[str, Any]) -> bool:
     try:
         try:
@@ -57,8 +61,6 @@ def save_connector(connector_data: Dict[str, Any]) -> bool:
                 db.session.commit()
                 return True
         except RuntimeError:
-            from sqlalchemy.orm import sessionmaker
-            Session = sessionmaker(bind=engine)
             session = Session()
             try:
                 existing = session.query(Connector).filter(Connector.id == connector_data.get('id')).first()
@@ -147,8 +149,6 @@ def load_connectors() -> List[Dict[str, Any]]:
                 db.session.remove()
                 return result
         except (RuntimeError, ImportError):
-            from sqlalchemy.orm import sessionmaker
-            Session = sessionmaker(bind=engine)
             session = Session()
             try:
                 connectors = session.query(Connector).all()
@@ -189,23 +189,21 @@ def delete_connector(connector_id: str) -> bool:
             from flask import current_app
             from main import db
             with current_app.app_context():
-                connector = db.session.query(Connector).filter(Connector.id == connector_id).first()
-                if connector:
-                    db.session.delete(connector)
-                    db.session.commit()
-                    return True
-                return False
+                deleted = db.session.execute(
+                    delete(Connector).where(Connector.id == connector_id)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                db.session.commit()
+                return deleted > 0
         except RuntimeError:
-            from sqlalchemy.orm import sessionmaker
-            Session = sessionmaker(bind=engine)
             session = Session()
             try:
-                connector = session.query(Connector).filter(Connector.id == connector_id).first()
-                if connector:
-                    session.delete(connector)
-                    session.commit()
-                    return True
-                return False
+                deleted = session.execute(
+                    delete(Connector).where(Connector.id == connector_id)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                session.commit()
+                return deleted > 0
             except Exception as e:
                 session.rollback()
                 print(f"Error deleting connector (no app context): {e}")
@@ -321,8 +319,6 @@ def save_asset(asset_data: Dict[str, Any]) -> bool:
                             print(f" Failed to update existing asset: {update_error}")
                     raise commit_error
         except RuntimeError:
-            from sqlalchemy.orm import sessionmaker
-            Session = sessionmaker(bind=engine)
             session = Session()
             try:
                 existing = session.query(Asset).filter(Asset.id == asset_data.get('id')).first()
@@ -438,6 +434,110 @@ def save_asset(asset_data: Dict[str, Any]) -> bool:
         import traceback
         traceback.print_exc()
         return False
+ASSET_BULK_BATCH_SIZE = 500
+def _asset_row(asset_data: Dict[str, Any]) -> Dict[str, Any]:
+    discovered_at = asset_data.get('discovered_at')
+    if isinstance(discovered_at, str):
+        discovered_at = datetime.fromisoformat(discovered_at.replace('Z', '+00:00'))
+    now = datetime.utcnow()
+    return {
+        'id': asset_data['id'],
+        'name': asset_data['name'],
+        'type': asset_data['type'],
+        'catalog': asset_data.get('catalog'),
+        'schema_name': asset_data.get('schema', asset_data.get('schema_name')),
+        'connector_id': asset_data.get('connector_id'),
+        'discovered_at': discovered_at or now,
+        'status': asset_data.get('status', 'active'),
+        'sort_order': asset_data.get('sort_order'),
+        'extra_data': asset_data.get('extra_data', asset_data.copy()),
+        'created_at': now,
+        'updated_at': now,
+    }
+def _upsert_asset_rows(session, rows: List[Dict[str, Any]], preserve: Tuple[str, ...] = ()) -> None:
+    stmt = mysql_insert(Asset.__table__)
+    update_columns = {
+        name: stmt.inserted[name]
+        for name in ('name', 'type', 'catalog', 'schema_name', 'connector_id', 'discovered_at', 'status', 'sort_order', 'extra_data', 'updated_at')
+        if name not in preserve
+    }
+    for start in range(0, len(rows), ASSET_BULK_BATCH_SIZE):
+        session.execute(stmt.on_duplicate_key_update(**update_columns), rows[start:start + ASSET_BULK_BATCH_SIZE])
+        session.commit()
+def save_assets_bulk(assets_data: List[Dict[str, Any]], preserve: Tuple[str, ...] = ()) -> int:
+    rows = []
+    saved_assets = []
+    missing_fields = 0
+    for asset_data in assets_data:
+        if not (asset_data.get('id') and asset_data.get('name') and asset_data.get('type')):
+            missing_fields += 1
+            continue
+        try:
+            rows.append(_asset_row(asset_data))
+        except Exception as e:
+            print(f"  save_assets_bulk: Skipping asset {asset_data.get('id')}: {e}")
+            continue
+        saved_assets.append(asset_data)
+    if missing_fields:
+        print(f"  save_assets_bulk: Skipped {missing_fields} assets missing id/name/type")
+    if not rows:
+        return 0
+    try:
+        try:
+            from flask import current_app
+            from main import db
+            with current_app.app_context():
+                try:
+                    _upsert_asset_rows(db.session, rows, preserve)
+                except Exception:
+                    db.session.rollback()
+                    raise
+        except RuntimeError:
+            session = Session()
+            try:
+                _upsert_asset_rows(session, rows, preserve)
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+        try:
+            from hive_metastore_sync import sync_asset_to_hive_metastore
+            for asset_data in saved_assets:
+                sync_asset_to_hive_metastore(asset_data)
+        except Exception as sync_err:
+            print(f"  Warning: Hive Metastore sync failed (assets still saved): {sync_err}")
+        return len(rows)
+    except Exception as e:
+        print(f"Error bulk saving assets: {e}")
+        import traceback
+        traceback.print_exc()
+        return 0
+def _asset_to_dict(asset) -> Dict[str, Any]:
+    asset_dict = {
+        'id': asset.id,
+        'name': asset.name,
+        'type': asset.type,
+        'catalog': asset.catalog,
+        'schema': asset.schema_name,
+        'connector_id': asset.connector_id,
+        'discovered_at': asset.discovered_at.isoformat() if asset.discovered_at else None,
+        'status': asset.status,
+        'sort_order': asset.sort_order,
+    }
+    if asset.extra_data:
+        if isinstance(asset.extra_data, dict):
+            asset_dict.update(asset.extra_data)
+        elif isinstance(asset.extra_data, str):
+            try:
+                extra_data_dict = json.loads(asset.extra_data)
+                asset_dict.update(extra_data_dict)
+            except:
+                pass
+        
+        if 'columns' not in asset_dict and isinstance(asset.extra_data, dict) and 'columns' in asset.extra_data:
+            asset_dict['columns'] = asset.extra_data['columns']
+    return asset_dict
 def load_assets() -> List[Dict[str, Any]]:
     try:
         try:
@@ -447,68 +547,18 @@ def load_assets() -> List[Dict[str, Any]]:
                 assets = db.session.query(Asset).all()
                 result = []
                 for asset in assets:
-                    asset_dict = {
-                        'id': asset.id,
-                        'name': asset.name,
-                        'type': asset.type,
-                        'catalog': asset.catalog,
-                        'schema': asset.schema_name,
-                        'connector_id': asset.connector_id,
-                        'discovered_at': asset.discovered_at.isoformat() if asset.discovered_at else None,
-                        'status': asset.status,
-                        'sort_order': asset.sort_order,
-                    }
-                    if asset.extra_data:
-                        if isinstance(asset.extra_data, dict):
-                            asset_dict.update(asset.extra_data)
-                        elif isinstance(asset.extra_data, str):
-                            try:
-                                import json
-                                extra_data_dict = json.loads(asset.extra_data)
-                                asset_dict.update(extra_data_dict)
-                            except:
-                                pass
-                        
-                        if 'columns' not in asset_dict and isinstance(asset.extra_data, dict) and 'columns' in asset.extra_data:
-                            asset_dict['columns'] = asset.extra_data['columns']
-                    result.append(asset_dict)
+                    result.append(_asset_to_dict(asset))
                 # Expunge all objects from session and remove session
                 db.session.expunge_all()
                 db.session.remove()
                 return result
         except (RuntimeError, ImportError):
-            from sqlalchemy.orm import sessionmaker
-            Session = sessionmaker(bind=engine)
             session = Session()
             try:
                 assets = session.query(Asset).all()
                 result = []
                 for asset in assets:
-                    asset_dict = {
-                        'id': asset.id,
-                        'name': asset.name,
-                        'type': asset.type,
-                        'catalog': asset.catalog,
-                        'schema': asset.schema_name,
-                        'connector_id': asset.connector_id,
-                        'discovered_at': asset.discovered_at.isoformat() if asset.discovered_at else None,
-                        'status': asset.status,
-                        'sort_order': asset.sort_order,
-                    }
-                    if asset.extra_data:
-                        if isinstance(asset.extra_data, dict):
-                            asset_dict.update(asset.extra_data)
-                        elif isinstance(asset.extra_data, str):
-                            try:
-                                import json
-                                extra_data_dict = json.loads(asset.extra_data)
-                                asset_dict.update(extra_data_dict)
-                            except:
-                                pass
-                        
-                        if 'columns' not in asset_dict and isinstance(asset.extra_data, dict) and 'columns' in asset.extra_data:
-                            asset_dict['columns'] = asset.extra_data['columns']
-                    result.append(asset_dict)
+                    result.append(_asset_to_dict(asset))
                 return result
             finally:
                 session.close()
@@ -517,21 +567,187 @@ def load_assets() -> List[Dict[str, Any]]:
         import traceback
         traceback.print_exc()
         return []
+def _query_asset_page(session, connector_ids, connector_prefixes, include_test, search, catalog, asset_type, limit, offset):
+    visible = [Asset.connector_id.startswith(prefix, autoescape=True) for prefix in connector_prefixes]
+    if connector_ids:
+        visible.append(Asset.connector_id.in_(list(connector_ids)))
+    if include_test:
+        visible.append(func.lower(Asset.connector_id).contains('test', autoescape=True))
+    if not visible:
+        return [], 0
+    query = session.query(Asset).filter(or_(*visible))
+    if catalog:
+        query = query.filter(Asset.catalog == catalog)
+    if asset_type:
+        query = query.filter(Asset.type == asset_type)
+    if search:
+        search_lower = search.lower()
+        query = query.filter(or_(
+            func.lower(Asset.name).contains(search_lower, autoescape=True),
+            func.lower(Asset.type).contains(search_lower, autoescape=True),
+            func.lower(Asset.catalog).contains(search_lower, autoescape=True),
+        ))
+    total = query.order_by(None).count()
+    rows = query.order_by(
+        Asset.sort_order.is_(None), Asset.sort_order.desc(),
+        Asset.discovered_at.is_(None), Asset.discovered_at.desc(),
+    ).limit(limit).offset(offset).all()
+    return [_asset_to_dict(asset) for asset in rows], total
+def _parse_asset_timestamp(discovered) -> Optional[datetime]:
+    if isinstance(discovered, datetime):
+        return discovered
+    if isinstance(discovered, str):
+        try:
+            return datetime.fromisoformat(discovered.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    return None
+def _asset_page_key(asset, parse_discovered_at):
+    sort_order = asset.get('sort_order')
+    try:
+        sort_order = int(sort_order) if sort_order is not None else None
+    except (ValueError, TypeError):
+        sort_order = None
+    discovered = parse_discovered_at(asset.get('discovered_at'))
+    timestamp = None
+    if isinstance(discovered, datetime):
+        try:
+            timestamp = discovered.timestamp()
+        except (ValueError, OverflowError):
+            timestamp = None
+    return (sort_order is not None, sort_order or 0, timestamp is not None, timestamp or 0.0)
+def page_assets(assets, connector_ids, connector_prefixes=(), include_test: bool = False, search: Optional[str] = None,
+                catalog: Optional[str] = None, asset_type: Optional[str] = None,
+                limit: int = 50, offset: int = 0, parse_discovered_at=_parse_asset_timestamp) -> Tuple[List[Dict[str, Any]], int]:
+    connector_prefixes = tuple(connector_prefixes)
+    search_lower = search.lower() if search else None
+    filtered = []
+    for asset in assets:
+        connector_id = asset.get('connector_id')
+        if connector_id is None:
+            continue
+        if not (connector_id in connector_ids
+                or connector_id.startswith(connector_prefixes)
+                or (include_test and 'test' in connector_id.lower())):
+            continue
+        if catalog and asset.get('catalog') != catalog:
+            continue
+        if asset_type and asset.get('type') != asset_type:
+            continue
+        if search_lower and search_lower not in f"{asset.get('name') or ''}\x00{asset.get('type') or ''}\x00{asset.get('catalog') or ''}".lower():
+            continue
+        filtered.append(asset)
+    end = offset + limit
+    key = lambda asset: _asset_page_key(asset, parse_discovered_at)
+    if end * 10 < len(filtered):
+        ordered = heapq.nlargest(end, filtered, key=key)
+    else:
+        ordered = sorted(filtered, key=key, reverse=True)
+    return ordered[offset:end], len(filtered)
+def query_assets(connector_ids, connector_prefixes=(), include_test: bool = False, search: Optional[str] = None,
+                 catalog: Optional[str] = None, asset_type: Optional[str] = None,
+                 limit: int = 50, offset: int = 0) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+    try:
+        try:
+            from flask import current_app
+            from main import db
+            with current_app.app_context():
+                try:
+                    return _query_asset_page(db.session, connector_ids, connector_prefixes, include_test, search, catalog, asset_type, limit, offset)
+                finally:
+                    db.session.remove()
+        except (RuntimeError, ImportError):
+            session = Session()
+            try:
+                return _query_asset_page(session, connector_ids, connector_prefixes, include_test, search, catalog, asset_type, limit, offset)
+            finally:
+                session.close()
+    except Exception as e:
+        print(f"Error querying assets: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+def get_asset(asset_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        try:
+            from flask import current_app
+            from main import db
+            with current_app.app_context():
+                asset = db.session.query(Asset).filter(Asset.id == asset_id).first()
+                return _asset_to_dict(asset) if asset else None
+        except (RuntimeError, ImportError):
+            session = Session()
+            try:
+                asset = session.query(Asset).filter(Asset.id == asset_id).first()
+                return _asset_to_dict(asset) if asset else None
+            finally:
+                session.close()
+    except Exception as e:
+        print(f"Error loading asset {asset_id}: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+def load_assets_by_ids(asset_ids: List[str]) -> List[Dict[str, Any]]:
+    if not asset_ids:
+        return []
+    try:
+        try:
+            from flask import current_app
+            from main import db
+            with current_app.app_context():
+                rows = db.session.query(Asset).filter(Asset.id.in_(asset_ids)).all()
+                return [_asset_to_dict(asset) for asset in rows]
+        except (RuntimeError, ImportError):
+            session = Session()
+            try:
+                rows = session.query(Asset).filter(Asset.id.in_(asset_ids)).all()
+                return [_asset_to_dict(asset) for asset in rows]
+            finally:
+                session.close()
+    except Exception as e:
+        print(f"Error loading assets by id: {e}")
+        import traceback
+        traceback.print_exc()
+        return []
+def load_assets_by_connector(connector_id: str) -> List[Dict[str, Any]]:
+    try:
+        try:
+            from flask import current_app
+            from main import db
+            with current_app.app_context():
+                rows = db.session.query(Asset).filter(Asset.connector_id == connector_id).all()
+                return [_asset_to_dict(asset) for asset in rows]
+        except (RuntimeError, ImportError):
+            session = Session()
+            try:
+                rows = session.query(Asset).filter(Asset.connector_id == connector_id).all()
+                return [_asset_to_dict(asset) for asset in rows]
+            finally:
+                session.close()
+    except Exception as e:
+        print(f"Error loading assets for connector {connector_id}: {e}")
+        import traceback
+        traceback.print_exc()
+        return []
 def delete_assets_by_connector(connector_id: str) -> bool:
     try:
         try:
             from flask import current_app
             from main import db
             with current_app.app_context():
-                db.session.query(Asset).filter(Asset.connector_id == connector_id).delete()
+                db.session.execute(
+                    delete(Asset).where(Asset.connector_id == connector_id)
+                    .execution_options(synchronize_session=False)
+                )
                 db.session.commit()
                 return True
         except RuntimeError:
-            from sqlalchemy.orm import sessionmaker
-            Session = sessionmaker(bind=engine)
             session = Session()
             try:
-                session.query(Asset).filter(Asset.connector_id == connector_id).delete()
+                session.execute(
+                    delete(Asset).where(Asset.connector_id == connector_id)
+                    .execution_options(synchronize_session=False)
+                )
                 session.commit()
                 return True
             except Exception as e:
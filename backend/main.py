@@ -1,18 +1,38 @@
-from flask import Flask, request, jsonify, Blueprint, current_app, g, abort, redirect, url_for
+from flask import Flask, Response, request, jsonify, Blueprint, current_app, g, abort, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.exceptions import HTTPException, NotFound
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+import bz2
+import csv
+import gzip
+import importlib.util
+import io
 import json
+import lzma
+import pickle
+import pickletools
+import queue
+import re
+import shutil
+import struct
 import tempfile
+import xml.etree.ElementTree as ET
+import zipfile
 import os
 import threading
 import time
+import traceback
 import requests
-from functools import lru_cache
+from functools import lru_cache, partial
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from datetime import datetime
+from urllib.parse import quote
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from flask_socketio import SocketIO, emit
+from botocore.exceptions import ClientError
 from concurrent.futures import ThreadPoolExecutor, as_completed
 os.environ['GRPC_DNS_RESOLVER'] = 'native'
 from google.cloud import bigquery
@@ -29,8 +49,113 @@ from config import Config
 from flask_sqlalchemy import SQLAlchemy
 from database import init_db, Base, HiveDB, HiveTable, HiveStorageDescriptor, HiveColumn
 import db_helpers
+from thread_helpers import bounded_completions
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 from database import User
+try:
+    import pandas as pd
+    _HAS_PANDAS = True
+except ImportError:
+    _HAS_PANDAS = False
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+try:
+    import pyarrow.orc as orc
+    _HAS_PYARROW_ORC = True
+except ImportError:
+    _HAS_PYARROW_ORC = False
+try:
+    import fastavro
+    _HAS_FASTAVRO = True
+except ImportError:
+    _HAS_FASTAVRO = False
+try:
+    from deltalake import DeltaTable  # type: ignore
+    _HAS_DELTALAKE = True
+except ImportError:
+    _HAS_DELTALAKE = False
+try:
+    from pyiceberg.catalog import load_catalog  # type: ignore
+    from pyiceberg.table import Table  # type: ignore
+    _HAS_PYICEBERG = True
+except ImportError:
+    _HAS_PYICEBERG = False
+try:
+    import msgpack
+    _HAS_MSGPACK = True
+except ImportError:
+    _HAS_MSGPACK = False
+try:
+    import bson
+    _HAS_BSON = True
+except ImportError:
+    _HAS_BSON = False
+try:
+    import yaml
+    _HAS_YAML = True
+except ImportError:
+    _HAS_YAML = False
+try:
+    import tomli
+    _HAS_TOMLI = True
+except ImportError:
+    _HAS_TOMLI = False
+try:
+    from pyhudi import HudiTable  # type: ignore
+    _HAS_PYHUDI = True
+except ImportError:
+    _HAS_PYHUDI = False
+try:
+    import h5py
+    _HAS_H5PY = True
+except ImportError:
+    _HAS_H5PY = False
+try:
+    from netCDF4 import Dataset
+    _HAS_NETCDF4 = True
+except ImportError:
+    _HAS_NETCDF4 = False
+# tensorflow is only probed here; importing it costs seconds, so _schema_tfrecord imports it on first use
+_HAS_TENSORFLOW = importlib.util.find_spec('tensorflow') is not None
+try:
+    import pyreadstat
+    _HAS_PYREADSTAT = True
+except ImportError:
+    _HAS_PYREADSTAT = False
+try:
+    import ijson
+    _HAS_IJSON = True
+except ImportError:
+    _HAS_IJSON = False
+_HAS_CALAMINE = importlib.util.find_spec('python_calamine') is not None
+try:
+    import orjson
+    _HAS_ORJSON = True
+    json_loads = orjson.loads
+except ImportError:
+    _HAS_ORJSON = False
+    json_loads = json.loads
+try:
+    import simdjson
+    _HAS_SIMDJSON = True
+except ImportError:
+    _HAS_SIMDJSON = False
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+try:
+    import ciso8601
+    _HAS_CISO8601 = True
+except ImportError:
+    _HAS_CISO8601 = False
+
 origins = [
     "http://localhost",
     "http://localhost:3000",
@@ -40,8 +165,2045 @@ origins = [
     "http://localhost:8099",
 ]
 db = SQLAlchemy()
+
+_KV_RE = re.compile(r'(\w+)\s*[=:]\s*(\S+)')
+SNIFF_BYTES = 4 * 1024 * 1024
+
+def _decompress_prefix(decompressor, stream, limit=SNIFF_BYTES):
+    out = bytearray()
+    while len(out) < limit and not decompressor.eof:
+        if decompressor.needs_input:
+            data = stream.read(1 << 16)
+            if not data:
+                break
+        else:
+            data = b''
+        out += decompressor.decompress(data, limit - len(out))
+    return bytes(out)
+
+MAX_SCHEMA_BYTES = 256 * 1024 * 1024
+EXCEL_SAMPLE_ROWS = 2000
+GEOJSON_STREAM_BYTES = 64 * 1024 * 1024
+S3_DISCOVERY_CONCURRENCY = int(os.getenv('S3_DISCOVERY_CONCURRENCY', '16'))
+CONNECTOR_DEBUG = os.getenv('CONNECTOR_DEBUG', '').lower() in ('1', 'true', 'yes')
+CONNECTOR_SYNC_WORKERS = int(os.getenv('CONNECTOR_SYNC_WORKERS', '8'))
+# Each BigQuery client's HTTP session holds 10 pooled connections, and up to
+# CONNECTOR_SYNC_WORKERS connectors sync at once
+BIGQUERY_TABLE_WORKERS = int(os.getenv('BIGQUERY_TABLE_WORKERS', str(max(1, min(10, 64 // CONNECTOR_SYNC_WORKERS)))))
+SHM_DIR = os.getenv('DISCOVERY_TMPDIR') or ('/dev/shm' if os.path.isdir('/dev/shm') else None)
+_spill_local = threading.local()
+
+def _sniff_stream(s3, bucket, key, n=SNIFF_BYTES):
+    return s3.get_object(Bucket=bucket, Key=key, Range=f'bytes=0-{n-1}')['Body']
+
+def _sniff(s3, bucket, key, n=SNIFF_BYTES):
+    return _sniff_stream(s3, bucket, key, n).read()
+
+def _download(s3, bucket, key):
+    return s3.get_object(Bucket=bucket, Key=key)['Body'].read()
+
+@contextmanager
+def _spill_to_file(s3, bucket, key):
+    tmp_file = getattr(_spill_local, 'file', None)
+    if tmp_file is None:
+        tmp_file = _spill_local.file = tempfile.NamedTemporaryFile(dir=SHM_DIR)
+    tmp_file.seek(0)
+    tmp_file.truncate()
+    try:
+        shutil.copyfileobj(s3.get_object(Bucket=bucket, Key=key)['Body'], tmp_file, length=1 << 20)
+        tmp_file.flush()
+        yield tmp_file.name
+    finally:
+        tmp_file.seek(0)
+        tmp_file.truncate()
+
+class S3RangeReader(io.RawIOBase):
+    def __init__(self, s3, bucket, key, size):
+        self.s3 = s3
+        self.bucket = bucket
+        self.key = key
+        self.size = size
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self.pos = max(0, offset)
+        return self.pos
+
+    def readinto(self, b):
+        if self.pos >= self.size:
+            return 0
+        end = min(self.pos + len(b), self.size) - 1
+        data = self.s3.get_object(Bucket=self.bucket, Key=self.key, Range=f'bytes={self.pos}-{end}')['Body'].read()
+        b[:len(data)] = data
+        self.pos += len(data)
+        return len(data)
+
+def _open_ranged(s3, bucket, key, size, buffer_size=256 * 1024):
+    return io.BufferedReader(S3RangeReader(s3, bucket, key, size), buffer_size=buffer_size)
+
+DATA_FILE_EXTENSIONS = {
+    'csv': 'csv',
+    'tsv': 'tsv',
+    'psv': 'csv',
+    'ssv': 'csv',
+    'json': 'json',
+    'jsonl': 'jsonl',
+    'ndjson': 'jsonl',
+    'jsonc': 'json',
+    'json5': 'json',
+    'xml': 'xml',
+    'html': 'xml',
+    'xhtml': 'xml',
+    'yaml': 'yaml',
+    'yml': 'yaml',
+    'toml': 'toml',
+    'ini': 'ini',
+    'cfg': 'ini',
+    'conf': 'ini',
+    'properties': 'properties',
+    'txt': 'text',
+    'log': 'text',
+    'md': 'text',
+    'markdown': 'text',
+
+    'parquet': 'parquet',
+    'orc': 'orc',
+    'feather': 'feather',
+    'arrow': 'arrow',
+    'ipc': 'arrow',
+
+    'avro': 'avro',
+    'avsc': 'avro',
+    'protobuf': 'protobuf',
+    'proto': 'protobuf',
+    'pb': 'protobuf',
+    'msgpack': 'msgpack',
+    'bson': 'bson',
+    'cbor': 'cbor',
+    'thrift': 'thrift',
+    'flatbuffers': 'flatbuffers',
+    'fbs': 'flatbuffers',
+
+    'delta': 'delta',
+    'iceberg': 'iceberg',
+    'hudi': 'hudi',
+
+    'xlsx': 'excel',
+    'xls': 'excel',
+    'xlsm': 'excel',
+    'xlsb': 'excel',
+    'ods': 'excel',
+    'fods': 'excel',
+    'numbers': 'excel',
+
+    'sql': 'sql',
+    'dump': 'sql',
+    'mysqldump': 'sql',
+    'pgdump': 'sql',
+    'dbf': 'dbf',
+    'mdb': 'mdb',
+    'accdb': 'mdb',
+
+    'hdf5': 'hdf5',
+    'h5': 'hdf5',
+    'hdf': 'hdf5',
+    'nc': 'netcdf',
+    'netcdf': 'netcdf',
+    'cdf': 'netcdf',
+    'fits': 'fits',
+    'fits.gz': 'fits',
+
+    'tfrecord': 'tfrecord',
+    'tfrecords': 'tfrecord',
+    'tf': 'tfrecord',
+    'pkl': 'pickle',
+    'pickle': 'pickle',
+    'joblib': 'joblib',
+    'pt': 'pytorch',
+    'pth': 'pytorch',
+    'onnx': 'onnx',
+    'h5': 'keras',
+    'keras': 'keras',
+    'pb': 'tensorflow',
+    'savedmodel': 'tensorflow',
+    'ckpt': 'tensorflow',
+    'weights': 'tensorflow',
+
+    'sas7bdat': 'sas',
+    'sas': 'sas',
+    'sav': 'spss',
+    'spss': 'spss',
+    'dta': 'stata',
+    'stata': 'stata',
+    'rdata': 'r',
+    'rds': 'r',
+
+    'graphml': 'graphml',
+    'gml': 'graphml',
+    'gexf': 'gexf',
+    'neo4j': 'neo4j',
+    'cypher': 'cypher',
+
+    'tsv': 'timeseries',
+    'ts': 'timeseries',
+    'influx': 'influx',
+
+    'shp': 'shapefile',
+    'geojson': 'geojson',
+    'kml': 'kml',
+    'kmz': 'kml',
+    'gpx': 'gpx',
+    'topojson': 'topojson',
+
+    'jpg': 'image',
+    'jpeg': 'image',
+    'png': 'image',
+    'gif': 'image',
+    'bmp': 'image',
+    'tiff': 'image',
+    'tif': 'image',
+    'webp': 'image',
+    'svg': 'image',
+    'ico': 'image',
+    'heic': 'image',
+    'heif': 'image',
+
+    'mp4': 'video',
+    'avi': 'video',
+    'mov': 'video',
+    'mkv': 'video',
+    'wmv': 'video',
+    'flv': 'video',
+    'webm': 'video',
+    'm4v': 'video',
+
+    'mp3': 'audio',
+    'wav': 'audio',
+    'flac': 'audio',
+    'aac': 'audio',
+    'ogg': 'audio',
+    'wma': 'audio',
+    'm4a': 'audio',
+
+    'pdf': 'pdf',
+    'doc': 'doc',
+    'docx': 'doc',
+    'rtf': 'rtf',
+    'odt': 'odt',
+    'epub': 'epub',
+    'mobi': 'mobi',
+
+    'gz': 'compressed',
+    'gzip': 'compressed',
+    'zip': 'compressed',
+    'bz2': 'compressed',
+    'xz': 'compressed',
+    'lz4': 'compressed',
+    'zstd': 'compressed',
+    'zst': 'compressed',
+    '7z': 'compressed',
+    'rar': 'compressed',
+    'tar': 'compressed',
+    'tar.gz': 'compressed',
+    'tgz': 'compressed',
+    'tar.bz2': 'compressed',
+    'tbz2': 'compressed',
+    'tar.xz': 'compressed',
+    'txz': 'compressed',
+    'snappy': 'compressed',
+    'lzo': 'compressed',
+    'lzma': 'compressed',
+
+    'deb': 'archive',
+    'rpm': 'archive',
+    'apk': 'archive',
+    'dmg': 'archive',
+    'iso': 'archive',
+    'bin': 'archive',
+    'exe': 'archive',
+    'msi': 'archive',
+
+    'rss': 'xml',
+    'atom': 'xml',
+    'sitemap': 'xml',
+    'sitemap.xml': 'xml',
+
+    'env': 'env',
+    'dockerfile': 'text',
+    'makefile': 'text',
+    'cmake': 'text',
+
+    'r': 'r',
+    'py': 'text',
+    'ipynb': 'jupyter',
+    'jupyter': 'jupyter',
+
+    'edf': 'edf',
+    'edf+': 'edf',
+    'bdf': 'edf',
+    'mat': 'matlab',
+    'matlab': 'matlab',
+    'vtk': 'vtk',
+    'vtp': 'vtk',
+    'ply': 'ply',
+    'obj': 'obj',
+    'stl': 'stl',
+    'fbx': 'fbx',
+    'dae': 'dae',
+    'x3d': 'x3d',
+    'gltf': 'gltf',
+    'glb': 'gltf',
+
+    'ofx': 'ofx',
+    'qif': 'qif',
+    'mt940': 'mt940',
+    'mt942': 'mt942',
+
+    'fasta': 'fasta',
+    'fa': 'fasta',
+    'fastq': 'fastq',
+    'fq': 'fastq',
+    'sam': 'sam',
+    'bam': 'bam',
+    'vcf': 'vcf',
+    'gff': 'gff',
+    'gtf': 'gtf',
+    'bed': 'bed',
+    'wig': 'wig',
+    'bigwig': 'bigwig',
+    'bigbed': 'bigbed',
+
+    'yaml': 'yaml',
+    'yml': 'yaml',
+    'toml': 'toml',
+    'plist': 'plist',
+    'xplist': 'plist',
+    'binary': 'binary',
+    'dat': 'binary',
+}
+
+FULL_READ_FILE_TYPES = {'csv', 'tsv', 'json', 'jsonl', 'xml', 'parquet', 'feather', 'arrow', 'msgpack', 'bson', 'sql', 'geojson'}
+SIZE_GATED_FILE_TYPES = FULL_READ_FILE_TYPES | {'delta', 'yaml', 'toml', 'pickle', 'netcdf', 'spss'}
+
+_TYPE_MAP = {
+    str: 'STRING',
+    int: 'INTEGER',
+    float: 'FLOAT',
+    bool: 'BOOLEAN',
+    bytes: 'BYTES',
+    list: 'LIST',
+    dict: 'DICT',
+    type(None): 'NULL',
+}
+
+_EMPTY = {}
+
+_DTYPE_KIND_TYPES = {'i': 'INTEGER', 'u': 'INTEGER', 'f': 'FLOAT', 'b': 'BOOLEAN', 'M': 'TIMESTAMP'}
+
+_PICKLE_OPCODE_TYPES = {
+    'INT': 'INTEGER', 'BININT': 'INTEGER', 'BININT1': 'INTEGER', 'BININT2': 'INTEGER',
+    'LONG': 'INTEGER', 'LONG1': 'INTEGER', 'LONG4': 'INTEGER',
+    'FLOAT': 'FLOAT', 'BINFLOAT': 'FLOAT',
+    'STRING': 'STRING', 'BINSTRING': 'STRING', 'SHORT_BINSTRING': 'STRING',
+    'UNICODE': 'STRING', 'BINUNICODE': 'STRING', 'SHORT_BINUNICODE': 'STRING', 'BINUNICODE8': 'STRING',
+    'BINBYTES': 'BYTES', 'SHORT_BINBYTES': 'BYTES', 'BINBYTES8': 'BYTES', 'BYTEARRAY8': 'BYTEARRAY',
+    'NONE': 'NULL', 'NEWTRUE': 'BOOLEAN', 'NEWFALSE': 'BOOLEAN',
+    'EMPTY_LIST': 'LIST', 'LIST': 'LIST',
+    'EMPTY_TUPLE': 'TUPLE', 'TUPLE': 'TUPLE', 'TUPLE1': 'TUPLE', 'TUPLE2': 'TUPLE', 'TUPLE3': 'TUPLE',
+    'EMPTY_SET': 'SET', 'FROZENSET': 'FROZENSET',
+    'EMPTY_DICT': 'DICT', 'DICT': 'DICT',
+}
+
+def _pickle_fields(raw):
+    stack, memo = [], {}
+    mark = object()
+    for op, arg, _ in pickletools.genops(raw):
+        name = op.name
+        if name in ('PROTO', 'FRAME'):
+            continue
+        if name == 'MARK':
+            stack.append(mark)
+        elif name == 'MEMOIZE':
+            memo[len(memo)] = stack[-1]
+        elif name in ('PUT', 'BINPUT', 'LONG_BINPUT'):
+            memo[arg] = stack[-1]
+        elif name in ('GET', 'BINGET', 'LONG_BINGET'):
+            stack.append(memo[arg])
+        elif name == 'DUP':
+            stack.append(stack[-1])
+        elif name == 'STOP':
+            root = stack.pop()
+            return root[0], root[2]
+        elif name == 'APPEND':
+            del stack[-1:]
+        elif name in ('APPENDS', 'ADDITEMS'):
+            del stack[len(stack) - 1 - stack[::-1].index(mark):]
+        elif name == 'BUILD':
+            state = stack.pop()
+            if state[2] is not None:
+                stack[-1][2] = dict(state[2])
+        elif name in ('SETITEM', 'SETITEMS', 'DICT'):
+            pos = len(stack) - 2 if name == 'SETITEM' else len(stack) - 1 - stack[::-1].index(mark)
+            items = stack[pos:] if name == 'SETITEM' else stack[pos + 1:]
+            del stack[pos:]
+            if name == 'DICT':
+                stack.append(['DICT', None, {}])
+            target = stack[-1]
+            if target[2] is not None:
+                for k, v in zip(items[::2], items[1::2]):
+                    if isinstance(k[1], (str, int)):
+                        target[2].setdefault(str(k[1]), v[0])
+        else:
+            before = op.stack_before
+            if pickletools.markobject in before:
+                pos = len(stack) - 1 - stack[::-1].index(mark)
+                del stack[pos:]
+                del stack[len(stack) - before.index(pickletools.markobject):]
+            elif before:
+                del stack[-len(before):]
+            kind = _PICKLE_OPCODE_TYPES.get(name, 'OBJECT')
+            for _ in op.stack_after:
+                stack.append([kind, arg, {} if name == 'EMPTY_DICT' else None])
+    return None, None
+
+_SAFE_PICKLE_GLOBALS = {
+    ('builtins', 'set'),
+    ('builtins', 'frozenset'),
+    ('builtins', 'bytearray'),
+    ('builtins', 'complex'),
+    ('_codecs', 'encode'),
+    ('collections', 'OrderedDict'),
+    ('datetime', 'date'),
+    ('datetime', 'datetime'),
+    ('datetime', 'time'),
+    ('datetime', 'timedelta'),
+    ('decimal', 'Decimal'),
+}
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        if (module, name) in _SAFE_PICKLE_GLOBALS:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f'global {module}.{name} is forbidden')
+
+class ProgressBatcher:
+    def __init__(self, send, interval=0.1, max_messages=50):
+        self.send = send
+        self.interval = interval
+        self.max_messages = max_messages
+        self.buf = deque()
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+
+    def push(self, message):
+        with self.lock:
+            self.buf.append(message)
+            if len(self.buf) >= self.max_messages or time.monotonic() - self.last_flush >= self.interval:
+                self._flush_locked()
+
+    def flush(self):
+        with self.lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self.buf:
+            messages = list(self.buf)
+            self.buf.clear()
+            self.send(messages)
+        self.last_flush = time.monotonic()
+
+PII_COLUMN_PATTERNS = (
+    ("EMAIL", ('email', 'e_mail', 'mail')),
+    ("NAME", ('first_name', 'firstname', 'last_name', 'lastname', 'full_name', 'fullname', 'name', 'customer_name')),
+    ("PHONE", ('phone', 'mobile', 'cell', 'telephone', 'contact_number')),
+    ("ADDRESS", ('address', 'street', 'city', 'zipcode', 'zip_code', 'postal')),
+    ("SENSITIVE_ID", ('ssn', 'social_security', 'national_id', 'passport', 'license')),
+    ("CREDIT_CARD", ('credit_card', 'card_number', 'ccn', 'payment_card')),
+    ("DATE_OF_BIRTH", ('birth_date', 'birthdate', 'dob', 'date_of_birth')),
+    ("ACCOUNT_NUMBER", ('account_number', 'account_no', 'bank_account')),
+)
+
+_PII_COMBINED_RE = re.compile(
+    '(?:' + '|'.join(
+        f"(?=.*?(?P<{pii_type}>{'|'.join(map(re.escape, patterns))}))"
+        for pii_type, patterns in PII_COLUMN_PATTERNS
+    ) + ')',
+    re.DOTALL
+)
+
+if _HAS_AHOCORASICK:
+    _PII_AUTOMATON = ahocorasick.Automaton()
+    for _priority, (_pii_type, _patterns) in reversed(list(enumerate(PII_COLUMN_PATTERNS))):
+        for _pattern in _patterns:
+            _PII_AUTOMATON.add_word(_pattern, (_priority, _pii_type))
+    _PII_AUTOMATON.make_automaton()
+
+    @lru_cache(maxsize=8192)
+    def _detect_pii_lower(column_name_lower: str) -> tuple[bool, Optional[str]]:
+        best = None
+        for _, hit in _PII_AUTOMATON.iter(column_name_lower):
+            if best is None or hit < best:
+                best = hit
+                if hit[0] == 0:
+                    break
+        if best is None:
+            return False, None
+        return True, best[1]
+else:
+    @lru_cache(maxsize=8192)
+    def _detect_pii_lower(column_name_lower: str) -> tuple[bool, Optional[str]]:
+        match = _PII_COMBINED_RE.match(column_name_lower)
+        if match is None:
+            return False, None
+        return True, match.lastgroup
+
+def detect_pii_in_column(column_name: str, column_type: str) -> tuple[bool, Optional[str]]:
+    return _detect_pii_lower(str(column_name).lower())
+
+def _schema_from_dict(data, description, columns, seen, _type_map=_TYPE_MAP, _detect=detect_pii_in_column):
+    append = columns.append
+    for col_name, col_value in data.items():
+        if col_name in seen:
+            continue
+        seen.add(col_name)
+        col_type = _type_map.get(type(col_value)) or type(col_value).__name__.upper()
+        pii_detected, pii_type = _detect(col_name, col_type)
+        append({
+            "name": col_name,
+            "type": col_type,
+            "mode": "NULLABLE",
+            "description": description,
+            "pii_detected": pii_detected,
+            "pii_type": pii_type
+        })
+
+def _schema_delimited(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    columns = []
+    seen_columns = set()
+    
+    progress(f'📖 Reading entire {file_extension.upper()} file: {object_name}...')
+    csv_content = _download(bucket_s3_client, bucket_name_actual, key).decode('utf-8', errors='ignore')
+    csv_lines = csv_content.split('\n')
+    
+    if csv_lines:
+        delimiter = ',' if file_extension == 'csv' else '\t'
+        
+        reader = csv.reader(io.StringIO(csv_lines[0]), delimiter=delimiter)
+        header_row = next(reader, [])
+        
+        all_data_rows = []
+        for line in csv_lines[1:]:
+            if line.strip():
+                try:
+                    reader_row = csv.reader(io.StringIO(line), delimiter=delimiter)
+                    row_data = next(reader_row, [])
+                    if row_data:
+                        all_data_rows.append(row_data)
+                except:
+                    continue
+        
+        progress(f' Analyzing {len(all_data_rows)} rows in {object_name}...')
+        
+        for i, col_name in enumerate(header_row):
+            col_name = col_name.strip()
+            if col_name:
+                col_type = 'STRING'
+                integer_count = 0
+                float_count = 0
+                boolean_count = 0
+                non_empty_count = 0
+                
+                for row in all_data_rows:
+                    if i < len(row):
+                        val = row[i].strip()
+                        if val:
+                            non_empty_count += 1
+                            if val.replace('-', '').replace('+', '').isdigit():
+                                integer_count += 1
+                            elif val.replace('.', '').replace('-', '').replace('+', '').isdigit() and '.' in val:
+                                float_count += 1
+                            elif val.lower() in ['true', 'false', 'yes', 'no', '1', '0', 'y', 'n']:
+                                boolean_count += 1
+                
+                if non_empty_count > 0:
+                    if boolean_count / non_empty_count > 0.8:
+                        col_type = 'BOOLEAN'
+                    elif float_count / non_empty_count > 0.5:
+                        col_type = 'FLOAT'
+                    elif integer_count / non_empty_count > 0.8:
+                        col_type = 'INTEGER'
+                
+                if col_name not in seen_columns:
+                    seen_columns.add(col_name)
+                    pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
+                
+                    columns.append({
+                        "name": col_name,
+                        "type": col_type,
+                        "mode": "NULLABLE",
+                        "description": "",
+                        "pii_detected": pii_detected,
+                        "pii_type": pii_type
+                    })
+        
+        progress(f' Analyzed {len(all_data_rows)} rows, found {len(columns)} columns in {object_name}')
+    return columns
+
+def _schema_parquet(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_PYARROW:
+        progress(f'  pyarrow not installed, skipping Parquet column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        parquet_buffer = io.BytesIO(_download(bucket_s3_client, bucket_name_actual, key))
+        parquet_file = pq.ParquetFile(parquet_buffer)
+        schema = parquet_file.schema_arrow
+        
+        for field in schema:
+            if field.name not in seen_columns:
+                seen_columns.add(field.name)
+                pii_detected, pii_type = detect_pii_in_column(field.name, str(field.type))
+                columns.append({
+                    "name": field.name,
+                    "type": str(field.type),
+                    "mode": "NULLABLE" if field.nullable else "REQUIRED",
+                    "description": "",
+                    "pii_detected": pii_detected,
+                    "pii_type": pii_type
+                })
+    except Exception as e:
+        progress(f'  Could not read Parquet schema: {str(e)}')
+    return columns
+
+def _schema_json(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    columns = []
+    seen_columns = set()
+    
+    json_content = _download(bucket_s3_client, bucket_name_actual, key).decode('utf-8', errors='ignore')
+    
+    try:
+        json_data = json.loads(json_content)
+        
+        all_fields = {}
+        
+        if isinstance(json_data, list):
+            for record in json_data:
+                if isinstance(record, dict):
+                    for col_name, col_value in record.items():
+                        if col_name not in all_fields:
+                            all_fields[col_name] = []
+                        all_fields[col_name].append(col_value)
+        elif isinstance(json_data, dict):
+            for col_name, col_value in json_data.items():
+                all_fields[col_name] = [col_value]
+        
+        for col_name, values in all_fields.items():
+            col_type = 'STRING'
+            integer_count = 0
+            float_count = 0
+            boolean_count = 0
+            non_empty_count = 0
+            
+            for val in values:
+                if val is not None:
+                    non_empty_count += 1
+                    val_type = type(val).__name__.upper()
+                    if val_type == 'INT' or val_type == 'INTEGER':
+                        integer_count += 1
+                    elif val_type == 'FLOAT':
+                        float_count += 1
+                    elif val_type == 'BOOL' or val_type == 'BOOLEAN':
+                        boolean_count += 1
+            
+            if non_empty_count > 0:
+                if boolean_count / non_empty_count > 0.8:
+                    col_type = 'BOOLEAN'
+                elif float_count / non_empty_count > 0.5:
+                    col_type = 'FLOAT'
+                elif integer_count / non_empty_count > 0.8:
+                    col_type = 'INTEGER'
+            
+            if col_name not in seen_columns:
+                seen_columns.add(col_name)
+                pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
+                columns.append({
+                    "name": col_name,
+                    "type": col_type,
+                    "mode": "NULLABLE",
+                    "description": "",
+                    "pii_detected": pii_detected,
+                    "pii_type": pii_type
+                })
+        
+        progress(f' Analyzed {len(json_data) if isinstance(json_data, list) else 1} JSON records in {object_name}')
+    except json.JSONDecodeError:
+        progress(f'  Could not parse JSON structure')
+    return columns
+
+def _schema_jsonl(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading entire JSONL file: {object_name}...')
+        jsonl_content = _download(bucket_s3_client, bucket_name_actual, key).decode('utf-8', errors='ignore')
+        jsonl_lines = jsonl_content.split('\n')
+        
+        all_fields = {}
+        record_count = 0
+        
+        for line in jsonl_lines:
+            if line.strip():
+                try:
+                    obj = json.loads(line)
+                    if isinstance(obj, dict):
+                        record_count += 1
+                        for col_name, col_value in obj.items():
+                            if col_name not in all_fields:
+                                all_fields[col_name] = []
+                            all_fields[col_name].append(col_value)
+                except json.JSONDecodeError:
+                    continue
+        
+        progress(f' Analyzing {record_count} JSONL records in {object_name}...')
+        
+        for col_name, values in all_fields.items():
+            col_type = 'STRING'
+            integer_count = 0
+            float_count = 0
+            boolean_count = 0
+            non_empty_count = 0
+            
+            for val in values:
+                if val is not None:
+                    non_empty_count += 1
+                    val_type = type(val).__name__.upper()
+                    if val_type == 'INT' or val_type == 'INTEGER':
+                        integer_count += 1
+                    elif val_type == 'FLOAT':
+                        float_count += 1
+                    elif val_type == 'BOOL' or val_type == 'BOOLEAN':
+                        boolean_count += 1
+            
+            if non_empty_count > 0:
+                if boolean_count / non_empty_count > 0.8:
+                    col_type = 'BOOLEAN'
+                elif float_count / non_empty_count > 0.5:
+                    col_type = 'FLOAT'
+                elif integer_count / non_empty_count > 0.8:
+                    col_type = 'INTEGER'
+            
+            if col_name not in seen_columns:
+                seen_columns.add(col_name)
+                pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
+                columns.append({
+                    "name": col_name,
+                    "type": col_type,
+                    "mode": "NULLABLE",
+                    "description": "",
+                    "pii_detected": pii_detected,
+                    "pii_type": pii_type
+                })
+        
+        progress(f' Analyzed {record_count} JSONL records, found {len(columns)} fields in {object_name}')
+    except Exception as e:
+        progress(f'  Could not parse JSONL file: {str(e)}')
+    return columns
+
+def _schema_xml(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading XML file: {object_name}...')
+        xml_content = _download(bucket_s3_client, bucket_name_actual, key).decode('utf-8', errors='ignore')
+        
+        root = ET.fromstring(xml_content)
+        
+        all_elements = {}
+        
+        def extract_elements(element, path=''):
+            current_path = f"{path}/{element.tag}" if path else element.tag
+            if element.text and element.text.strip():
+                if current_path not in all_elements:
+                    all_elements[current_path] = []
+                all_elements[current_path].append(element.text.strip())
+            for child in element:
+                extract_elements(child, current_path)
+        
+        extract_elements(root)
+        
+        progress(f' Analyzing XML structure in {object_name}...')
+        
+        for col_name, values in all_elements.items():
+            col_type = 'STRING'
+            if values:
+                integer_count = sum(1 for v in values if v.replace('-', '').isdigit())
+                float_count = sum(1 for v in values if v.replace('.', '').replace('-', '').isdigit() and '.' in v)
+                if len(values) > 0:
+                    if float_count / len(values) > 0.5:
+                        col_type = 'FLOAT'
+                    elif integer_count / len(values) > 0.8:
+                        col_type = 'INTEGER'
+            
+            if col_name not in seen_columns:
+                seen_columns.add(col_name)
+                pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
+                columns.append({
+                    "name": col_name,
+                    "type": col_type,
+                    "mode": "NULLABLE",
+                    "description": "",
+                    "pii_detected": pii_detected,
+                    "pii_type": pii_type
+                })
+        
+        progress(f' Found {len(columns)} XML elements in {object_name}')
+    except Exception as e:
+        progress(f'  Could not parse XML file: {str(e)}')
+    return columns
+
+def _schema_feather(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_PYARROW:
+        progress(f'  pyarrow not installed, skipping Feather column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading Feather file: {object_name}...')
+        feather_buffer = io.BytesIO(_download(bucket_s3_client, bucket_name_actual, key))
+        
+        table = feather.read_table(feather_buffer)
+        schema = table.schema
+        
+        for field in schema:
+            if field.name not in seen_columns:
+                seen_columns.add(field.name)
+                pii_detected, pii_type = detect_pii_in_column(field.name, str(field.type))
+                columns.append({
+                    "name": field.name,
+                    "type": str(field.type),
+                    "mode": "NULLABLE" if field.nullable else "REQUIRED",
+                    "description": "",
+                    "pii_detected": pii_detected,
+                    "pii_type": pii_type
+                })
+        
+        progress(f' Found {len(columns)} columns in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read Feather file: {str(e)}')
+    return columns
+
+def _schema_arrow(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_PYARROW:
+        progress(f'  pyarrow not installed, skipping Arrow column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading Arrow file: {object_name}...')
+        arrow_buffer = io.BytesIO(_download(bucket_s3_client, bucket_name_actual, key))
+        
+        reader = pa.ipc.open_stream(arrow_buffer)
+        table = reader.read_all()
+        schema = table.schema
+        
+        for field in schema:
+            if field.name not in seen_columns:
+                seen_columns.add(field.name)
+                pii_detected, pii_type = detect_pii_in_column(field.name, str(field.type))
+                columns.append({
+                    "name": field.name,
+                    "type": str(field.type),
+                    "mode": "NULLABLE" if field.nullable else "REQUIRED",
+                    "description": "",
+                    "pii_detected": pii_detected,
+                    "pii_type": pii_type
+                })
+        
+        progress(f' Found {len(columns)} columns in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read Arrow file: {str(e)}')
+    return columns
+
+def _schema_delta(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_DELTALAKE:
+        progress(f'  deltalake not installed, skipping Delta Lake column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading Delta Lake table: {object_name}...')
+        
+        with _spill_to_file(bucket_s3_client, bucket_name_actual, key) as tmp_path:
+            dt = DeltaTable(tmp_path)
+            schema = dt.schema()
+            
+            for field in schema.fields:
+                if field.name not in seen_columns:
+                    seen_columns.add(field.name)
+                    pii_detected, pii_type = detect_pii_in_column(field.name, str(field.type))
+                    columns.append({
+                        "name": field.name,
+                        "type": str(field.type),
+                        "mode": "NULLABLE" if field.nullable else "REQUIRED",
+                        "description": "",
+                        "pii_detected": pii_detected,
+                        "pii_type": pii_type
+                    })
+            
+            progress(f' Found {len(columns)} columns in Delta table {object_name}')
+    except Exception as e:
+        progress(f'  Could not read Delta Lake table: {str(e)}')
+    return columns
+
+def _schema_iceberg(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_PYICEBERG:
+        progress(f'  pyiceberg not installed, skipping Iceberg column detection')
+        return []
+    
+    try:
+        progress(f'📖 Reading Iceberg table: {object_name}...')
+        progress(f'  Iceberg requires catalog configuration - skipping for now')
+    except Exception as e:
+        progress(f'  Could not read Iceberg table: {str(e)}')
+    return []
+
+def _schema_protobuf(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    try:
+        progress(f'📖 Reading Protobuf file: {object_name}...')
+        progress(f'  Protobuf requires schema file - skipping column detection')
+    except Exception as e:
+        progress(f'  Could not read Protobuf file: {str(e)}')
+    return []
+
+def _schema_msgpack(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_MSGPACK:
+        progress(f'  msgpack not installed, skipping MessagePack column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading MessagePack file: {object_name}...')
+        msgpack_data = msgpack.unpackb(_download(bucket_s3_client, bucket_name_actual, key), raw=False)
+        
+        if isinstance(msgpack_data, dict):
+            _schema_from_dict(msgpack_data, "", columns, seen_columns)
+        
+        progress(f' Found {len(columns)} fields in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read MessagePack file: {str(e)}')
+    return columns
+
+def _schema_bson(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_BSON:
+        progress(f'  bson not installed, skipping BSON column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading BSON file: {object_name}...')
+        bson_data = bson.loads(_download(bucket_s3_client, bucket_name_actual, key))
+        
+        if isinstance(bson_data, dict):
+            _schema_from_dict(bson_data, "", columns, seen_columns)
+        
+        progress(f' Found {len(columns)} fields in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read BSON file: {str(e)}')
+    return columns
+
+def _schema_sql(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading SQL dump: {object_name}...')
+        sql_content = _download(bucket_s3_client, bucket_name_actual, key).decode('utf-8', errors='ignore')
+        
+        create_table_pattern = r'CREATE\s+TABLE\s+(?:\w+\.)?(\w+)\s*\((.*?)\);'
+        matches = re.findall(create_table_pattern, sql_content, re.IGNORECASE | re.DOTALL)
+        
+        for table_name, table_def in matches:
+            col_pattern = r'(\w+)\s+(\w+(?:\([^)]+\))?)'
+            col_matches = re.findall(col_pattern, table_def)
+            
+            for col_name, col_type in col_matches:
+                if col_name not in seen_columns:
+                    seen_columns.add(col_name)
+                    pii_detected, pii_type = detect_pii_in_column(col_name, col_type.upper())
+                    columns.append({
+                        "name": col_name,
+                        "type": col_type.upper(),
+                        "mode": "NULLABLE",
+                        "description": f"From table {table_name}",
+                        "pii_detected": pii_detected,
+                        "pii_type": pii_type
+                    })
+        
+        progress(f' Found {len(columns)} columns in SQL dump {object_name}')
+    except Exception as e:
+        progress(f'  Could not parse SQL dump: {str(e)}')
+    return columns
+
+def _schema_text(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading text file: {object_name}...')
+        text_content = _sniff(bucket_s3_client, bucket_name_actual, key).decode('utf-8', errors='ignore')
+        text_lines = text_content.split('\n')[:1000]
+        
+        blob = '\n'.join(text_lines)
+        all_keys = {m.group(1) for m in _KV_RE.finditer(blob)}
+        
+        if all_keys:
+            for field_name in all_keys:
+                if field_name not in seen_columns:
+                    seen_columns.add(field_name)
+                    pii_detected, pii_type = detect_pii_in_column(field_name, 'STRING')
+                    columns.append({
+                        "name": field_name,
+                        "type": "STRING",
+                        "mode": "NULLABLE",
+                        "description": "Extracted from text patterns",
+                        "pii_detected": pii_detected,
+                        "pii_type": pii_type
+                    })
+        
+        progress(f' Found {len(columns)} patterns in {object_name}')
+    except Exception as e:
+        progress(f'  Could not analyze text file: {str(e)}')
+    return columns
+
+def _schema_compressed(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    try:
+        progress(f' Detecting compressed file format: {object_name}...')
+        
+        base_key = key.rsplit('.', 1)[0] if '.' in key else key
+        inner_extension = base_key.split('.')[-1].lower() if '.' in base_key else ''
+        
+        if file_extension == 'zip':
+            compressed_body = _open_ranged(bucket_s3_client, bucket_name_actual, key, size)
+        else:
+            compressed_body = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)['Body']
+        
+        try:
+            if file_extension in ['gz', 'gzip']:
+                with gzip.GzipFile(fileobj=compressed_body) as gz_file:
+                    decompressed = gz_file.read(SNIFF_BYTES)
+            elif file_extension == 'bz2':
+                decompressed = _decompress_prefix(bz2.BZ2Decompressor(), compressed_body)
+            elif file_extension == 'xz':
+                decompressed = _decompress_prefix(lzma.LZMADecompressor(), compressed_body)
+            elif file_extension == 'zip':
+                with zipfile.ZipFile(compressed_body) as zip_file:
+                    zip_infos = zip_file.infolist()
+                    if zip_infos:
+                        with zip_file.open(zip_infos[0]) as zip_member:
+                            decompressed = zip_member.read(SNIFF_BYTES)
+                    else:
+                        decompressed = None
+            else:
+                decompressed = None
+        finally:
+            compressed_body.close()
+        
+        if decompressed and inner_extension in DATA_FILE_EXTENSIONS:
+            progress(f'📖 Processing inner {inner_extension.upper()} file from compressed archive...')
+            progress(f'  Nested compression processing not yet fully implemented')
+        else:
+            progress(f'  Could not determine inner format or unsupported compression')
+    except Exception as e:
+        progress(f'  Could not decompress file: {str(e)}')
+    return []
+
+def _schema_yaml(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_YAML:
+        progress(f'  pyyaml not installed, skipping YAML column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading YAML file: {object_name}...')
+        if size is not None and size <= SNIFF_BYTES:
+            yaml_body = _sniff_stream(bucket_s3_client, bucket_name_actual, key)
+        else:
+            yaml_body = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)['Body']
+        try:
+            yaml_data = yaml.load(yaml_body, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+        finally:
+            yaml_body.close()
+        
+        if isinstance(yaml_data, dict):
+            _schema_from_dict(yaml_data, "", columns, seen_columns)
+        
+        progress(f' Found {len(columns)} fields in {object_name}')
+    except Exception as e:
+        progress(f'  Could not parse YAML: {str(e)}')
+    return columns
+
+def _schema_toml(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_TOMLI:
+        progress(f'  tomli not installed, skipping TOML column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading TOML file: {object_name}...')
+        if size is not None and size <= SNIFF_BYTES:
+            toml_bytes = _sniff(bucket_s3_client, bucket_name_actual, key)
+        else:
+            toml_bytes = _download(bucket_s3_client, bucket_name_actual, key)
+        toml_content = toml_bytes.decode('utf-8')
+        toml_data = tomli.loads(toml_content)
+        
+        if isinstance(toml_data, dict):
+            _schema_from_dict(toml_data, "", columns, seen_columns)
+        
+        progress(f' Found {len(columns)} fields in {object_name}')
+    except Exception as e:
+        progress(f'  Could not parse TOML: {str(e)}')
+    return columns
+
+def _schema_hudi(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_PYHUDI:
+        progress(f'  pyhudi not installed, skipping Hudi column detection')
+        return []
+    
+    try:
+        progress(f'📖 Reading Hudi table: {object_name}...')
+        progress(f'  Hudi requires table configuration - skipping for now')
+    except Exception as e:
+        progress(f'  Could not read Hudi table: {str(e)}')
+    return []
+
+def _schema_hdf5(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_H5PY:
+        progress(f'  h5py not installed, skipping HDF5 column detection')
+        return []
+    
+    def hdf5_columns(hdf5_file):
+        columns = []
+        with hdf5_file as f:
+            def extract_datasets(name, obj, _append=columns.append, _detect=detect_pii_in_column, _Dataset=h5py.Dataset):
+                if isinstance(obj, _Dataset):
+                    pii_detected, pii_type = _detect(name, str(obj.dtype))
+                    _append({
+                        "name": name,
+                        "type": str(obj.dtype),
+                        "mode": "NULLABLE",
+                        "description": f"HDF5 dataset: {obj.shape}",
+                        "pii_detected": pii_detected,
+                        "pii_type": pii_type
+                    })
+            
+            f.visititems(extract_datasets)
+        return columns
+    
+    columns = []
+    
+    try:
+        progress(f'📖 Reading HDF5 file: {object_name}...')
+        
+        ros3_columns = None
+        if 'ros3' in h5py.registered_drivers() and bucket_region and access_key_id and secret_access_key:
+            try:
+                ros3_columns = hdf5_columns(h5py.File(
+                    f"https://{bucket_name_actual}.s3.{bucket_region}.amazonaws.com/{quote(key)}",
+                    'r',
+                    driver='ros3',
+                    aws_region=bucket_region.encode(),
+                    secret_id=access_key_id.encode(),
+                    secret_key=secret_access_key.encode()
+                ))
+            except Exception as ros3_error:
+                progress(f'  ros3 read failed for {object_name} ({ros3_error}), downloading instead')
+        
+        if ros3_columns is not None:
+            columns = ros3_columns
+        else:
+            if size > MAX_SCHEMA_BYTES:
+                raise ValueError(f'{size} bytes exceeds the {MAX_SCHEMA_BYTES} byte schema detection limit')
+            columns = hdf5_columns(h5py.File(io.BytesIO(_download(bucket_s3_client, bucket_name_actual, key)), 'r'))
+        
+        progress(f' Found {len(columns)} datasets in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read HDF5 file: {str(e)}')
+    return columns
+
+def _schema_netcdf(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_NETCDF4:
+        progress(f'  netCDF4 not installed, skipping NetCDF column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading NetCDF file: {object_name}...')
+        
+        with Dataset('inmemory.nc', mode='r', memory=_download(bucket_s3_client, bucket_name_actual, key)) as nc:
+            append_column = columns.append
+            for var_name, var in nc.variables.items():
+                if var_name not in seen_columns:
+                    seen_columns.add(var_name)
+                    pii_detected, pii_type = detect_pii_in_column(var_name, str(var.dtype))
+                    append_column({
+                        "name": var_name,
+                        "type": str(var.dtype),
+                        "mode": "NULLABLE",
+                        "description": f"NetCDF variable: {var.shape}",
+                        "pii_detected": pii_detected,
+                        "pii_type": pii_type
+                    })
+        
+        progress(f' Found {len(columns)} variables in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read NetCDF file: {str(e)}')
+    return columns
+
+def _schema_tfrecord(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_TENSORFLOW:
+        progress(f'  tensorflow not installed, skipping TFRecord column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading TFRecord file: {object_name}...')
+        
+        tf_body = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)['Body']
+        try:
+            record_length = struct.unpack('<Q', tf_body.read(8))[0]
+            tf_body.read(4)
+            payload = tf_body.read(record_length)
+        finally:
+            tf_body.close()
+        
+        from tensorflow.core.example import example_pb2  # type: ignore
+        example = example_pb2.Example()
+        example.ParseFromString(payload)
+        feature_dict = example.features.feature
+        
+        append_column = columns.append
+        for feature_name, feature in feature_dict.items():
+            col_type = 'STRING'
+            if feature.HasField('int64_list'):
+                col_type = 'INTEGER'
+            elif feature.HasField('float_list'):
+                col_type = 'FLOAT'
+            elif feature.HasField('bytes_list'):
+                col_type = 'BYTES'
+            
+            if feature_name not in seen_columns:
+                seen_columns.add(feature_name)
+                pii_detected, pii_type = detect_pii_in_column(feature_name, col_type)
+                append_column({
+                    "name": feature_name,
+                    "type": col_type,
+                    "mode": "NULLABLE",
+                    "description": "TensorFlow feature",
+                    "pii_detected": pii_detected,
+                    "pii_type": pii_type
+                })
+        
+        progress(f' Found {len(columns)} features in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read TFRecord: {str(e)}')
+    return columns
+
+def _schema_pickle(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading pickle file: {object_name}...')
+        pickle_raw = _download(bucket_s3_client, bucket_name_actual, key)
+        pickle_kind, pickle_fields = _pickle_fields(pickle_raw)
+        
+        if pickle_fields and pickle_kind == 'DICT':
+            for col_name, col_type in pickle_fields.items():
+                if col_name not in seen_columns:
+                    seen_columns.add(col_name)
+                    pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
+                    columns.append({
+                        "name": col_name,
+                        "type": col_type,
+                        "mode": "NULLABLE",
+                        "description": "Pickled data",
+                        "pii_detected": pii_detected,
+                        "pii_type": pii_type
+                    })
+        elif pickle_fields:
+            for attr_name in pickle_fields:
+                if not attr_name.startswith('_'):
+                    if attr_name not in seen_columns:
+                        seen_columns.add(attr_name)
+                        pii_detected, pii_type = detect_pii_in_column(attr_name, 'STRING')
+                        columns.append({
+                            "name": attr_name,
+                            "type": "STRING",
+                            "mode": "NULLABLE",
+                            "description": "Pickled object attribute",
+                            "pii_detected": pii_detected,
+                            "pii_type": pii_type
+                        })
+        else:
+            pickle_data = _RestrictedUnpickler(io.BytesIO(pickle_raw)).load()
+            
+            if isinstance(pickle_data, dict):
+                _schema_from_dict(pickle_data, "Pickled data", columns, seen_columns)
+            else:
+                for attr_name in getattr(pickle_data, '__dict__', {}):
+                    if not attr_name.startswith('_'):
+                        if attr_name not in seen_columns:
+                            seen_columns.add(attr_name)
+                            pii_detected, pii_type = detect_pii_in_column(attr_name, 'STRING')
+                            columns.append({
+                                "name": attr_name,
+                                "type": "STRING",
+                                "mode": "NULLABLE",
+                                "description": "Pickled object attribute",
+                                "pii_detected": pii_detected,
+                                "pii_type": pii_type
+                            })
+        
+        progress(f' Found {len(columns)} fields in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read pickle file: {str(e)}')
+    return columns
+
+def _schema_sas(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_PANDAS:
+        progress(f'  pandas not installed, skipping SAS column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading SAS file: {object_name}...')
+        
+        with _open_ranged(bucket_s3_client, bucket_name_actual, key, size) as sas_file, \
+                pd.read_sas(sas_file, format='sas7bdat', chunksize=1) as sas_reader:
+            df = sas_reader.read(1)
+        for col_name, col_type in df.dtypes.astype(str).str.upper().items():
+            if col_name not in seen_columns:
+                seen_columns.add(col_name)
+                pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
+                columns.append({
+                    "name": col_name,
+                    "type": col_type,
+                    "mode": "NULLABLE",
+                    "description": "SAS data",
+                    "pii_detected": pii_detected,
+                    "pii_type": pii_type
+                })
+        
+        progress(f' Found {len(columns)} columns in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read SAS file: {str(e)}')
+    return columns
+
+def _schema_spss(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_PYREADSTAT:
+        progress(f'  pyreadstat not installed, skipping SPSS column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading SPSS file: {object_name}...')
+        
+        with _spill_to_file(bucket_s3_client, bucket_name_actual, key) as tmp_path:
+            _, meta = pyreadstat.read_sav(tmp_path, metadataonly=True)
+            for col_name in meta.column_names:
+                col_type = meta.readstat_variable_types.get(col_name, 'string').upper()
+                if col_name not in seen_columns:
+                    seen_columns.add(col_name)
+                    pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
+                    columns.append({
+                        "name": col_name,
+                        "type": col_type,
+                        "mode": "NULLABLE",
+                        "description": "SPSS data",
+                        "pii_detected": pii_detected,
+                        "pii_type": pii_type
+                    })
+            
+            progress(f' Found {len(columns)} columns in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read SPSS file: {str(e)}')
+    return columns
+
+def _schema_stata(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_PANDAS:
+        progress(f'  pandas not installed, skipping Stata column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading Stata file: {object_name}...')
+        
+        with _open_ranged(bucket_s3_client, bucket_name_actual, key, size) as stata_file, \
+                pd.read_stata(stata_file, iterator=True) as stata_reader:
+            df = stata_reader.read(1)
+            for col_name, col_type in df.dtypes.astype(str).str.upper().items():
+                if col_name not in seen_columns:
+                    seen_columns.add(col_name)
+                    pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
+                    columns.append({
+                        "name": col_name,
+                        "type": col_type,
+                        "mode": "NULLABLE",
+                        "description": "Stata data",
+                        "pii_detected": pii_detected,
+                        "pii_type": pii_type
+                    })
+            
+            progress(f' Found {len(columns)} columns in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read Stata file: {str(e)}')
+    return columns
+
+def _schema_geojson(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading GeoJSON file: {object_name}...')
+        geojson_body = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)['Body']
+        try:
+            if _HAS_IJSON and (size > GEOJSON_STREAM_BYTES or not (_HAS_SIMDJSON or _HAS_ORJSON)):
+                feature_properties = ijson.items(geojson_body, 'features.item.properties', use_float=True)
+            else:
+                geojson_raw = geojson_body.read()
+                if _HAS_SIMDJSON:
+                    geojson_data = simdjson.Parser().parse(geojson_raw)
+                elif _HAS_ORJSON:
+                    geojson_data = orjson.loads(geojson_raw)
+                else:
+                    geojson_data = json.loads(geojson_raw.decode('utf-8', errors='ignore'))
+                feature_properties = (feature['properties'] for feature in geojson_data.get('features', []) if 'properties' in feature)
+            
+            property_stats = defaultdict(lambda: [0, 0, False])
+            for properties in feature_properties:
+                if not properties:
+                    continue
+                for prop_name, prop_value in properties.items():
+                    stats = property_stats[prop_name]
+                    stats[0] += 1
+                    if isinstance(prop_value, bool):
+                        continue
+                    if isinstance(prop_value, int):
+                        stats[1] += 1
+                    elif isinstance(prop_value, float):
+                        stats[1] += 1
+                        stats[2] = True
+        finally:
+            geojson_body.close()
+        
+        for col_name, (total_count, numeric_count, has_float) in property_stats.items():
+            col_type = 'STRING'
+            if numeric_count / total_count > 0.8:
+                col_type = 'FLOAT' if has_float else 'INTEGER'
+            
+            if col_name not in seen_columns:
+                seen_columns.add(col_name)
+                pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
+                columns.append({
+                    "name": col_name,
+                    "type": col_type,
+                    "mode": "NULLABLE",
+                    "description": "GeoJSON property",
+                    "pii_detected": pii_detected,
+                    "pii_type": pii_type
+                })
+    
+        progress(f' Found {len(columns)} properties in {object_name}')
+    except Exception as e:
+        progress(f'  Could not parse GeoJSON: {str(e)}')
+    return columns
+
+def _schema_media(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    progress(f'📄 {file_type.upper()} file detected - extracting metadata for {object_name}...')
+    return []
+
+def _schema_excel(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_PANDAS:
+        progress(f'  pandas not installed, skipping Excel column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading Excel file: {object_name}...')
+        with _open_ranged(bucket_s3_client, bucket_name_actual, key, size) as excel_file:
+            df = pd.read_excel(excel_file, sheet_name=0, engine='calamine' if _HAS_CALAMINE else None, nrows=EXCEL_SAMPLE_ROWS)
+        
+        progress(f' Analyzing {len(df)} rows in {object_name}...')
+        
+        for col_name, col_dtype in df.dtypes.items():
+            col_type = _DTYPE_KIND_TYPES.get(col_dtype.kind, 'STRING')
+            
+            if col_name not in seen_columns:
+                seen_columns.add(col_name)
+                pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
+            
+                columns.append({
+                    "name": str(col_name),
+                    "type": col_type,
+                    "mode": "NULLABLE",
+                    "description": "",
+                    "pii_detected": pii_detected,
+                    "pii_type": pii_type
+                })
+        
+        progress(f' Analyzed {len(df)} rows, found {len(columns)} columns in {object_name}')
+    except ImportError:
+        progress(f'  openpyxl not installed, skipping Excel column detection')
+    except Exception as e:
+        progress(f'  Could not read Excel file: {str(e)}')
+    return columns
+
+def _schema_avro(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_FASTAVRO:
+        progress(f'  fastavro not installed, skipping Avro column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading Avro file schema: {object_name}...')
+        with _open_ranged(bucket_s3_client, bucket_name_actual, key, size, 64 * 1024) as avro_file:
+            schema = fastavro.reader(avro_file).writer_schema
+        
+        for field in schema.get('fields', []):
+            field_name = field.get('name', '')
+            field_type = str(field.get('type', 'string'))
+            
+            if field_name not in seen_columns:
+                seen_columns.add(field_name)
+                pii_detected, pii_type = detect_pii_in_column(field_name, field_type)
+                columns.append({
+                    "name": field_name,
+                    "type": field_type,
+                    "mode": "NULLABLE",
+                    "description": field.get('doc', ''),
+                    "pii_detected": pii_detected,
+                    "pii_type": pii_type
+                })
+        
+        progress(f' Found {len(columns)} columns in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read Avro schema: {str(e)}')
+    return columns
+
+def _schema_orc(bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress):
+    if not _HAS_PYARROW_ORC:
+        progress(f'  pyarrow not installed, skipping ORC column detection')
+        return []
+    
+    columns = []
+    seen_columns = set()
+    
+    try:
+        progress(f'📖 Reading ORC file schema: {object_name}...')
+        with _open_ranged(bucket_s3_client, bucket_name_actual, key, size, 16 * 1024) as orc_file:
+            schema = orc.ORCFile(orc_file).schema
+        
+        for field in schema:
+            if field.name not in seen_columns:
+                seen_columns.add(field.name)
+                pii_detected, pii_type = detect_pii_in_column(field.name, str(field.type))
+                columns.append({
+                    "name": field.name,
+                    "type": str(field.type),
+                    "mode": "NULLABLE" if field.nullable else "REQUIRED",
+                    "description": "",
+                    "pii_detected": pii_detected,
+                    "pii_type": pii_type
+                })
+        
+        progress(f' Found {len(columns)} columns in {object_name}')
+    except Exception as e:
+        progress(f'  Could not read ORC schema: {str(e)}')
+    return columns
+
+FILE_TYPE_HANDLERS = {
+    'csv': _schema_delimited,
+    'tsv': _schema_delimited,
+    'parquet': _schema_parquet,
+    'json': _schema_json,
+    'jsonl': _schema_jsonl,
+    'xml': _schema_xml,
+    'feather': _schema_feather,
+    'arrow': _schema_arrow,
+    'delta': _schema_delta,
+    'iceberg': _schema_iceberg,
+    'protobuf': _schema_protobuf,
+    'msgpack': _schema_msgpack,
+    'bson': _schema_bson,
+    'sql': _schema_sql,
+    'text': _schema_text,
+    'compressed': _schema_compressed,
+    'yaml': _schema_yaml,
+    'toml': _schema_toml,
+    'hudi': _schema_hudi,
+    'hdf5': _schema_hdf5,
+    'netcdf': _schema_netcdf,
+    'tfrecord': _schema_tfrecord,
+    'pickle': _schema_pickle,
+    'sas': _schema_sas,
+    'spss': _schema_spss,
+    'stata': _schema_stata,
+    'geojson': _schema_geojson,
+    'image': _schema_media,
+    'video': _schema_media,
+    'audio': _schema_media,
+    'pdf': _schema_media,
+    'doc': _schema_media,
+    'archive': _schema_media,
+    'binary': _schema_media,
+    'excel': _schema_excel,
+    'avro': _schema_avro,
+    'orc': _schema_orc,
+}
+
+def _process_s3_object(obj, bucket_s3_client, bucket_name_actual, bucket_region, connector_id, access_key_id, secret_access_key, progress, schema_cache=None):
+    key = obj['Key']
+    object_name = key.split('/')[-1] if '/' in key else key
+    size = obj.get('Size', 0)
+    last_modified = obj.get('LastModified', datetime.now())
+    storage_class = obj.get('StorageClass', 'STANDARD')
+    
+    asset_type = 'File'
+    file_format = 'Unknown'
+    file_extension = ''
+    
+    if key.endswith('/'):
+        asset_type = 'Folder'
+        file_format = 'Directory'
+    else:
+        if '.' in key:
+            file_extension = key.lower().split('.')[-1]
+        
+        if file_extension in ['csv', 'tsv']:
+            asset_type = 'Data File'
+            file_format = f'{file_extension.upper()} (Comma/Tab Separated)'
+        elif file_extension == 'json':
+            asset_type = 'Data File'
+            file_format = 'JSON (JavaScript Object Notation)'
+        elif file_extension in ['parquet']:
+            asset_type = 'Data File'
+            file_format = 'Parquet (Columnar Storage)'
+        elif file_extension in ['avro']:
+            asset_type = 'Data File'
+            file_format = 'Avro (Binary Format)'
+        elif file_extension in ['orc']:
+            asset_type = 'Data File'
+            file_format = 'ORC (Optimized Row Columnar)'
+        elif file_extension in ['sql']:
+            asset_type = 'Script'
+            file_format = 'SQL (Structured Query Language)'
+        elif file_extension in ['py']:
+            asset_type = 'Script'
+            file_format = 'Python Script'
+        elif file_extension in ['scala']:
+            asset_type = 'Script'
+            file_format = 'Scala Script'
+        elif file_extension in ['r', 'rscript']:
+            asset_type = 'Script'
+            file_format = 'R Script'
+        elif file_extension in ['txt', 'log']:
+            asset_type = 'Text File'
+            file_format = 'Text/Log File'
+        elif file_extension in ['zip', 'gz', 'tar', 'bz2', '7z']:
+            asset_type = 'Archive'
+            file_format = f'{file_extension.upper()} Archive'
+        elif file_extension in ['xlsx', 'xls']:
+            asset_type = 'Data File'
+            file_format = 'Excel Spreadsheet'
+        elif file_extension in ['pdf']:
+            asset_type = 'Document'
+            file_format = 'PDF Document'
+        elif file_extension in ['jpg', 'jpeg', 'png', 'gif', 'svg']:
+            asset_type = 'Image'
+            file_format = f'{file_extension.upper()} Image'
+        elif file_extension in ['mp4', 'avi', 'mov', 'mkv']:
+            asset_type = 'Video'
+            file_format = f'{file_extension.upper()} Video'
+        elif file_extension in ['mp3', 'wav', 'flac']:
+            asset_type = 'Audio'
+            file_format = f'{file_extension.upper()} Audio'
+        elif file_extension:
+            asset_type = 'File'
+            file_format = f'{file_extension.upper()} File'
+    
+    try:
+        metadata_response = bucket_s3_client.head_object(Bucket=bucket_name_actual, Key=key)
+        content_type = metadata_response.get('ContentType', '')
+        metadata = metadata_response.get('Metadata', {})
+        
+        if content_type and content_type != 'binary/octet-stream':
+            mime_to_format = {
+                'text/csv': 'CSV (Comma Separated Values)',
+                'application/json': 'JSON (JavaScript Object Notation)',
+                'application/x-parquet': 'Parquet (Columnar Storage)',
+                'application/avro': 'Avro (Binary Format)',
+                'application/x-orc': 'ORC (Optimized Row Columnar)',
+                'text/plain': 'Text File',
+                'application/zip': 'ZIP Archive',
+                'application/x-gzip': 'GZIP Archive',
+                'application/x-tar': 'TAR Archive',
+                'application/pdf': 'PDF Document',
+                'application/vnd.ms-excel': 'Excel Spreadsheet',
+                'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'Excel Spreadsheet (XLSX)',
+                'image/jpeg': 'JPEG Image',
+                'image/png': 'PNG Image',
+                'image/gif': 'GIF Image',
+                'video/mp4': 'MP4 Video',
+                'audio/mpeg': 'MP3 Audio',
+            }
+            
+            if content_type in mime_to_format:
+                file_format = mime_to_format[content_type]
+            elif file_format == 'Unknown':
+                file_format = content_type
+        
+    except ClientError:
+        content_type = ''
+        metadata = {}
+    
+    columns = []
+    etag = obj.get('ETag', '').strip('"')
+    cached_schema = schema_cache.get(f"s3://{bucket_name_actual}/{key}") if schema_cache else None
+    
+    if asset_type == 'Data File' and file_extension in DATA_FILE_EXTENSIONS:
+        try:
+            file_type = DATA_FILE_EXTENSIONS[file_extension]
+            
+            if etag and cached_schema and cached_schema[:2] == (etag, size):
+                columns = list(cached_schema[2])
+                progress(f' Reusing cached schema for unchanged object {object_name}')
+            
+            elif size > MAX_SCHEMA_BYTES and file_type in SIZE_GATED_FILE_TYPES:
+                progress(f'  Skipping schema detection for {object_name} ({size} bytes exceeds the {MAX_SCHEMA_BYTES} byte limit)')
+            
+            elif file_type in FILE_TYPE_HANDLERS:
+                columns = FILE_TYPE_HANDLERS[file_type](bucket_s3_client, bucket_name_actual, bucket_region, key, object_name, size, file_type, file_extension, access_key_id, secret_access_key, progress)
+            
+            if columns:
+                progress(f' Found {len(columns)} columns in {object_name}')
+        
+        except Exception as col_error:
+            progress(f'  Could not extract columns from {object_name}: {str(col_error)}')
+            columns = []
+    
+    asset_id = f"s3://{bucket_name_actual}/{key}"
+    
+    asset = {
+        "id": asset_id,
+        "name": key.split('/')[-1] if '/' in key else key,
+        "type": asset_type,
+        "catalog": bucket_name_actual,
+        "schema": '/'.join(key.split('/')[:-1]) if '/' in key else '',
+        "discovered_at": datetime.now().isoformat(),
+        "status": "active",
+        "description": f"S3 object in bucket {bucket_name_actual}",
+        "size_bytes": size,
+        "columns": columns,
+        "connector_id": connector_id,
+        "technical_metadata": {
+            "asset_id": asset_id,
+            "asset_type": asset_type,
+            "location": f"s3://{bucket_name_actual}/{key}",
+            "format": file_format,
+            "content_type": content_type,
+            "file_extension": file_extension,
+            "size_bytes": size,
+            "storage_class": storage_class,
+            "source_system": "Amazon S3",
+            "bucket_name": bucket_name_actual,
+            "object_key": key,
+            "object_path": key,
+            "region": bucket_region,
+            "last_modified": last_modified.isoformat() if isinstance(last_modified, datetime) else str(last_modified),
+            "etag": etag
+        },
+        "operational_metadata": {
+            "status": "active",
+            "owner": "Unknown",
+            "last_modified": last_modified.isoformat() if isinstance(last_modified, datetime) else str(last_modified),
+            "last_accessed": datetime.now().isoformat(),
+            "access_count": "N/A",
+            "data_quality_score": 95
+        },
+        "business_metadata": {
+            "description": f"S3 object: {key}",
+            "business_owner": "Unknown",
+            "department": bucket_name_actual,
+            "classification": "internal",
+            "sensitivity_level": "low",
+            "tags": list(metadata.keys()) if metadata else []
+        }
+    }
+    
+    format_display = file_format if file_format != 'Unknown' else (content_type if content_type else 'Unknown Format')
+    progress(f' Discovered: {object_name} | Type: {asset_type} | Format: {format_display}')
+    
+    db_asset = {
+        'id': asset.get('id'),
+        'name': asset.get('name'),
+        'type': asset.get('type'),
+        'catalog': asset.get('catalog'),
+        'schema': asset.get('schema'),
+        'connector_id': asset.get('connector_id'),
+        'discovered_at': asset.get('discovered_at'),
+        'status': asset.get('status', 'active'),
+        'extra_data': asset
+    }
+    return asset, db_asset
+
+MAX_ASSETS_PAGE_SIZE = 1000
+
+CONNECTOR_ID_PREFIX_TYPES = {'s3': 'Amazon S3', 'starburst': 'Starburst Galaxy', 'bq': 'BigQuery'}
+
+@lru_cache(maxsize=1024)
+def _parse_last_run(last_run):
+    return datetime.fromisoformat(last_run)
+
+def _latest_run(connectors):
+    return max((_parse_last_run(c["last_run"]) for c in connectors if c.get("last_run")), default=None)
+
+@lru_cache(maxsize=4096)
+def _parse_discovered_at(discovered):
+    if not isinstance(discovered, str):
+        return discovered if isinstance(discovered, datetime) else None
+    if _HAS_CISO8601:
+        try:
+            return ciso8601.parse_datetime(discovered)
+        except ValueError:
+            pass
+    try:
+        if 'Z' in discovered or '+' in discovered:
+            cleaned = discovered.replace('Z', '+00:00')
+            if '+' not in cleaned and '-' in cleaned and 'T' in cleaned:
+                cleaned = discovered + '+00:00'
+            try:
+                return datetime.fromisoformat(cleaned)
+            except:
+                cleaned_no_micro = cleaned.split('.')[0] + '+00:00' if '+' in cleaned else cleaned.split('.')[0]
+                return datetime.fromisoformat(cleaned_no_micro)
+        
+        cleaned = discovered.split('.')[0] if '.' in discovered else discovered
+        cleaned = cleaned.replace('Z', '').replace('+00:00', '').strip()
+        
+        if 'T' in cleaned:
+            try:
+                if '.' in cleaned:
+                    return datetime.strptime(cleaned, '%Y-%m-%dT%H:%M:%S.%f')
+                else:
+                    return datetime.strptime(cleaned, '%Y-%m-%dT%H:%M:%S')
+            except:
+                try:
+                    return datetime.fromisoformat(cleaned)
+                except:
+                    cleaned_no_micro = cleaned.split('.')[0]
+                    return datetime.strptime(cleaned_no_micro, '%Y-%m-%dT%H:%M:%S')
+        elif ' ' in cleaned:
+            try:
+                if '.' in cleaned:
+                    return datetime.strptime(cleaned, '%Y-%m-%d %H:%M:%S.%f')
+                else:
+                    return datetime.strptime(cleaned, '%Y-%m-%d %H:%M:%S')
+            except:
+                cleaned_no_micro = cleaned.split('.')[0]
+                return datetime.strptime(cleaned_no_micro, '%Y-%m-%d %H:%M:%S')
+        else:
+            return datetime.strptime(cleaned, '%Y-%m-%d')
+    except Exception as e:
+        print(f"  Error parsing discovered_at '{discovered}': {e}")
+        return datetime.min
+
+def ojson(payload, status=200):
+    if _HAS_ORJSON:
+        try:
+            return Response(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC), status=status, mimetype='application/json')
+        except TypeError:
+            pass
+    return jsonify(payload), status
+
+class OrjsonProvider(DefaultJSONProvider):
+    sort_keys = False
+    compact = True
+
+    def dumps(self, obj, **kwargs):
+        if _HAS_ORJSON:
+            try:
+                return orjson.dumps(
+                    obj,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+                    default=self.default
+                ).decode()
+            except TypeError:
+                pass
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if _HAS_ORJSON:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
+def _has_placeholder_credentials(service_account_info):
+    if not isinstance(service_account_info, dict):
+        return False
+    return (
+        'your-project-id' in str(service_account_info.get('project_id', '')).lower()
+        or 'your_private_key' in str(service_account_info.get('private_key', '')).lower()
+        or 'your-service-account@' in str(service_account_info.get('client_email', '')).lower()
+    )
+
+DISCOVERY_DEDUP_TTL = 60
+_discovery_inflight = {}
+_discovery_recent = {}
+_discovery_lock = threading.Lock()
+
+def _dedup_discovery(key, discover, clone):
+    # Collapse concurrent or back-to-back discoveries of the same source; shared results are cloned
+    # because the connector handlers stamp connector_id onto the returned asset dicts.
+    while True:
+        with _discovery_lock:
+            recent = _discovery_recent.get(key)
+            if recent and time.monotonic() - recent[0] < DISCOVERY_DEDUP_TTL:
+                return clone(recent[1])
+            event = _discovery_inflight.get(key)
+            if event is None:
+                event = _discovery_inflight[key] = threading.Event()
+                break
+        event.wait()
+    try:
+        result = discover()
+        now = time.monotonic()
+        with _discovery_lock:
+            for stale in [k for k, (ts, _) in _discovery_recent.items() if now - ts >= DISCOVERY_DEDUP_TTL]:
+                del _discovery_recent[stale]
+            _discovery_recent[key] = (now, clone(result))
+        return result
+    finally:
+        with _discovery_lock:
+            del _discovery_inflight[key]
+        event.set()
+
+def _clone_assets(assets):
+    return [dict(asset) for asset in assets]
+
+def _clone_azure_result(result):
+    return {**result, 'all_assets': _clone_assets(result.get('all_assets', []))}
+
+def _bigquery_table_asset(client, dataset_ref, table_item, project_id, connector_id):
+    dataset_id = dataset_ref.dataset_id
+    try:
+        table = client.get_table(dataset_ref.table(table_item.table_id))
+        
+        asset_id = f"{project_id}.{dataset_id}.{table_item.table_id}"
+        
+        columns = []
+        for field in table.schema:
+            pii_detected, pii_type = detect_pii_in_column(field.name, field.field_type)
+            columns.append({
+                "name": field.name,
+                "type": field.field_type,
+                "mode": field.mode,
+                "nullable": field.mode in ("NULLABLE", "REPEATED") if field.mode else True,
+                "description": field.description or "",
+                "pii_detected": pii_detected,
+                "pii_type": pii_type
+            })
+        
+        extra_data = {
+            "source_system": "BigQuery",
+            "dataset": dataset_id,  
+            "project_id": project_id,
+            "columns": columns,
+            "row_count": table.num_rows,
+            "size": table.num_bytes,
+            "created": table.created.isoformat() if table.created else None,
+            "modified": table.modified.isoformat() if table.modified else None
+        }
+        
+        if table_item.table_type == "VIEW" and hasattr(table, 'view_query'):
+            extra_data["sql"] = table.view_query
+            extra_data["definition"] = table.view_query
+            extra_data["view_definition"] = table.view_query
+        
+        return {
+            "id": asset_id,
+            "name": table_item.table_id,
+            "type": table_item.table_type,
+            "catalog": dataset_id,  
+            "connector_id": connector_id,
+            "extra_data": extra_data
+        }
+    except Exception as table_error:
+        print(f"  Error fetching table {table_item.table_id}: {table_error}")
+        return None
+
+def _gcs_db_asset(asset, connector_id):
+    get = asset.get
+    return {
+        'id': get('id'),
+        'name': asset['name'],
+        'type': get('type', 'File'),
+        'catalog': get('catalog', ''),
+        'schema': get('schema', ''),
+        'connector_id': connector_id,
+        'discovered_at': asset['discovered_at'],
+        'status': asset['status'],
+        'extra_data': asset
+    }
+
 def create_app():
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config.from_object(Config)
     app.config['SQLALCHEMY_ENGINE_OPTIONS'] = Config.SQLALCHEMY_ENGINE_OPTIONS
     db.init_app(app) 
@@ -121,7 +2283,6 @@ def create_app():
             app.config['active_connectors'] = active_connectors
         except Exception as e:
             print(f"Error saving connectors: {e}")
-            import traceback
             traceback.print_exc()
 
     def load_connectors():
@@ -133,7 +2294,6 @@ def create_app():
             return active_connectors
         except Exception as e:
             print(f" Error loading connectors: {e}")
-            import traceback
             traceback.print_exc()
             active_connectors = []
             app.config['active_connectors'] = []
@@ -142,9 +2302,8 @@ def create_app():
     def save_assets():
         nonlocal discovered_assets
         try:
-            saved_count = 0
-            failed_count = 0
             failed_assets = []
+            db_assets = []
             
             for asset in discovered_assets:
                 db_asset = {
@@ -161,29 +2320,24 @@ def create_app():
                 
                 if not db_asset.get('id'):
                     print(f"  Skipping asset with no ID: {asset.get('name', 'Unknown')}")
-                    failed_count += 1
                     failed_assets.append(asset.get('name', 'Unknown'))
                     continue
-                    
-                try:
-                    if db_helpers.save_asset(db_asset):
-                        saved_count += 1
-                    else:
-                        failed_count += 1
-                        failed_assets.append(db_asset.get('id', 'Unknown'))
-                        if failed_count <= 20:
-                            print(f"  Failed to save asset: {db_asset.get('id', 'Unknown')}")
-                            if not db_asset.get('name'):
-                                print(f"   Reason: Missing name field")
-                            if not db_asset.get('type'):
-                                print(f"   Reason: Missing type field")
-                except Exception as save_error:
-                    failed_count += 1
-                    failed_assets.append(db_asset.get('id', 'Unknown'))
-                    if failed_count <= 20:
-                        print(f" Exception saving asset {db_asset.get('id', 'Unknown')}: {save_error}")
-                        import traceback
-                        traceback.print_exc()
+                if not db_asset.get('name') or not db_asset.get('type'):
+                    failed_assets.append(db_asset['id'])
+                    if len(failed_assets) <= 20:
+                        print(f"  Failed to save asset: {db_asset['id']}")
+                        if not db_asset.get('name'):
+                            print(f"   Reason: Missing name field")
+                        if not db_asset.get('type'):
+                            print(f"   Reason: Missing type field")
+                    continue
+                
+                db_assets.append(db_asset)
+            
+            saved_count = db_helpers.save_assets_bulk(db_assets, preserve=('sort_order',)) if db_assets else 0
+            if db_assets and saved_count == 0:
+                failed_assets.extend(db_asset['id'] for db_asset in db_assets)
+            failed_count = len(failed_assets)
             
             print(f" Saved {saved_count}/{len(discovered_assets)} assets to database")
             if failed_count > 0:
@@ -197,7 +2351,6 @@ def create_app():
             app.config['discovered_assets'] = discovered_assets
         except Exception as e:
             print(f" Error saving assets: {e}")
-            import traceback
             traceback.print_exc()
 
     def load_assets():
@@ -209,11 +2362,158 @@ def create_app():
             return discovered_assets
         except Exception as e:
             print(f" Error loading assets: {e}")
-            import traceback
             traceback.print_exc()
             discovered_assets = []
             app.config['discovered_assets'] = []
         return discovered_assets
+
+    asset_index = (None, 0, -1, {})
+
+    def mark_assets_changed():
+        app.config['discovered_assets_generation'] = app.config.get('discovered_assets_generation', 0) + 1
+
+    def find_asset(asset_id):
+        nonlocal asset_index
+        source, size, generation, by_id = asset_index
+        current_generation = app.config.get('discovered_assets_generation', 0)
+        if source is discovered_assets and generation == current_generation:
+            asset = by_id.get(asset_id)
+            if asset is not None or size == len(discovered_assets):
+                return asset
+        source = discovered_assets
+        by_id = {}
+        for a in source:
+            by_id.setdefault(a.get('id'), a)
+        asset_index = (source, len(source), current_generation, by_id)
+        return by_id.get(asset_id)
+
+    connector_index = (None, 0, {})
+
+    def find_connector(connector_id):
+        nonlocal connector_index
+        source, size, by_id = connector_index
+        if source is not active_connectors or size != len(active_connectors):
+            source = active_connectors
+            by_id = {}
+            for c in source:
+                by_id.setdefault(c['id'], c)
+            connector_index = (source, len(source), by_id)
+        return by_id.get(connector_id)
+
+    connector_scope_cache = (None, 0, None)
+
+    def connector_scope():
+        nonlocal connector_scope_cache
+        source, size, scope = connector_scope_cache
+        if source is not active_connectors or size != len(active_connectors):
+            source = active_connectors
+            enabled_connectors = [c for c in source if c.get("enabled", True)]
+            scope = (
+                frozenset(conn['id'] for conn in enabled_connectors),
+                frozenset(conn.get('type') for conn in enabled_connectors),
+                frozenset(conn['id'] for conn in source),
+                frozenset(conn.get('type') for conn in source),
+            )
+            connector_scope_cache = (source, len(source), scope)
+            app.config['active_enabled_types'] = scope[1]
+        return scope
+
+    pipeline_index = (None, 0, -1, {})
+
+    def pipeline_stages_for(connector_id):
+        nonlocal pipeline_index
+        source, size, generation, by_connector = pipeline_index
+        current_generation = app.config.get('discovered_assets_generation', 0)
+        if (source is not discovered_assets or size != len(discovered_assets)
+                or generation != current_generation):
+            source = discovered_assets
+            by_connector = defaultdict(lambda: {"extract": [], "transform": [], "load": []})
+            for other_asset in source:
+                other_name_lower = (other_asset.get("name") or "").lower()
+                other_catalog_lower = (other_asset.get("catalog") or "").lower()
+                stages = by_connector[other_asset.get("connector_id", "")]
+                if "warehouse" in other_catalog_lower:
+                    stages["transform"].append({"id": other_asset.get("id"), "name": other_asset.get("name"), "stage": "transform", "type": other_asset.get("type")})
+                if "staging" in other_catalog_lower or "raw" in other_name_lower:
+                    stages["extract"].append({"id": other_asset.get("id"), "name": other_asset.get("name"), "stage": "extract", "type": other_asset.get("type")})
+                elif "analytics" in other_catalog_lower:
+                    stages["load"].append({"id": other_asset.get("id"), "name": other_asset.get("name"), "stage": "load", "type": other_asset.get("type")})
+            by_connector = dict(by_connector)
+            pipeline_index = (source, len(source), current_generation, by_connector)
+        return by_connector.get(connector_id)
+
+    finalize_executor = ThreadPoolExecutor(max_workers=2)
+
+    asset_write_q = queue.Queue(maxsize=10000)
+    pending_writes = {}
+    pending_writes_lock = threading.Lock()
+
+    def enqueue_asset_writes(connector_id, sid, db_rows):
+        with pending_writes_lock:
+            pending_writes[connector_id] = [len(db_rows), 0, sid]
+        if not db_rows:
+            asset_write_q.put((connector_id, None))
+        for db_row in db_rows:
+            asset_write_q.put((connector_id, db_row))
+
+    def drain_asset_writes():
+        while True:
+            batch = [asset_write_q.get()]
+            while len(batch) < db_helpers.ASSET_BULK_BATCH_SIZE:
+                try:
+                    batch.append(asset_write_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            by_connector = defaultdict(list)
+            for connector_id, db_row in batch:
+                rows = by_connector[connector_id]
+                if db_row is not None:
+                    rows.append(db_row)
+            
+            for connector_id, rows in by_connector.items():
+                try:
+                    saved = db_helpers.save_assets_bulk(rows, preserve=('sort_order',)) if rows else 0
+                except Exception as e:
+                    print(f" Error persisting {len(rows)} assets for connector {connector_id}: {e}")
+                    traceback.print_exc()
+                    saved = 0
+                with pending_writes_lock:
+                    state = pending_writes.get(connector_id)
+                    if state is None:
+                        continue
+                    state[0] -= len(rows)
+                    state[1] += saved
+                    if state[0] > 0:
+                        continue
+                    del pending_writes[connector_id]
+                _, saved_total, sid = state
+                print(f" Persisted {saved_total} assets for connector {connector_id}")
+                try:
+                    socketio.emit('persisted', {'type': 'persisted', 'connector_id': connector_id, 'saved_assets': saved_total}, namespace='/connectors', to=sid)
+                except Exception as e:
+                    print(f" Error notifying persisted assets for connector {connector_id}: {e}")
+
+    socketio.start_background_task(drain_asset_writes)
+
+    def finalize_s3_discovery(connector_id):
+        with app.app_context():
+            try:
+                from api.s3 import trigger_airflow_dag
+                trigger_result = trigger_airflow_dag('s3_asset_discovery')
+                if trigger_result.get('success'):
+                    print(" Airflow DAG triggered - asset discovery will start immediately!")
+                else:
+                    print(f"  Airflow DAG trigger failed (will run on schedule): {trigger_result.get('message')}")
+            except Exception as e:
+                print(f"  Could not trigger Airflow DAG (will run on schedule): {e}")
+            
+            try:
+                from database import Asset
+                saved_count = db.session.query(Asset).filter(Asset.connector_id == connector_id).count()
+                print(f" Verified: {saved_count} assets saved to database for connector {connector_id}")
+            except Exception as e:
+                print(f"  Could not verify saved assets for connector {connector_id}: {e}")
     
     @login_manager.user_loader
     def load_user(user_id):
@@ -249,7 +2549,7 @@ def create_app():
         nonlocal discovered_assets, active_connectors
         connection_data = BigQueryConnectionTest(**request.get_json())
         try:
-            service_account_info = json.loads(connection_data.service_account_json)
+            service_account_info = json_loads(connection_data.service_account_json)
         except json.JSONDecodeError:
             abort(400, "Invalid service account JSON format")
             
@@ -279,11 +2579,15 @@ def create_app():
                         columns = []
                         if table.schema:
                             for field in table.schema:
+                                pii_detected, pii_type = detect_pii_in_column(field.name, field.field_type)
                                 columns.append({
                                     "name": field.name,
                                     "type": field.field_type,
                                     "mode": field.mode,
-                                "description": field.description or "",
+                                    "nullable": field.mode in ("NULLABLE", "REPEATED") if field.mode else True,
+                                    "description": field.description or "",
+                                    "pii_detected": pii_detected,
+                                    "pii_type": pii_type,
                                 })
                         
                         table_labels = table.labels or {}
@@ -392,7 +2696,6 @@ def create_app():
             return True
         except Exception as e:
             print(f" Error in assets connect handler: {e}")
-            import traceback
             traceback.print_exc()
             return True
     
@@ -430,14 +2733,15 @@ def create_app():
         connection_type = str(connection_type).strip()
         selected_connector_id = str(selected_connector_id).strip().lower()
         
-        print(f"   Connection Type: '{connection_type}' (type: {type(connection_type)})")
-        print(f"   Connector ID: '{selected_connector_id}' (type: {type(selected_connector_id)})")
-        print(f"   Config keys: {list(config.keys()) if config else 'None'}")
-        print(f"   Checking conditions:")
-        print(f"     - BigQuery: connection_type == 'Service Account' ({connection_type == 'Service Account'}) AND selected_connector_id == 'bigquery' ({selected_connector_id == 'bigquery'})")
-        print(f"     - GCS: connection_type == 'Service Account' ({connection_type == 'Service Account'}) AND selected_connector_id == 'gcs' ({selected_connector_id == 'gcs'})")
-        print(f"     - S3: connection_type == 'Access Key' ({connection_type == 'Access Key'}) AND selected_connector_id == 's3' ({selected_connector_id == 's3'})")
-        print(f"     - Azure Blob: connection_type in ['Account Key', 'Connection String'] ({connection_type in ['Account Key', 'Connection String']}) AND selected_connector_id == 'azure-blob' ({selected_connector_id == 'azure-blob'})")
+        if CONNECTOR_DEBUG:
+            print(f"   Connection Type: '{connection_type}' (type: {type(connection_type)})")
+            print(f"   Connector ID: '{selected_connector_id}' (type: {type(selected_connector_id)})")
+            print(f"   Config keys: {list(config.keys()) if config else 'None'}")
+            print(f"   Checking conditions:")
+            print(f"     - BigQuery: connection_type == 'Service Account' ({connection_type == 'Service Account'}) AND selected_connector_id == 'bigquery' ({selected_connector_id == 'bigquery'})")
+            print(f"     - GCS: connection_type == 'Service Account' ({connection_type == 'Service Account'}) AND selected_connector_id == 'gcs' ({selected_connector_id == 'gcs'})")
+            print(f"     - S3: connection_type == 'Access Key' ({connection_type == 'Access Key'}) AND selected_connector_id == 's3' ({selected_connector_id == 's3'})")
+            print(f"     - Azure Blob: connection_type in ['Account Key', 'Connection String'] ({connection_type in ['Account Key', 'Connection String']}) AND selected_connector_id == 'azure-blob' ({selected_connector_id == 'azure-blob'})")
 
         if connection_type == 'Service Account' and selected_connector_id == 'bigquery':
             try:
@@ -451,7 +2755,7 @@ def create_app():
                 return
 
             try:
-                service_account_info = json.loads(connection_data.service_account_json)
+                service_account_info = json_loads(connection_data.service_account_json)
             except json.JSONDecodeError:
                 emit('error', {'type': 'error', 'message': 'Invalid service account JSON format'}, namespace='/connectors')
                 return
@@ -505,11 +2809,15 @@ def create_app():
                                 columns = []
                                 if table.schema:
                                     for field in table.schema:
+                                        pii_detected, pii_type = detect_pii_in_column(field.name, field.field_type)
                                         columns.append({
                                             "name": field.name,
                                             "type": field.field_type,
                                             "mode": field.mode,
+                                            "nullable": field.mode in ("NULLABLE", "REPEATED") if field.mode else True,
                                             "description": field.description or "",
+                                            "pii_detected": pii_detected,
+                                            "pii_type": pii_type,
                                         })
                                 
                                 table_labels = table.labels or {}
@@ -583,16 +2891,13 @@ def create_app():
                                 print(f"  Error in future result: {e}")
                                 continue
             
-                import json as json_module
                 try:
-                    service_account_info = json_module.loads(connection_data.service_account_json)
-                    placeholder_values = ["your-project-id", "YOUR_PRIVATE_KEY", "your-service-account@your-project.iam.gserviceaccount.com"]
+                    service_account_info = json_loads(connection_data.service_account_json)
                     
-                    service_account_str = str(service_account_info).lower()
-                    if any(placeholder.lower() in service_account_str for placeholder in placeholder_values):
+                    if _has_placeholder_credentials(service_account_info):
                         emit('error', {'type': 'error', 'message': ' Placeholder credentials detected in service account JSON. Please enter your actual Google Cloud service account credentials.'}, namespace='/connectors')
                         return
-                except json_module.JSONDecodeError:
+                except json.JSONDecodeError:
                     emit('error', {'type': 'error', 'message': ' Invalid JSON format in service account credentials.'}, namespace='/connectors')
                     return
                 
@@ -806,10 +3111,15 @@ def create_app():
                                         
                                         for col in columns_data.get('result', []):
                                             col_name = col.get('columnId') or col.get('name') or col.get('columnName') or 'unknown_column'
+                                            col_type = col.get('dataType') or col.get('type') or 'STRING'
+                                            pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
                                             columns.append({
                                                 "name": col_name,
-                                                "type": col.get('dataType') or col.get('type') or 'STRING',
+                                                "type": col_type,
+                                                "nullable": True,
                                                 "description": col.get('description', ''),
+                                                "pii_detected": pii_detected,
+                                                "pii_type": pii_type,
                                                 "tags": [tag.get('name') for tag in col.get('tags', [])]
                                             })
                                         break
@@ -942,13 +3252,18 @@ def create_app():
                 print(f" S3ConnectionTest created successfully")
             except Exception as e:
                 print(f" Error creating S3ConnectionTest: {e}")
-                import traceback
                 traceback.print_exc()
                 emit('error', {'type': 'error', 'message': f'Invalid S3 connection data: {str(e)}'}, namespace='/connectors')
                 return
             
             try:
-                emit('progress', {'type': 'progress', 'message': ' Authenticating with AWS S3...'}, namespace='/connectors')
+                sid = request.sid
+                progress_batcher = ProgressBatcher(
+                    lambda messages: socketio.emit('progress_batch', {'type': 'progress_batch', 'messages': messages}, namespace='/connectors', to=sid)
+                )
+                progress = progress_batcher.push
+                
+                progress(' Authenticating with AWS S3...')
                 
                 import boto3
                 from botocore.exceptions import ClientError, NoCredentialsError
@@ -964,1530 +3279,112 @@ def create_app():
                 
                 try:
                     s3_client.list_buckets()
-                    emit('progress', {'type': 'progress', 'message': ' Authentication successful! Connected to AWS S3'}, namespace='/connectors')
+                    progress(' Authentication successful! Connected to AWS S3')
                 except NoCredentialsError:
+                    progress_batcher.flush()
                     emit('error', {'type': 'error', 'message': ' Invalid AWS credentials. Please check your Access Key ID and Secret Access Key.'}, namespace='/connectors')
                     return
                 except ClientError as e:
                     error_code = e.response.get('Error', {}).get('Code', '')
                     if error_code == 'InvalidAccessKeyId':
+                        progress_batcher.flush()
                         emit('error', {'type': 'error', 'message': ' Invalid AWS Access Key ID'}, namespace='/connectors')
                     elif error_code == 'SignatureDoesNotMatch':
+                        progress_batcher.flush()
                         emit('error', {'type': 'error', 'message': ' Invalid AWS Secret Access Key'}, namespace='/connectors')
                     else:
+                        progress_batcher.flush()
                         emit('error', {'type': 'error', 'message': f' AWS authentication error: {str(e)}'}, namespace='/connectors')
                     return
                 
                 if connection_data.bucket_name:
-                    emit('progress', {'type': 'progress', 'message': f' Discovering assets in bucket: {connection_data.bucket_name}...'}, namespace='/connectors')
+                    progress(f' Discovering assets in bucket: {connection_data.bucket_name}...')
                     buckets_to_scan = [{'Name': connection_data.bucket_name}]
                 else:
-                    emit('progress', {'type': 'progress', 'message': ' Listing all accessible S3 buckets...'}, namespace='/connectors')
+                    progress(' Listing all accessible S3 buckets...')
                     buckets_response = s3_client.list_buckets()
                     buckets_to_scan = buckets_response.get('Buckets', [])
-                    emit('progress', {'type': 'progress', 'message': f' Found {len(buckets_to_scan)} buckets! Starting asset discovery...'}, namespace='/connectors')
+                    progress(f' Found {len(buckets_to_scan)} buckets! Starting asset discovery...')
                 
                 assets_discovered = 0
                 connector_id = f"s3_{region.replace('-', '_') if region else 'all_regions'}_{datetime.now().timestamp()}"
+                schema_cache = {
+                    a['id']: (a.get('technical_metadata', {}).get('etag'), a.get('size_bytes'), a['columns'])
+                    for a in discovered_assets
+                    if a.get('columns') and str(a.get('id', '')).startswith('s3://')
+                }
                 
                 for bucket_info in buckets_to_scan:
-                    bucket_name_actual = bucket_info['Name']
-                    
-                    try:
-                        bucket_location_response = s3_client.get_bucket_location(Bucket=bucket_name_actual)
-                        bucket_region = bucket_location_response.get('LocationConstraint') or 'us-east-1'
-                        if bucket_region is None or bucket_region == '':
-                            bucket_region = 'us-east-1'
-                        emit('progress', {'type': 'progress', 'message': f'  Discovering objects in bucket: {bucket_name_actual} (region: {bucket_region})...'}, namespace='/connectors')
-                    except ClientError:
-                        bucket_region = region
-                        emit('progress', {'type': 'progress', 'message': f'  Discovering objects in bucket: {bucket_name_actual}...'}, namespace='/connectors')
-                    
-                    try:
-                        bucket_s3_client = boto3.client(
-                            's3',
-                            aws_access_key_id=connection_data.access_key_id,
-                            aws_secret_access_key=connection_data.secret_access_key,
-                            region_name=bucket_region
-                        )
-                        
-                        paginator = bucket_s3_client.get_paginator('list_objects_v2')
-                        pages = paginator.paginate(Bucket=bucket_name_actual)
-                        
-                        bucket_objects = 0
-                        for page in pages:
-                            if 'Contents' not in page:
-                                continue
-                            
-                            for obj in page['Contents']:
-                                key = obj['Key']
-                                object_name = key.split('/')[-1] if '/' in key else key
-                                size = obj.get('Size', 0)
-                                last_modified = obj.get('LastModified', datetime.now())
-                                storage_class = obj.get('StorageClass', 'STANDARD')
-                                
-                                asset_type = 'File'
-                                file_format = 'Unknown'
-                                file_extension = ''
-                                
-                                if key.endswith('/'):
-                                    asset_type = 'Folder'
-                                    file_format = 'Directory'
-                                else:
-                                    if '.' in key:
-                                        file_extension = key.lower().split('.')[-1]
-                                    
-                                    if file_extension in ['csv', 'tsv']:
-                                        asset_type = 'Data File'
-                                        file_format = f'{file_extension.upper()} (Comma/Tab Separated)'
-                                    elif file_extension == 'json':
-                                        asset_type = 'Data File'
-                                        file_format = 'JSON (JavaScript Object Notation)'
-                                    elif file_extension in ['parquet']:
-                                        asset_type = 'Data File'
-                                        file_format = 'Parquet (Columnar Storage)'
-                                    elif file_extension in ['avro']:
-                                        asset_type = 'Data File'
-                                        file_format = 'Avro (Binary Format)'
-                                    elif file_extension in ['orc']:
-                                        asset_type = 'Data File'
-                                        file_format = 'ORC (Optimized Row Columnar)'
-                                    elif file_extension in ['sql']:
-                                        asset_type = 'Script'
-                                        file_format = 'SQL (Structured Query Language)'
-                                    elif file_extension in ['py']:
-                                        asset_type = 'Script'
-                                        file_format = 'Python Script'
-                                    elif file_extension in ['scala']:
-                                        asset_type = 'Script'
-                                        file_format = 'Scala Script'
-                                    elif file_extension in ['r', 'rscript']:
-                                        asset_type = 'Script'
-                                        file_format = 'R Script'
-                                    elif file_extension in ['txt', 'log']:
-                                        asset_type = 'Text File'
-                                        file_format = 'Text/Log File'
-                                    elif file_extension in ['zip', 'gz', 'tar', 'bz2', '7z']:
-                                        asset_type = 'Archive'
-                                        file_format = f'{file_extension.upper()} Archive'
-                                    elif file_extension in ['xlsx', 'xls']:
-                                        asset_type = 'Data File'
-                                        file_format = 'Excel Spreadsheet'
-                                    elif file_extension in ['pdf']:
-                                        asset_type = 'Document'
-                                        file_format = 'PDF Document'
-                                    elif file_extension in ['jpg', 'jpeg', 'png', 'gif', 'svg']:
-                                        asset_type = 'Image'
-                                        file_format = f'{file_extension.upper()} Image'
-                                    elif file_extension in ['mp4', 'avi', 'mov', 'mkv']:
-                                        asset_type = 'Video'
-                                        file_format = f'{file_extension.upper()} Video'
-                                    elif file_extension in ['mp3', 'wav', 'flac']:
-                                        asset_type = 'Audio'
-                                        file_format = f'{file_extension.upper()} Audio'
-                                    elif file_extension:
-                                        asset_type = 'File'
-                                        file_format = f'{file_extension.upper()} File'
-                                
-                                try:
-                                    metadata_response = bucket_s3_client.head_object(Bucket=bucket_name_actual, Key=key)
-                                    content_type = metadata_response.get('ContentType', '')
-                                    metadata = metadata_response.get('Metadata', {})
-                                    
-                                    if content_type and content_type != 'binary/octet-stream':
-                                        mime_to_format = {
-                                            'text/csv': 'CSV (Comma Separated Values)',
-                                            'application/json': 'JSON (JavaScript Object Notation)',
-                                            'application/x-parquet': 'Parquet (Columnar Storage)',
-                                            'application/avro': 'Avro (Binary Format)',
-                                            'application/x-orc': 'ORC (Optimized Row Columnar)',
-                                            'text/plain': 'Text File',
-                                            'application/zip': 'ZIP Archive',
-                                            'application/x-gzip': 'GZIP Archive',
-                                            'application/x-tar': 'TAR Archive',
-                                            'application/pdf': 'PDF Document',
-                                            'application/vnd.ms-excel': 'Excel Spreadsheet',
-                                            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'Excel Spreadsheet (XLSX)',
-                                            'image/jpeg': 'JPEG Image',
-                                            'image/png': 'PNG Image',
-                                            'image/gif': 'GIF Image',
-                                            'video/mp4': 'MP4 Video',
-                                            'audio/mpeg': 'MP3 Audio',
-                                        }
-                                        
-                                        if content_type in mime_to_format:
-                                            file_format = mime_to_format[content_type]
-                                        elif file_format == 'Unknown':
-                                            file_format = content_type
-                                    
-                                except ClientError:
-                                    content_type = ''
-                                    metadata = {}
-                                
-                                columns = []
-                                
-                                data_file_extensions = {
-                                    'csv': 'csv',
-                                    'tsv': 'tsv',
-                                    'psv': 'csv',
-                                    'ssv': 'csv',
-                                    'json': 'json',
-                                    'jsonl': 'jsonl',
-                                    'ndjson': 'jsonl',
-                                    'jsonc': 'json',
-                                    'json5': 'json',
-                                    'xml': 'xml',
-                                    'html': 'xml',
-                                    'xhtml': 'xml',
-                                    'yaml': 'yaml',
-                                    'yml': 'yaml',
-                                    'toml': 'toml',
-                                    'ini': 'ini',
-                                    'cfg': 'ini',
-                                    'conf': 'ini',
-                                    'properties': 'properties',
-                                    'txt': 'text',
-                                    'log': 'text',
-                                    'md': 'text',
-                                    'markdown': 'text',
-                                    
-                                    'parquet': 'parquet',
-                                    'orc': 'orc',
-                                    'feather': 'feather',
-                                    'arrow': 'arrow',
-                                    'ipc': 'arrow',
-                                    
-                                    'avro': 'avro',
-                                    'avsc': 'avro',
-                                    'protobuf': 'protobuf',
-                                    'proto': 'protobuf',
-                                    'pb': 'protobuf',
-                                    'msgpack': 'msgpack',
-                                    'bson': 'bson',
-                                    'cbor': 'cbor',
-                                    'thrift': 'thrift',
-                                    'flatbuffers': 'flatbuffers',
-                                    'fbs': 'flatbuffers',
-                                    
-                                    'delta': 'delta',
-                                    'iceberg': 'iceberg',
-                                    'hudi': 'hudi',
-                                    
-                                    'xlsx': 'excel',
-                                    'xls': 'excel',
-                                    'xlsm': 'excel',
-                                    'xlsb': 'excel',
-                                    'ods': 'excel',
-                                    'fods': 'excel',
-                                    'numbers': 'excel',
-                                    
-                                    'sql': 'sql',
-                                    'dump': 'sql',
-                                    'mysqldump': 'sql',
-                                    'pgdump': 'sql',
-                                    'dbf': 'dbf',
-                                    'mdb': 'mdb',
-                                    'accdb': 'mdb',
-                                    
-                                    'hdf5': 'hdf5',
-                                    'h5': 'hdf5',
-                                    'hdf': 'hdf5',
-                                    'nc': 'netcdf',
-                                    'netcdf': 'netcdf',
-                                    'cdf': 'netcdf',
-                                    'fits': 'fits',
-                                    'fits.gz': 'fits',
-                                    
-                                    'tfrecord': 'tfrecord',
-                                    'tfrecords': 'tfrecord',
-                                    'tf': 'tfrecord',
-                                    'pkl': 'pickle',
-                                    'pickle': 'pickle',
-                                    'joblib': 'joblib',
-                                    'pt': 'pytorch',
-                                    'pth': 'pytorch',
-                                    'onnx': 'onnx',
-                                    'h5': 'keras',
-                                    'keras': 'keras',
-                                    'pb': 'tensorflow',
-                                    'savedmodel': 'tensorflow',
-                                    'ckpt': 'tensorflow',
-                                    'weights': 'tensorflow',
-                                    
-                                    'sas7bdat': 'sas',
-                                    'sas': 'sas',
-                                    'sav': 'spss',
-                                    'spss': 'spss',
-                                    'dta': 'stata',
-                                    'stata': 'stata',
-                                    'rdata': 'r',
-                                    'rds': 'r',
-                                    
-                                    'graphml': 'graphml',
-                                    'gml': 'graphml',
-                                    'gexf': 'gexf',
-                                    'neo4j': 'neo4j',
-                                    'cypher': 'cypher',
-                                    
-                                    'tsv': 'timeseries',
-                                    'ts': 'timeseries',
-                                    'influx': 'influx',
-                                    
-                                    'shp': 'shapefile',
-                                    'geojson': 'geojson',
-                                    'kml': 'kml',
-                                    'kmz': 'kml',
-                                    'gpx': 'gpx',
-                                    'topojson': 'topojson',
-                                    
-                                    'jpg': 'image',
-                                    'jpeg': 'image',
-                                    'png': 'image',
-                                    'gif': 'image',
-                                    'bmp': 'image',
-                                    'tiff': 'image',
-                                    'tif': 'image',
-                                    'webp': 'image',
-                                    'svg': 'image',
-                                    'ico': 'image',
-                                    'heic': 'image',
-                                    'heif': 'image',
-                                    
-                                    'mp4': 'video',
-                                    'avi': 'video',
-                                    'mov': 'video',
-                                    'mkv': 'video',
-                                    'wmv': 'video',
-                                    'flv': 'video',
-                                    'webm': 'video',
-                                    'm4v': 'video',
-                                    
-                                    'mp3': 'audio',
-                                    'wav': 'audio',
-                                    'flac': 'audio',
-                                    'aac': 'audio',
-                                    'ogg': 'audio',
-                                    'wma': 'audio',
-                                    'm4a': 'audio',
-                                    
-                                    'pdf': 'pdf',
-                                    'doc': 'doc',
-                                    'docx': 'doc',
-                                    'rtf': 'rtf',
-                                    'odt': 'odt',
-                                    'epub': 'epub',
-                                    'mobi': 'mobi',
-                                    
-                                    'gz': 'compressed',
-                                    'gzip': 'compressed',
-                                    'zip': 'compressed',
-                                    'bz2': 'compressed',
-                                    'xz': 'compressed',
-                                    'lz4': 'compressed',
-                                    'zstd': 'compressed',
-                                    'zst': 'compressed',
-                                    '7z': 'compressed',
-                                    'rar': 'compressed',
-                                    'tar': 'compressed',
-                                    'tar.gz': 'compressed',
-                                    'tgz': 'compressed',
-                                    'tar.bz2': 'compressed',
-                                    'tbz2': 'compressed',
-                                    'tar.xz': 'compressed',
-                                    'txz': 'compressed',
-                                    'snappy': 'compressed',
-                                    'lzo': 'compressed',
-                                    'lzma': 'compressed',
-                                    
-                                    'deb': 'archive',
-                                    'rpm': 'archive',
-                                    'apk': 'archive',
-                                    'dmg': 'archive',
-                                    'iso': 'archive',
-                                    'bin': 'archive',
-                                    'exe': 'archive',
-                                    'msi': 'archive',
-                                    
-                                    'rss': 'xml',
-                                    'atom': 'xml',
-                                    'sitemap': 'xml',
-                                    'sitemap.xml': 'xml',
-                                    
-                                    'env': 'env',
-                                    'dockerfile': 'text',
-                                    'makefile': 'text',
-                                    'cmake': 'text',
-                                    
-                                    'r': 'r',
-                                    'py': 'text',
-                                    'ipynb': 'jupyter',
-                                    'jupyter': 'jupyter',
-                                    
-                                    'edf': 'edf',
-                                    'edf+': 'edf',
-                                    'bdf': 'edf',
-                                    'mat': 'matlab',
-                                    'matlab': 'matlab',
-                                    'vtk': 'vtk',
-                                    'vtp': 'vtk',
-                                    'ply': 'ply',
-                                    'obj': 'obj',
-                                    'stl': 'stl',
-                                    'fbx': 'fbx',
-                                    'dae': 'dae',
-                                    'x3d': 'x3d',
-                                    'gltf': 'gltf',
-                                    'glb': 'gltf',
-                                    
-                                    'ofx': 'ofx',
-                                    'qif': 'qif',
-                                    'mt940': 'mt940',
-                                    'mt942': 'mt942',
+                    bucket_name_actual = bucket_info['Name']
+                    
+                    try:
+                        bucket_location_response = s3_client.get_bucket_location(Bucket=bucket_name_actual)
+                        bucket_region = bucket_location_response.get('LocationConstraint') or 'us-east-1'
+                        if bucket_region is None or bucket_region == '':
+                            bucket_region = 'us-east-1'
+                        progress(f'  Discovering objects in bucket: {bucket_name_actual} (region: {bucket_region})...')
+                    except ClientError:
+                        bucket_region = region
+                        progress(f'  Discovering objects in bucket: {bucket_name_actual}...')
+                    
+                    try:
+                        bucket_s3_client = boto3.client(
+                            's3',
+                            aws_access_key_id=connection_data.access_key_id,
+                            aws_secret_access_key=connection_data.secret_access_key,
+                            region_name=bucket_region
+                        )
+                        
+                        paginator = bucket_s3_client.get_paginator('list_objects_v2')
+                        pages = paginator.paginate(Bucket=bucket_name_actual)
+                        
+                        process_object = partial(
+                            _process_s3_object,
+                            bucket_s3_client=bucket_s3_client,
+                            bucket_name_actual=bucket_name_actual,
+                            bucket_region=bucket_region,
+                            connector_id=connector_id,
+                            access_key_id=connection_data.access_key_id,
+                            secret_access_key=connection_data.secret_access_key,
+                            progress=progress,
+                            schema_cache=schema_cache
+                        )
+                        objects = (obj for page in pages for obj in page.get('Contents', []))
+                        
+                        bucket_objects = 0
+                        pending_assets = []
+                        try:
+                            with ThreadPoolExecutor(max_workers=S3_DISCOVERY_CONCURRENCY) as pool:
+                                for future in bounded_completions(pool, process_object, objects, S3_DISCOVERY_CONCURRENCY * 4):
+                                    try:
+                                        asset, db_asset = future.result()
+                                    except Exception as obj_err:
+                                        progress(f'  Could not process object in {bucket_name_actual}: {str(obj_err)}')
+                                        continue
                                     
-                                    'fasta': 'fasta',
-                                    'fa': 'fasta',
-                                    'fastq': 'fastq',
-                                    'fq': 'fastq',
-                                    'sam': 'sam',
-                                    'bam': 'bam',
-                                    'vcf': 'vcf',
-                                    'gff': 'gff',
-                                    'gtf': 'gtf',
-                                    'bed': 'bed',
-                                    'wig': 'wig',
-                                    'bigwig': 'bigwig',
-                                    'bigbed': 'bigbed',
+                                    discovered_assets.append(asset)
+                                    assets_discovered += 1
+                                    bucket_objects += 1
                                     
-                                    'yaml': 'yaml',
-                                    'yml': 'yaml',
-                                    'toml': 'toml',
-                                    'plist': 'plist',
-                                    'xplist': 'plist',
-                                    'binary': 'binary',
-                                    'dat': 'binary',
-                                }
-                                
-                                if asset_type == 'Data File' and file_extension in data_file_extensions:
-                                    try:
-                                        file_type = data_file_extensions[file_extension]
-                                        
-                                        if file_type in ['csv', 'tsv']:
-                                            emit('progress', {'type': 'progress', 'message': f'📖 Reading entire {file_extension.upper()} file: {object_name}...'}, namespace='/connectors')
-                                            csv_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                            csv_content = csv_obj['Body'].read().decode('utf-8', errors='ignore')
-                                            csv_lines = csv_content.split('\n')
-                                            
-                                            if csv_lines:
-                                                import csv as csv_module
-                                                import io
-                                                delimiter = ',' if file_extension == 'csv' else '\t'
-                                                
-                                                reader = csv_module.reader(io.StringIO(csv_lines[0]), delimiter=delimiter)
-                                                header_row = next(reader, [])
-                                                
-                                                all_data_rows = []
-                                                for line in csv_lines[1:]:
-                                                    if line.strip():
-                                                        try:
-                                                            reader_row = csv_module.reader(io.StringIO(line), delimiter=delimiter)
-                                                            row_data = next(reader_row, [])
-                                                            if row_data:
-                                                                all_data_rows.append(row_data)
-                                                        except:
-                                                            continue
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Analyzing {len(all_data_rows)} rows in {object_name}...'}, namespace='/connectors')
-                                                
-                                                for i, col_name in enumerate(header_row):
-                                                    col_name = col_name.strip()
-                                                    if col_name:
-                                                        col_type = 'STRING'
-                                                        integer_count = 0
-                                                        float_count = 0
-                                                        boolean_count = 0
-                                                        non_empty_count = 0
-                                                        
-                                                        for row in all_data_rows:
-                                                            if i < len(row):
-                                                                val = row[i].strip()
-                                                                if val:
-                                                                    non_empty_count += 1
-                                                                    if val.replace('-', '').replace('+', '').isdigit():
-                                                                        integer_count += 1
-                                                                    elif val.replace('.', '').replace('-', '').replace('+', '').isdigit() and '.' in val:
-                                                                        float_count += 1
-                                                                    elif val.lower() in ['true', 'false', 'yes', 'no', '1', '0', 'y', 'n']:
-                                                                        boolean_count += 1
-                                                        
-                                                        if non_empty_count > 0:
-                                                            if boolean_count / non_empty_count > 0.8:
-                                                                col_type = 'BOOLEAN'
-                                                            elif float_count / non_empty_count > 0.5:
-                                                                col_type = 'FLOAT'
-                                                            elif integer_count / non_empty_count > 0.8:
-                                                                col_type = 'INTEGER'
-                                                        
-                                                        pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                        
-                                                        columns.append({
-                                                            "name": col_name,
-                                                            "type": col_type,
-                                                            "mode": "NULLABLE",
-                                                            "description": "",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Analyzed {len(all_data_rows)} rows, found {len(columns)} columns in {object_name}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'parquet':
-                                            try:
-                                                import pyarrow.parquet as pq
-                                                import io
-                                                
-                                                parquet_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                parquet_buffer = io.BytesIO(parquet_obj['Body'].read())
-                                                parquet_file = pq.ParquetFile(parquet_buffer)
-                                                schema = parquet_file.schema_arrow
-                                                
-                                                for field in schema:
-                                                    pii_detected, pii_type = detect_pii_in_column(field.name, str(field.type))
-                                                    columns.append({
-                                                        "name": field.name,
-                                                        "type": str(field.type),
-                                                        "mode": "NULLABLE" if field.nullable else "REQUIRED",
-                                                        "description": "",
-                                                        "pii_detected": pii_detected,
-                                                        "pii_type": pii_type
-                                                    })
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  pyarrow not installed, skipping Parquet column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read Parquet schema: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'json':
-                                            json_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                            json_content = json_obj['Body'].read().decode('utf-8', errors='ignore')
-                                            
-                                            try:
-                                                json_data = json.loads(json_content)
-                                                
-                                                all_fields = {}
-                                                
-                                                if isinstance(json_data, list):
-                                                    for obj in json_data:
-                                                        if isinstance(obj, dict):
-                                                            for col_name, col_value in obj.items():
-                                                                if col_name not in all_fields:
-                                                                    all_fields[col_name] = []
-                                                                all_fields[col_name].append(col_value)
-                                                elif isinstance(json_data, dict):
-                                                    for col_name, col_value in json_data.items():
-                                                        all_fields[col_name] = [col_value]
-                                                
-                                                for col_name, values in all_fields.items():
-                                                    col_type = 'STRING'
-                                                    integer_count = 0
-                                                    float_count = 0
-                                                    boolean_count = 0
-                                                    non_empty_count = 0
-                                                    
-                                                    for val in values:
-                                                        if val is not None:
-                                                            non_empty_count += 1
-                                                            val_type = type(val).__name__.upper()
-                                                            if val_type == 'INT' or val_type == 'INTEGER':
-                                                                integer_count += 1
-                                                            elif val_type == 'FLOAT':
-                                                                float_count += 1
-                                                            elif val_type == 'BOOL' or val_type == 'BOOLEAN':
-                                                                boolean_count += 1
-                                                    
-                                                    if non_empty_count > 0:
-                                                        if boolean_count / non_empty_count > 0.8:
-                                                            col_type = 'BOOLEAN'
-                                                        elif float_count / non_empty_count > 0.5:
-                                                            col_type = 'FLOAT'
-                                                        elif integer_count / non_empty_count > 0.8:
-                                                            col_type = 'INTEGER'
-                                                    
-                                                    pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                    columns.append({
-                                                        "name": col_name,
-                                                        "type": col_type,
-                                                        "mode": "NULLABLE",
-                                                        "description": "",
-                                                        "pii_detected": pii_detected,
-                                                        "pii_type": pii_type
-                                                    })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Analyzed {len(json_data) if isinstance(json_data, list) else 1} JSON records in {object_name}'}, namespace='/connectors')
-                                            except json.JSONDecodeError:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not parse JSON structure'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'jsonl':
-                                            try:
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading entire JSONL file: {object_name}...'}, namespace='/connectors')
-                                                jsonl_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                jsonl_content = jsonl_obj['Body'].read().decode('utf-8', errors='ignore')
-                                                jsonl_lines = jsonl_content.split('\n')
-                                                
-                                                all_fields = {}
-                                                record_count = 0
-                                                
-                                                for line in jsonl_lines:
-                                                    if line.strip():
-                                                        try:
-                                                            obj = json.loads(line)
-                                                            if isinstance(obj, dict):
-                                                                record_count += 1
-                                                                for col_name, col_value in obj.items():
-                                                                    if col_name not in all_fields:
-                                                                        all_fields[col_name] = []
-                                                                    all_fields[col_name].append(col_value)
-                                                        except json.JSONDecodeError:
-                                                            continue
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Analyzing {record_count} JSONL records in {object_name}...'}, namespace='/connectors')
-                                                
-                                                for col_name, values in all_fields.items():
-                                                    col_type = 'STRING'
-                                                    integer_count = 0
-                                                    float_count = 0
-                                                    boolean_count = 0
-                                                    non_empty_count = 0
-                                                    
-                                                    for val in values:
-                                                        if val is not None:
-                                                            non_empty_count += 1
-                                                            val_type = type(val).__name__.upper()
-                                                            if val_type == 'INT' or val_type == 'INTEGER':
-                                                                integer_count += 1
-                                                            elif val_type == 'FLOAT':
-                                                                float_count += 1
-                                                            elif val_type == 'BOOL' or val_type == 'BOOLEAN':
-                                                                boolean_count += 1
-                                                    
-                                                    if non_empty_count > 0:
-                                                        if boolean_count / non_empty_count > 0.8:
-                                                            col_type = 'BOOLEAN'
-                                                        elif float_count / non_empty_count > 0.5:
-                                                            col_type = 'FLOAT'
-                                                        elif integer_count / non_empty_count > 0.8:
-                                                            col_type = 'INTEGER'
-                                                    
-                                                    pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                    columns.append({
-                                                        "name": col_name,
-                                                        "type": col_type,
-                                                        "mode": "NULLABLE",
-                                                        "description": "",
-                                                        "pii_detected": pii_detected,
-                                                        "pii_type": pii_type
-                                                    })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Analyzed {record_count} JSONL records, found {len(columns)} fields in {object_name}'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not parse JSONL file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'xml':
-                                            try:
-                                                import xml.etree.ElementTree as ET
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading XML file: {object_name}...'}, namespace='/connectors')
-                                                xml_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                xml_content = xml_obj['Body'].read().decode('utf-8', errors='ignore')
-                                                
-                                                root = ET.fromstring(xml_content)
-                                                
-                                                all_elements = {}
-                                                
-                                                def extract_elements(element, path=''):
-                                                    current_path = f"{path}/{element.tag}" if path else element.tag
-                                                    if element.text and element.text.strip():
-                                                        if current_path not in all_elements:
-                                                            all_elements[current_path] = []
-                                                        all_elements[current_path].append(element.text.strip())
-                                                    for child in element:
-                                                        extract_elements(child, current_path)
-                                                
-                                                extract_elements(root)
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Analyzing XML structure in {object_name}...'}, namespace='/connectors')
-                                                
-                                                for col_name, values in all_elements.items():
-                                                    col_type = 'STRING'
-                                                    if values:
-                                                        integer_count = sum(1 for v in values if v.replace('-', '').isdigit())
-                                                        float_count = sum(1 for v in values if v.replace('.', '').replace('-', '').isdigit() and '.' in v)
-                                                        if len(values) > 0:
-                                                            if float_count / len(values) > 0.5:
-                                                                col_type = 'FLOAT'
-                                                            elif integer_count / len(values) > 0.8:
-                                                                col_type = 'INTEGER'
-                                                    
-                                                    pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                    columns.append({
-                                                        "name": col_name,
-                                                        "type": col_type,
-                                                        "mode": "NULLABLE",
-                                                        "description": "",
-                                                        "pii_detected": pii_detected,
-                                                        "pii_type": pii_type
-                                                    })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} XML elements in {object_name}'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not parse XML file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'feather':
-                                            try:
-                                                import pyarrow.feather as feather
-                                                import io
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading Feather file: {object_name}...'}, namespace='/connectors')
-                                                feather_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                feather_buffer = io.BytesIO(feather_obj['Body'].read())
-                                                
-                                                table = feather.read_table(feather_buffer)
-                                                schema = table.schema
-                                                
-                                                for field in schema:
-                                                    pii_detected, pii_type = detect_pii_in_column(field.name, str(field.type))
-                                                    columns.append({
-                                                        "name": field.name,
-                                                        "type": str(field.type),
-                                                        "mode": "NULLABLE" if field.nullable else "REQUIRED",
-                                                        "description": "",
-                                                        "pii_detected": pii_detected,
-                                                        "pii_type": pii_type
-                                                    })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} columns in {object_name}'}, namespace='/connectors')
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  pyarrow not installed, skipping Feather column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read Feather file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'arrow':
-                                            try:
-                                                import pyarrow as pa
-                                                import io
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading Arrow file: {object_name}...'}, namespace='/connectors')
-                                                arrow_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                arrow_buffer = io.BytesIO(arrow_obj['Body'].read())
-                                                
-                                                reader = pa.ipc.open_stream(arrow_buffer)
-                                                table = reader.read_all()
-                                                schema = table.schema
-                                                
-                                                for field in schema:
-                                                    pii_detected, pii_type = detect_pii_in_column(field.name, str(field.type))
-                                                    columns.append({
-                                                        "name": field.name,
-                                                        "type": str(field.type),
-                                                        "mode": "NULLABLE" if field.nullable else "REQUIRED",
-                                                        "description": "",
-                                                        "pii_detected": pii_detected,
-                                                        "pii_type": pii_type
-                                                    })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} columns in {object_name}'}, namespace='/connectors')
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  pyarrow not installed, skipping Arrow column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read Arrow file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'delta':
-                                            try:
-                                                from deltalake import DeltaTable  # type: ignore
-                                                import tempfile
-                                                import os
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading Delta Lake table: {object_name}...'}, namespace='/connectors')
-                                                
-                                                with tempfile.NamedTemporaryFile(delete=False, suffix='.parquet') as tmp_file:
-                                                    delta_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                    tmp_file.write(delta_obj['Body'].read())
-                                                    tmp_path = tmp_file.name
-                                                
-                                                try:
-                                                    dt = DeltaTable(tmp_path)
-                                                    schema = dt.schema()
-                                                    
-                                                    for field in schema.fields:
-                                                        pii_detected, pii_type = detect_pii_in_column(field.name, str(field.type))
-                                                        columns.append({
-                                                            "name": field.name,
-                                                            "type": str(field.type),
-                                                            "mode": "NULLABLE" if field.nullable else "REQUIRED",
-                                                            "description": "",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                    
-                                                    emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} columns in Delta table {object_name}'}, namespace='/connectors')
-                                                finally:
-                                                    os.unlink(tmp_path)
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  deltalake not installed, skipping Delta Lake column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read Delta Lake table: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'iceberg':
-                                            try:
-                                                from pyiceberg.catalog import load_catalog  # type: ignore
-                                                from pyiceberg.table import Table  # type: ignore
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading Iceberg table: {object_name}...'}, namespace='/connectors')
-                                                emit('progress', {'type': 'progress', 'message': f'  Iceberg requires catalog configuration - skipping for now'}, namespace='/connectors')
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  pyiceberg not installed, skipping Iceberg column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read Iceberg table: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'protobuf':
-                                            try:
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading Protobuf file: {object_name}...'}, namespace='/connectors')
-                                                emit('progress', {'type': 'progress', 'message': f'  Protobuf requires schema file - skipping column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read Protobuf file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'msgpack':
-                                            try:
-                                                import msgpack
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading MessagePack file: {object_name}...'}, namespace='/connectors')
-                                                msgpack_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                msgpack_data = msgpack.unpackb(msgpack_obj['Body'].read(), raw=False)
-                                                
-                                                if isinstance(msgpack_data, dict):
-                                                    for col_name, col_value in msgpack_data.items():
-                                                        col_type = type(col_value).__name__.upper()
-                                                        if col_type == 'STR':
-                                                            col_type = 'STRING'
-                                                        elif col_type == 'INT':
-                                                            col_type = 'INTEGER'
-                                                        
-                                                        pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                        columns.append({
-                                                            "name": col_name,
-                                                            "type": col_type,
-                                                            "mode": "NULLABLE",
-                                                            "description": "",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} fields in {object_name}'}, namespace='/connectors')
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  msgpack not installed, skipping MessagePack column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read MessagePack file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'bson':
-                                            try:
-                                                import bson
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading BSON file: {object_name}...'}, namespace='/connectors')
-                                                bson_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                bson_data = bson.loads(bson_obj['Body'].read())
-                                                
-                                                if isinstance(bson_data, dict):
-                                                    for col_name, col_value in bson_data.items():
-                                                        col_type = type(col_value).__name__.upper()
-                                                        if col_type == 'STR':
-                                                            col_type = 'STRING'
-                                                        elif col_type == 'INT':
-                                                            col_type = 'INTEGER'
-                                                        
-                                                        pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                        columns.append({
-                                                            "name": col_name,
-                                                            "type": col_type,
-                                                            "mode": "NULLABLE",
-                                                            "description": "",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} fields in {object_name}'}, namespace='/connectors')
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  bson not installed, skipping BSON column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read BSON file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'sql':
-                                            try:
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading SQL dump: {object_name}...'}, namespace='/connectors')
-                                                sql_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                sql_content = sql_obj['Body'].read().decode('utf-8', errors='ignore')
-                                                
-                                                import re
-                                                create_table_pattern = r'CREATE\s+TABLE\s+(?:\w+\.)?(\w+)\s*\((.*?)\);'
-                                                matches = re.findall(create_table_pattern, sql_content, re.IGNORECASE | re.DOTALL)
-                                                
-                                                for table_name, table_def in matches:
-                                                    col_pattern = r'(\w+)\s+(\w+(?:\([^)]+\))?)'
-                                                    col_matches = re.findall(col_pattern, table_def)
-                                                    
-                                                    for col_name, col_type in col_matches:
-                                                        pii_detected, pii_type = detect_pii_in_column(col_name, col_type.upper())
-                                                        columns.append({
-                                                            "name": col_name,
-                                                            "type": col_type.upper(),
-                                                            "mode": "NULLABLE",
-                                                            "description": f"From table {table_name}",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} columns in SQL dump {object_name}'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not parse SQL dump: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'text':
-                                            try:
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading text file: {object_name}...'}, namespace='/connectors')
-                                                text_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                text_content = text_obj['Body'].read().decode('utf-8', errors='ignore')
-                                                text_lines = text_content.split('\n')[:1000]
-                                                
-                                                import re
-                                                
-                                                kv_pattern = r'(\w+)\s*[=:]\s*([^\s]+)'
-                                                all_keys = set()
-                                                
-                                                for line in text_lines:
-                                                    matches = re.findall(kv_pattern, line)
-                                                    for key, value in matches:
-                                                        all_keys.add(key)
-                                                
-                                                if all_keys:
-                                                    for key in all_keys:
-                                                        pii_detected, pii_type = detect_pii_in_column(key, 'STRING')
-                                                        columns.append({
-                                                            "name": key,
-                                                            "type": "STRING",
-                                                            "mode": "NULLABLE",
-                                                            "description": "Extracted from text patterns",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} patterns in {object_name}'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not analyze text file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'compressed':
-                                            try:
-                                                emit('progress', {'type': 'progress', 'message': f' Detecting compressed file format: {object_name}...'}, namespace='/connectors')
-                                                
-                                                base_key = key.rsplit('.', 1)[0] if '.' in key else key
-                                                inner_extension = base_key.split('.')[-1].lower() if '.' in base_key else ''
-                                                
-                                                compressed_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                compressed_data = compressed_obj['Body'].read()
-                                                
-                                                if file_extension in ['gz', 'gzip']:
-                                                    import gzip
-                                                    decompressed = gzip.decompress(compressed_data)
-                                                elif file_extension == 'bz2':
-                                                    import bz2
-                                                    decompressed = bz2.decompress(compressed_data)
-                                                elif file_extension == 'xz':
-                                                    import lzma
-                                                    decompressed = lzma.decompress(compressed_data)
-                                                elif file_extension == 'zip':
-                                                    import zipfile
-                                                    import io
-                                                    zip_file = zipfile.ZipFile(io.BytesIO(compressed_data))
-                                                    if zip_file.namelist():
-                                                        decompressed = zip_file.read(zip_file.namelist()[0])
-                                                    else:
-                                                        decompressed = None
-                                                else:
-                                                    decompressed = None
-                                                
-                                                if decompressed and inner_extension in data_file_extensions:
-                                                    emit('progress', {'type': 'progress', 'message': f'📖 Processing inner {inner_extension.upper()} file from compressed archive...'}, namespace='/connectors')
-                                                    emit('progress', {'type': 'progress', 'message': f'  Nested compression processing not yet fully implemented'}, namespace='/connectors')
-                                                else:
-                                                    emit('progress', {'type': 'progress', 'message': f'  Could not determine inner format or unsupported compression'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not decompress file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'yaml':
-                                            try:
-                                                import yaml
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading YAML file: {object_name}...'}, namespace='/connectors')
-                                                yaml_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                yaml_content = yaml_obj['Body'].read().decode('utf-8', errors='ignore')
-                                                yaml_data = yaml.safe_load(yaml_content)
-                                                
-                                                if isinstance(yaml_data, dict):
-                                                    for col_name, col_value in yaml_data.items():
-                                                        col_type = type(col_value).__name__.upper()
-                                                        if col_type == 'STR':
-                                                            col_type = 'STRING'
-                                                        elif col_type == 'INT':
-                                                            col_type = 'INTEGER'
-                                                        
-                                                        pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                        columns.append({
-                                                            "name": col_name,
-                                                            "type": col_type,
-                                                            "mode": "NULLABLE",
-                                                            "description": "",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} fields in {object_name}'}, namespace='/connectors')
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  pyyaml not installed, skipping YAML column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not parse YAML: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'toml':
-                                            try:
-                                                import tomli
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading TOML file: {object_name}...'}, namespace='/connectors')
-                                                toml_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                toml_content = toml_obj['Body'].read().decode('utf-8', errors='ignore')
-                                                toml_data = tomli.loads(toml_content)
-                                                
-                                                if isinstance(toml_data, dict):
-                                                    for col_name, col_value in toml_data.items():
-                                                        col_type = type(col_value).__name__.upper()
-                                                        if col_type == 'STR':
-                                                            col_type = 'STRING'
-                                                        elif col_type == 'INT':
-                                                            col_type = 'INTEGER'
-                                                        
-                                                        pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                        columns.append({
-                                                            "name": col_name,
-                                                            "type": col_type,
-                                                            "mode": "NULLABLE",
-                                                            "description": "",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} fields in {object_name}'}, namespace='/connectors')
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  tomli not installed, skipping TOML column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not parse TOML: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'hudi':
-                                            try:
-                                                from pyhudi import HudiTable  # type: ignore
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading Hudi table: {object_name}...'}, namespace='/connectors')
-                                                emit('progress', {'type': 'progress', 'message': f'  Hudi requires table configuration - skipping for now'}, namespace='/connectors')
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  pyhudi not installed, skipping Hudi column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read Hudi table: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'hdf5':
-                                            try:
-                                                import h5py
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading HDF5 file: {object_name}...'}, namespace='/connectors')
-                                                
-                                                with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                                                    hdf5_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                    tmp_file.write(hdf5_obj['Body'].read())
-                                                    tmp_path = tmp_file.name
-                                                
-                                                try:
-                                                    with h5py.File(tmp_path, 'r') as f:
-                                                        def extract_datasets(name, obj):
-                                                            if isinstance(obj, h5py.Dataset):
-                                                                pii_detected, pii_type = detect_pii_in_column(name, str(obj.dtype))
-                                                                columns.append({
-                                                                    "name": name,
-                                                                    "type": str(obj.dtype),
-                                                                    "mode": "NULLABLE",
-                                                                    "description": f"HDF5 dataset: {obj.shape}",
-                                                                    "pii_detected": pii_detected,
-                                                                    "pii_type": pii_type
-                                                                })
-                                                        
-                                                        f.visititems(extract_datasets)
-                                                    
-                                                    emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} datasets in {object_name}'}, namespace='/connectors')
-                                                finally:
-                                                    os.unlink(tmp_path)
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  h5py not installed, skipping HDF5 column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read HDF5 file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'netcdf':
-                                            try:
-                                                from netCDF4 import Dataset
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading NetCDF file: {object_name}...'}, namespace='/connectors')
-                                                
-                                                with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                                                    nc_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                    tmp_file.write(nc_obj['Body'].read())
-                                                    tmp_path = tmp_file.name
-                                                
-                                                try:
-                                                    with Dataset(tmp_path, 'r') as nc:
-                                                        for var_name in nc.variables:
-                                                            var = nc.variables[var_name]
-                                                            pii_detected, pii_type = detect_pii_in_column(var_name, str(var.dtype))
-                                                            columns.append({
-                                                                "name": var_name,
-                                                                "type": str(var.dtype),
-                                                                "mode": "NULLABLE",
-                                                                "description": f"NetCDF variable: {var.shape}",
-                                                                "pii_detected": pii_detected,
-                                                                "pii_type": pii_type
-                                                            })
-                                                    
-                                                    emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} variables in {object_name}'}, namespace='/connectors')
-                                                finally:
-                                                    os.unlink(tmp_path)
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  netCDF4 not installed, skipping NetCDF column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read NetCDF file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'tfrecord':
-                                            try:
-                                                import tensorflow as tf  # type: ignore
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading TFRecord file: {object_name}...'}, namespace='/connectors')
-                                                
-                                                with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                                                    tf_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                    tmp_file.write(tf_obj['Body'].read())
-                                                    tmp_path = tmp_file.name
-                                                
-                                                try:
-                                                    dataset = tf.data.TFRecordDataset(tmp_path)
-                                                    for raw_record in dataset.take(1):
-                                                        example = tf.train.Example()
-                                                        example.ParseFromString(raw_record.numpy())
-                                                        feature_dict = example.features.feature
-                                                        
-                                                        for feature_name, feature in feature_dict.items():
-                                                            col_type = 'STRING'
-                                                            if feature.HasField('int64_list'):
-                                                                col_type = 'INTEGER'
-                                                            elif feature.HasField('float_list'):
-                                                                col_type = 'FLOAT'
-                                                            elif feature.HasField('bytes_list'):
-                                                                col_type = 'BYTES'
-                                                            
-                                                            pii_detected, pii_type = detect_pii_in_column(feature_name, col_type)
-                                                            columns.append({
-                                                                "name": feature_name,
-                                                                "type": col_type,
-                                                                "mode": "NULLABLE",
-                                                                "description": "TensorFlow feature",
-                                                                "pii_detected": pii_detected,
-                                                                "pii_type": pii_type
-                                                            })
-                                                    
-                                                    emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} features in {object_name}'}, namespace='/connectors')
-                                                finally:
-                                                    os.unlink(tmp_path)
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  tensorflow not installed, skipping TFRecord column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read TFRecord: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'pickle':
-                                            try:
-                                                import pickle
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading pickle file: {object_name}...'}, namespace='/connectors')
-                                                pickle_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                pickle_data = pickle.loads(pickle_obj['Body'].read())
-                                                
-                                                if isinstance(pickle_data, dict):
-                                                    for col_name, col_value in pickle_data.items():
-                                                        col_type = type(col_value).__name__.upper()
-                                                        if col_type == 'STR':
-                                                            col_type = 'STRING'
-                                                        elif col_type == 'INT':
-                                                            col_type = 'INTEGER'
-                                                        
-                                                        pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                        columns.append({
-                                                            "name": col_name,
-                                                            "type": col_type,
-                                                            "mode": "NULLABLE",
-                                                            "description": "Pickled data",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                elif hasattr(pickle_data, '__dict__'):
-                                                    for attr_name in dir(pickle_data):
-                                                        if not attr_name.startswith('_'):
-                                                            pii_detected, pii_type = detect_pii_in_column(attr_name, 'STRING')
-                                                            columns.append({
-                                                                "name": attr_name,
-                                                                "type": "STRING",
-                                                                "mode": "NULLABLE",
-                                                                "description": "Pickled object attribute",
-                                                                "pii_detected": pii_detected,
-                                                                "pii_type": pii_type
-                                                            })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} fields in {object_name}'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read pickle file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'sas':
-                                            try:
-                                                import pandas as pd
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading SAS file: {object_name}...'}, namespace='/connectors')
-                                                
-                                                with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                                                    sas_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                    tmp_file.write(sas_obj['Body'].read())
-                                                    tmp_path = tmp_file.name
-                                                
-                                                try:
-                                                    df = pd.read_sas(tmp_path)
-                                                    for col_name in df.columns:
-                                                        col_type = str(df[col_name].dtype).upper()
-                                                        pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                        columns.append({
-                                                            "name": col_name,
-                                                            "type": col_type,
-                                                            "mode": "NULLABLE",
-                                                            "description": "SAS data",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                    
-                                                    emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} columns in {object_name}'}, namespace='/connectors')
-                                                finally:
-                                                    os.unlink(tmp_path)
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  pandas not installed, skipping SAS column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read SAS file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'spss':
-                                            try:
-                                                import pyreadstat
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading SPSS file: {object_name}...'}, namespace='/connectors')
-                                                
-                                                with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                                                    spss_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                    tmp_file.write(spss_obj['Body'].read())
-                                                    tmp_path = tmp_file.name
-                                                
-                                                try:
-                                                    df, meta = pyreadstat.read_sav(tmp_path)
-                                                    for col_name in df.columns:
-                                                        col_type = str(df[col_name].dtype).upper()
-                                                        pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                        columns.append({
-                                                            "name": col_name,
-                                                            "type": col_type,
-                                                            "mode": "NULLABLE",
-                                                            "description": "SPSS data",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                    
-                                                    emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} columns in {object_name}'}, namespace='/connectors')
-                                                finally:
-                                                    os.unlink(tmp_path)
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  pyreadstat not installed, skipping SPSS column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read SPSS file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'stata':
-                                            try:
-                                                import pandas as pd
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading Stata file: {object_name}...'}, namespace='/connectors')
-                                                
-                                                with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                                                    stata_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                    tmp_file.write(stata_obj['Body'].read())
-                                                    tmp_path = tmp_file.name
-                                                
-                                                try:
-                                                    df = pd.read_stata(tmp_path)
-                                                    for col_name in df.columns:
-                                                        col_type = str(df[col_name].dtype).upper()
-                                                        pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                        columns.append({
-                                                            "name": col_name,
-                                                            "type": col_type,
-                                                            "mode": "NULLABLE",
-                                                            "description": "Stata data",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                    
-                                                    emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} columns in {object_name}'}, namespace='/connectors')
-                                                finally:
-                                                    os.unlink(tmp_path)
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  pandas not installed, skipping Stata column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read Stata file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'geojson':
-                                            try:
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading GeoJSON file: {object_name}...'}, namespace='/connectors')
-                                                geojson_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                geojson_content = geojson_obj['Body'].read().decode('utf-8', errors='ignore')
-                                                geojson_data = json.loads(geojson_content)
-                                                
-                                                if 'features' in geojson_data:
-                                                    all_properties = {}
-                                                    for feature in geojson_data['features']:
-                                                        if 'properties' in feature:
-                                                            for prop_name, prop_value in feature['properties'].items():
-                                                                if prop_name not in all_properties:
-                                                                    all_properties[prop_name] = []
-                                                                all_properties[prop_name].append(prop_value)
-                                                    
-                                                    for col_name, values in all_properties.items():
-                                                        col_type = 'STRING'
-                                                        if values:
-                                                            integer_count = sum(1 for v in values if isinstance(v, (int, float)) and not isinstance(v, bool))
-                                                            if integer_count / len(values) > 0.8:
-                                                                col_type = 'INTEGER' if all(isinstance(v, int) for v in values if isinstance(v, (int, float))) else 'FLOAT'
-                                                        
-                                                        pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                        columns.append({
-                                                            "name": col_name,
-                                                            "type": col_type,
-                                                            "mode": "NULLABLE",
-                                                            "description": "GeoJSON property",
-                                                            "pii_detected": pii_detected,
-                                                            "pii_type": pii_type
-                                                        })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} properties in {object_name}'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not parse GeoJSON: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type in ['image', 'video', 'audio', 'pdf', 'doc', 'archive', 'binary']:
-                                            emit('progress', {'type': 'progress', 'message': f'📄 {file_type.upper()} file detected - extracting metadata for {object_name}...'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'excel':
-                                            try:
-                                                import pandas as pd
-                                                import io
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading entire Excel file: {object_name}...'}, namespace='/connectors')
-                                                excel_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                excel_buffer = io.BytesIO(excel_obj['Body'].read())
-                                                
-                                                df = pd.read_excel(excel_buffer, sheet_name=0, nrows=None)
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Analyzing {len(df)} rows in {object_name}...'}, namespace='/connectors')
-                                                
-                                                for col_name in df.columns:
-                                                    col_series = df[col_name]
-                                                    
-                                                    col_type = 'STRING'
-                                                    if pd.api.types.is_integer_dtype(col_series):
-                                                        col_type = 'INTEGER'
-                                                    elif pd.api.types.is_float_dtype(col_series):
-                                                        col_type = 'FLOAT'
-                                                    elif pd.api.types.is_bool_dtype(col_series):
-                                                        col_type = 'BOOLEAN'
-                                                    elif pd.api.types.is_datetime64_any_dtype(col_series):
-                                                        col_type = 'TIMESTAMP'
-                                                    
-                                                    pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
-                                                    
-                                                    columns.append({
-                                                        "name": str(col_name),
-                                                        "type": col_type,
-                                                        "mode": "NULLABLE",
-                                                        "description": "",
-                                                        "pii_detected": pii_detected,
-                                                        "pii_type": pii_type
-                                                    })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Analyzed {len(df)} rows, found {len(columns)} columns in {object_name}'}, namespace='/connectors')
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  pandas/openpyxl not installed, skipping Excel column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read Excel file: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'avro':
-                                            try:
-                                                import fastavro
-                                                import io
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading Avro file schema: {object_name}...'}, namespace='/connectors')
-                                                avro_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                avro_buffer = io.BytesIO(avro_obj['Body'].read())
-                                                
-                                                avro_file = fastavro.schemaless_reader(avro_buffer)
-                                                schema = fastavro.schema.load_schema(avro_file)
-                                                
-                                                for field in schema.get('fields', []):
-                                                    field_name = field.get('name', '')
-                                                    field_type = str(field.get('type', 'string'))
-                                                    
-                                                    pii_detected, pii_type = detect_pii_in_column(field_name, field_type)
-                                                    columns.append({
-                                                        "name": field_name,
-                                                        "type": field_type,
-                                                        "mode": "NULLABLE",
-                                                        "description": field.get('doc', ''),
-                                                        "pii_detected": pii_detected,
-                                                        "pii_type": pii_type
-                                                    })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} columns in {object_name}'}, namespace='/connectors')
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  fastavro not installed, skipping Avro column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read Avro schema: {str(e)}'}, namespace='/connectors')
-                                        
-                                        elif file_type == 'orc':
-                                            try:
-                                                import pyarrow.orc as orc
-                                                import io
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f'📖 Reading ORC file schema: {object_name}...'}, namespace='/connectors')
-                                                orc_obj = bucket_s3_client.get_object(Bucket=bucket_name_actual, Key=key)
-                                                orc_buffer = io.BytesIO(orc_obj['Body'].read())
-                                                
-                                                orc_file = orc.ORCFile(orc_buffer)
-                                                schema = orc_file.schema
-                                                
-                                                for field in schema:
-                                                    pii_detected, pii_type = detect_pii_in_column(field.name, str(field.type))
-                                                    columns.append({
-                                                        "name": field.name,
-                                                        "type": str(field.type),
-                                                        "mode": "NULLABLE" if field.nullable else "REQUIRED",
-                                                        "description": "",
-                                                        "pii_detected": pii_detected,
-                                                        "pii_type": pii_type
-                                                    })
-                                                
-                                                emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} columns in {object_name}'}, namespace='/connectors')
-                                            except ImportError:
-                                                emit('progress', {'type': 'progress', 'message': f'  pyarrow not installed, skipping ORC column detection'}, namespace='/connectors')
-                                            except Exception as e:
-                                                emit('progress', {'type': 'progress', 'message': f'  Could not read ORC schema: {str(e)}'}, namespace='/connectors')
-                                        
-                                        if columns:
-                                            emit('progress', {'type': 'progress', 'message': f' Found {len(columns)} columns in {object_name}'}, namespace='/connectors')
+                                    pending_assets.append(db_asset)
+                                    if len(pending_assets) >= db_helpers.ASSET_BULK_BATCH_SIZE:
+                                        db_helpers.save_assets_bulk(pending_assets, preserve=('sort_order',))
+                                        pending_assets = []
                                     
-                                    except Exception as col_error:
-                                        emit('progress', {'type': 'progress', 'message': f'  Could not extract columns from {object_name}: {str(col_error)}'}, namespace='/connectors')
-                                        columns = []
-                                
-                                asset_id = f"s3://{bucket_name_actual}/{key}"
-                                
-                                asset = {
-                                    "id": asset_id,
-                                    "name": key.split('/')[-1] if '/' in key else key,
-                                    "type": asset_type,
-                                    "catalog": bucket_name_actual,
-                                    "schema": '/'.join(key.split('/')[:-1]) if '/' in key else '',
-                                    "discovered_at": datetime.now().isoformat(),
-                                    "status": "active",
-                                    "description": f"S3 object in bucket {bucket_name_actual}",
-                                    "size_bytes": size,
-                                    "columns": columns,
-                                    "connector_id": connector_id,
-                                    "technical_metadata": {
-                                        "asset_id": asset_id,
-                                        "asset_type": asset_type,
-                                        "location": f"s3://{bucket_name_actual}/{key}",
-                                        "format": file_format,
-                                        "content_type": content_type,
-                                        "file_extension": file_extension,
-                                        "size_bytes": size,
-                                        "storage_class": storage_class,
-                                        "source_system": "Amazon S3",
-                                        "bucket_name": bucket_name_actual,
-                                        "object_key": key,
-                                        "object_path": key,
-                                        "region": bucket_region,
-                                        "last_modified": last_modified.isoformat() if isinstance(last_modified, datetime) else str(last_modified),
-                                        "etag": obj.get('ETag', '').strip('"') if 'ETag' in obj else ''
-                                    },
-                                    "operational_metadata": {
-                                        "status": "active",
-                                        "owner": "Unknown",
-                                        "last_modified": last_modified.isoformat() if isinstance(last_modified, datetime) else str(last_modified),
-                                        "last_accessed": datetime.now().isoformat(),
-                                        "access_count": "N/A",
-                                        "data_quality_score": 95
-                                    },
-                                    "business_metadata": {
-                                        "description": f"S3 object: {key}",
-                                        "business_owner": "Unknown",
-                                        "department": bucket_name_actual,
-                                        "classification": "internal",
-                                        "sensitivity_level": "low",
-                                        "tags": list(metadata.keys()) if metadata else []
-                                    }
-                                }
-                                
-                                discovered_assets.append(asset)
-                                assets_discovered += 1
-                                bucket_objects += 1
-                                
-                                try:
-                                    db_asset = {
-                                        'id': asset.get('id'),
-                                        'name': asset.get('name'),
-                                        'type': asset.get('type'),
-                                        'catalog': asset.get('catalog'),
-                                        'schema': asset.get('schema'),
-                                        'connector_id': asset.get('connector_id'),
-                                        'discovered_at': asset.get('discovered_at'),
-                                        'status': asset.get('status', 'active'),
-                                        'extra_data': asset
-                                    }
-                                    db_helpers.save_asset(db_asset)
-                                except Exception as save_err:
-                                    if bucket_objects <= 5:
-                                        print(f"  Failed to save asset immediately: {save_err}")
-                                
-                                format_display = file_format if file_format != 'Unknown' else (content_type if content_type else 'Unknown Format')
-                                
-                                emit('progress', {'type': 'progress', 'message': f' Discovered: {object_name} | Type: {asset_type} | Format: {format_display}'}, namespace='/connectors')
-                                
-                                if bucket_objects <= 50:
-                                    time.sleep(0.1)
-                                
-                                if bucket_objects % 100 == 0:
-                                    emit('progress', {'type': 'progress', 'message': f' Progress: {bucket_objects} objects discovered in {bucket_name_actual}...'}, namespace='/connectors')
+                                    if bucket_objects % 100 == 0:
+                                        progress(f' Progress: {bucket_objects} objects discovered in {bucket_name_actual}...')
+                        finally:
+                            if pending_assets:
+                                db_helpers.save_assets_bulk(pending_assets, preserve=('sort_order',))
                         
-                        emit('progress', {'type': 'progress', 'message': f' Completed bucket {bucket_name_actual}: {bucket_objects} objects discovered'}, namespace='/connectors')
+                        progress(f' Completed bucket {bucket_name_actual}: {bucket_objects} objects discovered')
                         
                     except ClientError as e:
                         error_code = e.response.get('Error', {}).get('Code', '')
                         if error_code == 'AccessDenied':
-                            emit('progress', {'type': 'progress', 'message': f'  Access denied to bucket {bucket_name_actual}, skipping...'}, namespace='/connectors')
+                            progress(f'  Access denied to bucket {bucket_name_actual}, skipping...')
                         else:
-                            emit('progress', {'type': 'progress', 'message': f'  Error accessing bucket {bucket_name_actual}: {str(e)}'}, namespace='/connectors')
+                            progress(f'  Error accessing bucket {bucket_name_actual}: {str(e)}')
                         continue
                 
                 active_connectors.append({
@@ -2506,56 +3403,39 @@ def create_app():
                     "assets_count": assets_discovered
                 })
                 
-                save_connectors()
-                
-                try:
-                    from api.s3 import trigger_airflow_dag
-                    trigger_result = trigger_airflow_dag('s3_asset_discovery')
-                    if trigger_result.get('success'):
-                        emit('progress', {'type': 'progress', 'message': ' Airflow DAG triggered - asset discovery will start immediately!'}, namespace='/connectors')
-                    else:
-                        print(f"  Airflow DAG trigger failed (will run on schedule): {trigger_result.get('message')}")
-                except Exception as e:
-                    print(f"  Could not trigger Airflow DAG (will run on schedule): {e}")
-                
                 print(f" Discovery complete: {assets_discovered} S3 assets discovered")
                 
-                with app.app_context():
-                    from database import Asset
-                    saved_count = db.session.query(Asset).filter(Asset.connector_id == connector_id).count()
-                    print(f" Verified: {saved_count} assets saved to database for connector {connector_id}")
-                
-                connector = next((c for c in active_connectors if c['id'] == connector_id), None)
-                if connector:
-                    connector['assets_count'] = assets_discovered
-                    save_connectors()
-                
-                save_assets()
+                progress('ℹ  Asset discovery will run via Airflow DAG (every 1 minute)')
                 
-                emit('progress', {'type': 'progress', 'message': 'ℹ  Asset discovery will run via Airflow DAG (every 1 minute)'}, namespace='/connectors')
+                save_connectors()
                 
+                progress_batcher.flush()
                 emit('complete', {'type': 'complete', 'message': f' Successfully discovered {assets_discovered} S3 assets!', 'discovered_assets': assets_discovered, 'connector_id': connector_id}, namespace='/connectors')
+                finalize_executor.submit(finalize_s3_discovery, connector_id)
                 return
                 
             except Exception as e:
                 print(f"S3 connection failed: {str(e)}")
+                progress_batcher.flush()
                 emit('error', {'type': 'error', 'message': f'Connection failed: {str(e)}'}, namespace='/connectors')
                 return
         
         elif connection_type == 'Service Account' and (selected_connector_id == 'gcs' or selected_connector_id == 'google-cloud-storage'):
-            print(f" GCS CONNECTOR MATCHED! Processing GCS connection...")
-            print(f"   connection_type='{connection_type}' (type: {type(connection_type)})")
-            print(f"   selected_connector_id='{selected_connector_id}' (type: {type(selected_connector_id)})")
-            print(f"   Condition check: connection_type == 'Service Account' = {connection_type == 'Service Account'}")
-            print(f"   Condition check: selected_connector_id == 'gcs' = {selected_connector_id == 'gcs'}")
+            if CONNECTOR_DEBUG:
+                print(f" GCS CONNECTOR MATCHED! Processing GCS connection...")
+                print(f"   connection_type='{connection_type}' (type: {type(connection_type)})")
+                print(f"   selected_connector_id='{selected_connector_id}' (type: {type(selected_connector_id)})")
+                print(f"   Condition check: connection_type == 'Service Account' = {connection_type == 'Service Account'}")
+                print(f"   Condition check: selected_connector_id == 'gcs' = {selected_connector_id == 'gcs'}")
             try:
                 from api.gcs import GCSConnectionTest, discover_gcs_assets
                 
-                print(f"   Config keys: {list(config.keys()) if config else 'None'}")
-                print(f"   serviceAccount: {'***' if config.get('serviceAccount') else 'None'}")
-                print(f"   projectId: {config.get('projectId')}")
-                print(f"   bucketName: {config.get('bucketName')}")
-                print(f"   name: {config.get('name')}")
+                if CONNECTOR_DEBUG:
+                    print(f"   Config keys: {list(config.keys()) if config else 'None'}")
+                    print(f"   serviceAccount: {'***' if config.get('serviceAccount') else 'None'}")
+                    print(f"   projectId: {config.get('projectId')}")
+                    print(f"   bucketName: {config.get('bucketName')}")
+                    print(f"   name: {config.get('name')}")
                 
                 connection_data = GCSConnectionTest(
                     service_account_json=config.get('serviceAccount'),
@@ -2566,104 +3446,82 @@ def create_app():
                 print(f" GCSConnectionTest created successfully")
             except Exception as e:
                 print(f" Error creating GCSConnectionTest: {e}")
-                import traceback
                 traceback.print_exc()
                 emit('error', {'type': 'error', 'message': f'Invalid GCS connection data: {str(e)}'}, namespace='/connectors')
                 return
             
             try:
-                emit('progress', {'type': 'progress', 'message': ' Authenticating with Google Cloud Storage...'}, namespace='/connectors')
+                sid = request.sid
+                progress_batcher = ProgressBatcher(
+                    lambda messages: socketio.emit('progress_batch', {'type': 'progress_batch', 'messages': messages}, namespace='/connectors', to=sid)
+                )
+                progress = progress_batcher.push
+                
+                progress(' Authenticating with Google Cloud Storage...')
                 
-                import json as json_module
                 try:
-                    service_account_info = json_module.loads(connection_data.service_account_json)
-                    placeholder_values = ["your-project-id", "YOUR_PRIVATE_KEY", "your-service-account@your-project.iam.gserviceaccount.com"]
+                    service_account_info = json_loads(connection_data.service_account_json)
                     
-                    service_account_str = str(service_account_info).lower()
-                    if any(placeholder.lower() in service_account_str for placeholder in placeholder_values):
+                    if _has_placeholder_credentials(service_account_info):
+                        progress_batcher.flush()
                         emit('error', {'type': 'error', 'message': ' Placeholder credentials detected in service account JSON. Please enter your actual Google Cloud service account credentials.'}, namespace='/connectors')
                         return
-                except json_module.JSONDecodeError:
+                except json.JSONDecodeError:
+                    progress_batcher.flush()
                     emit('error', {'type': 'error', 'message': ' Invalid JSON format in service account credentials.'}, namespace='/connectors')
                     return
                 
-                emit('progress', {'type': 'progress', 'message': f' Connecting to GCS project: {connection_data.project_id}...'}, namespace='/connectors')
+                progress(f' Connecting to GCS project: {connection_data.project_id}...')
                 
-                def progress_callback(message):
-                    emit('progress', {'type': 'progress', 'message': message}, namespace='/connectors')
-                
-                assets = discover_gcs_assets(
-                    connection_data.service_account_json,
-                    connection_data.project_id,
-                    connection_data.bucket_name,
-                    progress_callback=progress_callback
+                assets = _dedup_discovery(
+                    ('gcs', connection_data.project_id, connection_data.bucket_name, connection_data.service_account_json),
+                    lambda: discover_gcs_assets(
+                        connection_data.service_account_json,
+                        connection_data.project_id,
+                        connection_data.bucket_name,
+                        progress_callback=progress
+                    ),
+                    _clone_assets
                 )
                 
-                emit('progress', {'type': 'progress', 'message': f' Authentication successful! Connected to Google Cloud Storage'}, namespace='/connectors')
-                emit('progress', {'type': 'progress', 'message': f' Discovered {len(assets)} total assets from GCS'}, namespace='/connectors')
+                progress(f' Authentication successful! Connected to Google Cloud Storage')
+                progress(f' Discovered {len(assets)} total assets from GCS')
                 
                 connector_id = f"gcs_{connection_data.project_id}_{datetime.now().timestamp()}"
+                now_iso = datetime.now().isoformat()
                 
-                emit('progress', {'type': 'progress', 'message': f' Saving {len(assets)} assets to database...'}, namespace='/connectors')
-                saved_count = 0
-                failed_count = 0
+                db_rows = []
+                db_rows_append = db_rows.append
+                catalog_set = set()
                 
-                for idx, asset in enumerate(assets):
+                for asset in assets:
                     asset['connector_id'] = connector_id
-                    if 'discovered_at' not in asset or not asset.get('discovered_at'):
-                        asset['discovered_at'] = datetime.now().isoformat()
-                    if 'status' not in asset:
-                        asset['status'] = 'active'
-                    if 'name' not in asset or not asset.get('name'):
+                    if asset.get('catalog'):
+                        catalog_set.add(asset['catalog'])
+                    if not asset.get('discovered_at'):
+                        asset['discovered_at'] = now_iso
+                    asset.setdefault('status', 'active')
+                    if not asset.get('name'):
                         asset_id = asset.get('id', '')
                         if '/' in asset_id:
                             asset['name'] = asset_id.split('/')[-1]
                         else:
                             asset['name'] = asset_id
                     
-                    db_asset = {
-                        'id': asset.get('id'),
-                        'name': asset.get('name', 'Unknown'),
-                        'type': asset.get('type', 'File'),
-                        'catalog': asset.get('catalog', ''),
-                        'schema': asset.get('schema', ''),
-                        'connector_id': connector_id,
-                        'discovered_at': asset.get('discovered_at', datetime.now().isoformat()),
-                        'status': asset.get('status', 'active'),
-                        'extra_data': asset
-                    }
-                    
-                    try:
-                        if idx == 0:
-                            print(f"   ID: {db_asset.get('id')}")
-                            print(f"   Name: {db_asset.get('name')}")
-                            print(f"   Type: {db_asset.get('type')}")
-                            print(f"   Catalog: {db_asset.get('catalog')}")
-                            print(f"   Connector ID: {db_asset.get('connector_id')}")
-                            print(f"   Has extra_data: {'extra_data' in db_asset}")
-                        
-                        if db_helpers.save_asset(db_asset):
-                            saved_count += 1
-                            if idx < 3:
-                                print(f" Saved asset {idx+1}: {db_asset.get('id', 'Unknown')}")
-                        else:
-                            failed_count += 1
-                            print(f"  save_asset returned False for: {db_asset.get('id', 'Unknown')}")
-                            if failed_count <= 3:
-                                print(f"   Asset data: {db_asset}")
-                    except Exception as save_error:
-                        failed_count += 1
-                        print(f" Exception saving asset {db_asset.get('id', 'Unknown')}: {save_error}")
-                        import traceback
-                        if failed_count <= 3:
-                            traceback.print_exc()
-                    
-                    discovered_assets.append(asset)
-                    
-                    if (idx + 1) % 10 == 0:
-                        emit('progress', {'type': 'progress', 'message': f'   Saved {idx + 1}/{len(assets)} assets...'}, namespace='/connectors')
+                    db_rows_append(_gcs_db_asset(asset, connector_id))
+                discovered_assets.extend(assets)
                 
-                emit('progress', {'type': 'progress', 'message': f' Saved {saved_count} assets to database' + (f' ({failed_count} failed)' if failed_count > 0 else '')}, namespace='/connectors')
+                if CONNECTOR_DEBUG and db_rows:
+                    db_asset = db_rows[0]
+                    print(f"   ID: {db_asset.get('id')}")
+                    print(f"   Name: {db_asset.get('name')}")
+                    print(f"   Type: {db_asset.get('type')}")
+                    print(f"   Catalog: {db_asset.get('catalog')}")
+                    print(f"   Connector ID: {db_asset.get('connector_id')}")
+                    print(f"   Has extra_data: {'extra_data' in db_asset}")
+                
+                enqueue_asset_writes(connector_id, sid, db_rows)
+                progress(f' Queued {len(db_rows)} assets for saving to database')
                 
                 connector_config = {
                     "service_account_json": connection_data.service_account_json,
@@ -2671,10 +3529,7 @@ def create_app():
                     "bucket_name": connection_data.bucket_name
                 }
                 
-                if connection_data.bucket_name:
-                    bucket_names = [connection_data.bucket_name]
-                else:
-                    bucket_names = list(set(asset.get('catalog') for asset in assets if asset.get('catalog')))
+                bucket_names = [connection_data.bucket_name] if connection_data.bucket_name else list(catalog_set)
                 
                 active_connectors.append({
                     "id": connector_id,
@@ -2682,16 +3537,15 @@ def create_app():
                     "type": "Google Cloud Storage",
                     "status": "active",
                     "enabled": True,
-                    "last_run": datetime.now().isoformat(),
+                    "last_run": now_iso,
                     "config": connector_config,
                     "assets_count": len(assets)
                 })
                 
                 save_connectors()
-                save_assets()
                 
                 try:
-                    emit('progress', {'type': 'progress', 'message': ' Setting up real-time event monitoring...'}, namespace='/connectors')
+                    progress(' Setting up real-time event monitoring...')
                     
                     from api.gcs import setup_gcs_event_notifications
                     
@@ -2702,7 +3556,7 @@ def create_app():
                     )
                     
                     if event_result['success']:
-                        connector = next((c for c in active_connectors if c['id'] == connector_id), None)
+                        connector = find_connector(connector_id)
                         if connector:
                             connector['config']['pubsub_topic_name'] = event_result.get('pubsub_topic_name')
                             connector['config']['pubsub_topic_path'] = event_result.get('pubsub_topic_path')
@@ -2712,24 +3566,25 @@ def create_app():
                             connector['config']['configured_buckets'] = event_result.get('configured_buckets', [])
                             save_connectors()
                         
-                        emit('progress', {'type': 'progress', 'message': f' Real-time monitoring active via Pub/Sub! Listening for changes in {len(event_result["configured_buckets"])} bucket(s)...'}, namespace='/connectors')
+                        progress(f' Real-time monitoring active via Pub/Sub! Listening for changes in {len(event_result["configured_buckets"])} bucket(s)...')
                     else:
                         error_msg = event_result.get("error", "Unknown error")
                         if "ngrok" in error_msg.lower():
-                            emit('progress', {'type': 'progress', 'message': f'  Event monitoring setup skipped: {error_msg}. You can set it up later via the API.'}, namespace='/connectors')
+                            progress(f'  Event monitoring setup skipped: {error_msg}. You can set it up later via the API.')
                         else:
-                            emit('progress', {'type': 'progress', 'message': f'  Could not set up event monitoring: {error_msg}'}, namespace='/connectors')
+                            progress(f'  Could not set up event monitoring: {error_msg}')
                 except Exception as e:
                     print(f"  Error setting up GCS event notifications: {e}")
-                    import traceback
                     traceback.print_exc()
-                    emit('progress', {'type': 'progress', 'message': '  Real-time monitoring setup failed, but connector is active'}, namespace='/connectors')
+                    progress('  Real-time monitoring setup failed, but connector is active')
                 
+                progress_batcher.flush()
                 emit('complete', {'type': 'complete', 'message': f' Successfully discovered {len(assets)} GCS assets!', 'discovered_assets': len(assets), 'connector_id': connector_id}, namespace='/connectors')
                 return
                 
             except Exception as e:
                 print(f"GCS connection failed: {str(e)}")
+                progress_batcher.flush()
                 emit('error', {'type': 'error', 'message': f'Connection failed: {str(e)}'}, namespace='/connectors')
                 return
         
@@ -2750,14 +3605,25 @@ def create_app():
                 return
             
             try:
-                emit('progress', {'type': 'progress', 'message': ' 🔐 Authenticating with Azure Storage Account...'}, namespace='/connectors')
+                sid = request.sid
+                progress_batcher = ProgressBatcher(
+                    lambda messages: socketio.emit('progress_batch', {'type': 'progress_batch', 'messages': messages}, namespace='/connectors', to=sid)
+                )
+                progress = progress_batcher.push
                 
-                result = discover_azure_all_assets(
-                    connection_data.account_name,
-                    connection_data.account_key,
-                    connection_data.connection_string,
-                    connection_data.container_name,
-                    connection_data.share_name
+                progress(' 🔐 Authenticating with Azure Storage Account...')
+                
+                result = _dedup_discovery(
+                    ('azure', connection_data.account_name, connection_data.account_key, connection_data.connection_string,
+                     connection_data.container_name, connection_data.share_name),
+                    lambda: discover_azure_all_assets(
+                        connection_data.account_name,
+                        connection_data.account_key,
+                        connection_data.connection_string,
+                        connection_data.container_name,
+                        connection_data.share_name
+                    ),
+                    _clone_azure_result
                 )
                 
                 assets = result.get('all_assets', [])
@@ -2767,45 +3633,46 @@ def create_app():
                 queues = result.get('queues', [])
                 summary = result.get('summary', {})
                 
-                emit('progress', {'type': 'progress', 'message': f' ✅ Authentication successful!'}, namespace='/connectors')
-                emit('progress', {'type': 'progress', 'message': f' 📦 Blob Storage: {len(blob_containers)} container(s), {summary.get("blob_assets", 0)} asset(s)'}, namespace='/connectors')
-                emit('progress', {'type': 'progress', 'message': f' 📁 Azure Files: {len(file_shares)} file share(s), {summary.get("file_assets", 0)} asset(s)'}, namespace='/connectors')
-                emit('progress', {'type': 'progress', 'message': f' 📊 Azure Tables: {len(tables)} table(s)'}, namespace='/connectors')
-                emit('progress', {'type': 'progress', 'message': f' 📬 Azure Queues: {len(queues)} queue(s)'}, namespace='/connectors')
+                progress(f' ✅ Authentication successful!')
+                progress(f' 📦 Blob Storage: {len(blob_containers)} container(s), {summary.get("blob_assets", 0)} asset(s)')
+                progress(f' 📁 Azure Files: {len(file_shares)} file share(s), {summary.get("file_assets", 0)} asset(s)')
+                progress(f' 📊 Azure Tables: {len(tables)} table(s)')
+                progress(f' 📬 Azure Queues: {len(queues)} queue(s)')
                 
                 # Show blob containers
                 for container in blob_containers[:5]:
-                    emit('progress', {'type': 'progress', 'message': f'   📦 Container: {container["name"]} ({container["asset_count"]} asset(s))'}, namespace='/connectors')
+                    progress(f'   📦 Container: {container["name"]} ({container["asset_count"]} asset(s))')
                 if len(blob_containers) > 5:
-                    emit('progress', {'type': 'progress', 'message': f'   ... and {len(blob_containers) - 5} more container(s)'}, namespace='/connectors')
+                    progress(f'   ... and {len(blob_containers) - 5} more container(s)')
                 
                 # Show file shares
                 for share in file_shares[:5]:
-                    emit('progress', {'type': 'progress', 'message': f'   📁 File Share: {share["name"]} ({share["asset_count"]} asset(s))'}, namespace='/connectors')
+                    progress(f'   📁 File Share: {share["name"]} ({share["asset_count"]} asset(s))')
                 if len(file_shares) > 5:
-                    emit('progress', {'type': 'progress', 'message': f'   ... and {len(file_shares) - 5} more file share(s)'}, namespace='/connectors')
+                    progress(f'   ... and {len(file_shares) - 5} more file share(s)')
                 
                 # Show tables
                 for table_name in tables[:10]:
-                    emit('progress', {'type': 'progress', 'message': f'   📊 Table: {table_name}'}, namespace='/connectors')
+                    progress(f'   📊 Table: {table_name}')
                 if len(tables) > 10:
-                    emit('progress', {'type': 'progress', 'message': f'   ... and {len(tables) - 10} more table(s)'}, namespace='/connectors')
+                    progress(f'   ... and {len(tables) - 10} more table(s)')
                 
                 # Show queues
                 for queue_name in queues[:10]:
-                    emit('progress', {'type': 'progress', 'message': f'   📬 Queue: {queue_name}'}, namespace='/connectors')
+                    progress(f'   📬 Queue: {queue_name}')
                 if len(queues) > 10:
-                    emit('progress', {'type': 'progress', 'message': f'   ... and {len(queues) - 10} more queue(s)'}, namespace='/connectors')
+                    progress(f'   ... and {len(queues) - 10} more queue(s)')
                 
-                emit('progress', {'type': 'progress', 'message': f' ✅ Discovered {len(assets)} total assets across all Azure storage types'}, namespace='/connectors')
+                progress(f' ✅ Discovered {len(assets)} total assets across all Azure storage types')
                 
                 connector_id = f"azure_data_storage_{connection_data.account_name}_{datetime.now().timestamp()}"
+                now_iso = datetime.now().isoformat()
                 
                 for asset in assets:
                     asset['connector_id'] = connector_id
-                    asset['discovered_at'] = datetime.now().isoformat()
-                    db_helpers.save_asset(asset)
-                    discovered_assets.append(asset)
+                    asset['discovered_at'] = now_iso
+                discovered_assets.extend(assets)
+                enqueue_asset_writes(connector_id, sid, [dict(asset) for asset in assets])
                 
                 active_connectors.append({
                     "id": connector_id,
@@ -2813,7 +3680,7 @@ def create_app():
                     "type": "Azure Data Storage",
                     "status": "active",
                     "enabled": True,
-                    "last_run": datetime.now().isoformat(),
+                    "last_run": now_iso,
                     "config": {
                         "account_name": connection_data.account_name,
                         "account_key": connection_data.account_key,
@@ -2826,8 +3693,8 @@ def create_app():
                 })
                 
                 save_connectors()
-                save_assets()
                 
+                progress_batcher.flush()
                 emit('complete', {
                     'type': 'complete',
                     'message': f' Successfully discovered {len(assets)} Azure assets! (Blob: {summary.get("blob_assets", 0)}, Files: {summary.get("file_assets", 0)}, Tables: {len(tables)}, Queues: {len(queues)})',
@@ -2844,26 +3711,27 @@ def create_app():
                 
             except Exception as e:
                 print(f"Azure Data Storage connection failed: {str(e)}")
-                import traceback
                 traceback.print_exc()
+                progress_batcher.flush()
                 emit('error', {'type': 'error', 'message': f'Connection failed: {str(e)}'}, namespace='/connectors')
                 return
         
         else:
             print(f" NO MATCHING CONNECTOR HANDLER FOUND!")
-            print(f"   Received connection_type: '{connection_type}' (type: {type(connection_type)}, repr: {repr(connection_type)})")
-            print(f"   Received selected_connector_id: '{selected_connector_id}' (type: {type(selected_connector_id)}, repr: {repr(selected_connector_id)})")
-            print(f"   Raw data received: {data}")
-            print(f"   Available handlers:")
-            print(f"     - BigQuery: connection_type == 'Service Account' ({connection_type == 'Service Account'}) AND selected_connector_id == 'bigquery' ({selected_connector_id == 'bigquery'})")
-            print(f"     - GCS: connection_type == 'Service Account' ({connection_type == 'Service Account'}) AND selected_connector_id == 'gcs' ({selected_connector_id == 'gcs'})")
-            print(f"     - Starburst: connection_type == 'API Token' ({connection_type == 'API Token'}) AND selected_connector_id == 'starburst' ({selected_connector_id == 'starburst'})")
-            print(f"     - S3: connection_type == 'Access Key' ({connection_type == 'Access Key'}) AND selected_connector_id == 's3' ({selected_connector_id == 's3'})")
-            print(f"     - Azure Blob: connection_type in ['Account Key', 'Connection String'] ({connection_type in ['Account Key', 'Connection String']}) AND selected_connector_id == 'azure-blob' ({selected_connector_id == 'azure-blob'})")
-            print(f"   Checking GCS condition explicitly:")
-            print(f"     connection_type == 'Service Account': {connection_type == 'Service Account'}")
-            print(f"     selected_connector_id == 'gcs': {selected_connector_id == 'gcs'}")
-            print(f"     Both conditions: {connection_type == 'Service Account' and selected_connector_id == 'gcs'}")
+            if CONNECTOR_DEBUG:
+                print(f"   Received connection_type: '{connection_type}' (type: {type(connection_type)}, repr: {repr(connection_type)})")
+                print(f"   Received selected_connector_id: '{selected_connector_id}' (type: {type(selected_connector_id)}, repr: {repr(selected_connector_id)})")
+                print(f"   Raw data received: {data}")
+                print(f"   Available handlers:")
+                print(f"     - BigQuery: connection_type == 'Service Account' ({connection_type == 'Service Account'}) AND selected_connector_id == 'bigquery' ({selected_connector_id == 'bigquery'})")
+                print(f"     - GCS: connection_type == 'Service Account' ({connection_type == 'Service Account'}) AND selected_connector_id == 'gcs' ({selected_connector_id == 'gcs'})")
+                print(f"     - Starburst: connection_type == 'API Token' ({connection_type == 'API Token'}) AND selected_connector_id == 'starburst' ({selected_connector_id == 'starburst'})")
+                print(f"     - S3: connection_type == 'Access Key' ({connection_type == 'Access Key'}) AND selected_connector_id == 's3' ({selected_connector_id == 's3'})")
+                print(f"     - Azure Blob: connection_type in ['Account Key', 'Connection String'] ({connection_type in ['Account Key', 'Connection String']}) AND selected_connector_id == 'azure-blob' ({selected_connector_id == 'azure-blob'})")
+                print(f"   Checking GCS condition explicitly:")
+                print(f"     connection_type == 'Service Account': {connection_type == 'Service Account'}")
+                print(f"     selected_connector_id == 'gcs': {selected_connector_id == 'gcs'}")
+                print(f"     Both conditions: {connection_type == 'Service Account' and selected_connector_id == 'gcs'}")
             emit('error', {'type': 'error', 'message': f'Unknown connector type or invalid connection request. Received: connection_type="{connection_type}", connector_id="{selected_connector_id}"'}, namespace='/connectors')
             return
             
@@ -2890,32 +3758,26 @@ def create_app():
             
             enabled_connectors = [c for c in active_connectors if c.get("enabled")]
             active_connector_ids = set(conn['id'] for conn in enabled_connectors)
+            enabled_types = set(conn.get('type') for conn in enabled_connectors)
+            active_prefixes = tuple(
+                f'{prefix}_' for prefix, connector_type in CONNECTOR_ID_PREFIX_TYPES.items()
+                if connector_type in enabled_types
+            )
             
-            filtered_assets = []
+            total_assets = 0
             catalogs = set()
             
             for asset in discovered_assets:
                 asset_connector_id = asset.get('connector_id', '')
                 
-                if asset_connector_id in active_connector_ids:
-                    filtered_assets.append(asset)
-                    catalogs.add(asset.get("catalog", "Unknown"))
-                elif asset_connector_id.startswith('s3_') and any(conn.get('type') == 'Amazon S3' and conn.get('enabled') for conn in active_connectors):
-                    filtered_assets.append(asset)
-                    catalogs.add(asset.get("catalog", "Unknown"))
-                elif asset_connector_id.startswith('starburst_') and any(conn.get('type') == 'Starburst Galaxy' and conn.get('enabled') for conn in active_connectors):
-                    filtered_assets.append(asset)
-                    catalogs.add(asset.get("catalog", "Unknown"))
-                elif asset_connector_id.startswith('bq_') and any(conn.get('type') == 'BigQuery' and conn.get('enabled') for conn in active_connectors):
-                    filtered_assets.append(asset)
+                if asset_connector_id in active_connector_ids or asset_connector_id.startswith(active_prefixes):
+                    total_assets += 1
                     catalogs.add(asset.get("catalog", "Unknown"))
             
             last_scan = None
             if enabled_connectors:
                 try:
-                    last_runs = [datetime.fromisoformat(c["last_run"]) for c in enabled_connectors if c.get("last_run")]
-                    if last_runs:
-                        last_scan = max(last_runs)
+                    last_scan = _latest_run(enabled_connectors)
                 except (ValueError, KeyError, TypeError) as e:
                     print(f"Warning: Error parsing last_run dates: {e}")
                     last_scan = None
@@ -2923,20 +3785,19 @@ def create_app():
             monitoring_status = "Active" if enabled_connectors else "Disabled"
             
             stats = DashboardStats(
-                total_assets=len(filtered_assets),
+                total_assets=total_assets,
                 total_catalogs=len(catalogs),
                 active_connectors=len(enabled_connectors),
                 last_scan=last_scan,
                 monitoring_status=monitoring_status
             )
             
-            print(f" Dashboard stats - assets: {len(filtered_assets)}, connectors: {len(enabled_connectors)}, catalogs: {len(catalogs)}")
+            print(f" Dashboard stats - assets: {total_assets}, connectors: {len(enabled_connectors)}, catalogs: {len(catalogs)}")
             
             result = stats.model_dump()
             return jsonify(result)
         except Exception as e:
             print(f" Error in get_dashboard_stats: {str(e)}")
-            import traceback
             traceback.print_exc()
             try:
                 return jsonify(DashboardStats(
@@ -2962,7 +3823,7 @@ def create_app():
         enabled_connectors = len([c for c in active_connectors if c["enabled"]])
         last_scan = None
         if active_connectors:
-            last_scan = max([datetime.fromisoformat(c["last_run"]) for c in active_connectors])
+            last_scan = _latest_run(active_connectors)
         
         return jsonify(SystemHealth(
             status="healthy",
@@ -2977,7 +3838,10 @@ def create_app():
         nonlocal active_connectors, discovered_assets
         try:
             active_connector_ids = set(conn['id'] for conn in active_connectors)
-            filtered_assets = [a for a in discovered_assets if a.get('connector_id', '') in active_connector_ids]
+            assets_by_upper_type = defaultdict(list)
+            for a in discovered_assets:
+                if a.get('connector_id', '') in active_connector_ids:
+                    assets_by_upper_type[a.get('type', '').upper()].append(a)
             
             entity_types = {
                 'data_sources': {'types': ['Connector'], 'field': 'connector_id'},
@@ -2995,10 +3859,8 @@ def create_app():
                 if entity_name == 'data_sources':
                     relevant_assets = [{'id': c['id'], 'name': c['name'], 'type': c.get('type', 'Unknown')} for c in active_connectors]
                 else:
-                    relevant_assets = [
-                        a for a in filtered_assets 
-                        if a.get('type', '').upper() in [t.upper() for t in entity_config['types']]
-                    ]
+                    type_set = {t.upper() for t in entity_config['types']}
+                    relevant_assets = [a for asset_type in type_set for a in assets_by_upper_type.get(asset_type, ())]
                 
                 total_count = len(relevant_assets)
                 if total_count == 0:
@@ -3021,52 +3883,45 @@ def create_app():
                 }
                 
                 for asset in relevant_assets:
-                    is_documented = True
-                    doc_fields = []
+                    business_metadata = asset.get('business_metadata') or _EMPTY
+                    extra_data = asset.get('extra_data') or _EMPTY
+                    operational_metadata = asset.get('operational_metadata') or _EMPTY
                     
                     has_description = bool(
                         asset.get('description') or 
-                        asset.get('business_metadata', {}).get('description') or
-                        asset.get('extra_data', {}).get('description')
+                        business_metadata.get('description') or
+                        extra_data.get('description')
                     )
                     if not has_description:
-                        is_documented = False
                         missing_fields_summary['description'] += 1
-                        doc_fields.append('description')
                     
                     has_owner = bool(
                         asset.get('owner') or
-                        asset.get('business_metadata', {}).get('business_owner') or
-                        asset.get('operational_metadata', {}).get('owner')
+                        business_metadata.get('business_owner') or
+                        operational_metadata.get('owner')
                     )
                     if not has_owner:
                         missing_fields_summary['owner'] += 1
-                        doc_fields.append('owner')
                     
                     has_classification = bool(
                         asset.get('classification') or
-                        asset.get('business_metadata', {}).get('classification')
+                        business_metadata.get('classification')
                     )
                     if not has_classification:
                         missing_fields_summary['classification'] += 1
-                        doc_fields.append('classification')
                     
-                    columns = asset.get('columns', []) or asset.get('extra_data', {}).get('columns', [])
-                    if columns:
-                        columns_with_desc = sum(1 for col in columns if col.get('description') and col.get('description').strip() and col.get('description') != '-')
-                        if columns_with_desc == 0:
-                            missing_fields_summary['column_descriptions'] += 1
-                        column_completeness = (columns_with_desc / len(columns)) * 100 if columns else 0
-                        if column_completeness < 50:
-                            doc_fields.append('column_descriptions')
+                    columns = asset.get('columns') or extra_data.get('columns')
+                    if columns and not any(
+                        col.get('description') and col['description'].strip() and col['description'] != '-' for col in columns
+                    ):
+                        missing_fields_summary['column_descriptions'] += 1
                     
                     has_tags = bool(
                         asset.get('tags') or
-                        asset.get('business_metadata', {}).get('tags')
+                        business_metadata.get('tags')
                     )
                     if not has_tags:
                         missing_fields_summary['tags'] += 1
-                        doc_fields.append('tags')
                     
                     if has_description and (has_owner or has_classification or has_tags):
                         documented_count += 1
@@ -3094,7 +3949,6 @@ def create_app():
             })
         except Exception as e:
             print(f"Error calculating catalog completeness: {str(e)}")
-            import traceback
             traceback.print_exc()
             return jsonify({
                 'overall_completeness': 0.0,
@@ -3157,7 +4011,6 @@ def create_app():
                 'error': f'Request error: {str(e)}'
             }), 500
         except Exception as e:
-            import traceback
             traceback.print_exc()
             return jsonify({
                 'success': False,
@@ -3166,7 +4019,6 @@ def create_app():
             
         except Exception as e:
             print(f"Error in Gemini API proxy: {str(e)}")
-            import traceback
             traceback.print_exc()
             return jsonify({
                 'success': False,
@@ -3177,216 +4029,68 @@ def create_app():
     def get_assets():
         try:
             nonlocal active_connectors, discovered_assets
-            import math
             
             with app.app_context():
                 active_connectors = load_connectors()
-                discovered_assets = load_assets()
-                app.config['discovered_assets'] = discovered_assets
                 app.config['active_connectors'] = active_connectors
         except Exception as e:
             print(f" Error in get_assets (loading data): {e}")
-            import traceback
             traceback.print_exc()
             return jsonify({'error': f'Error loading assets: {str(e)}'}), 500
         
-        page = int(request.args.get("page", 0))
-        size = int(request.args.get("size", 50))
-        search = request.args.get("search")
-        catalog = request.args.get("catalog")
-        asset_type = request.args.get("asset_type")
-        
-        enabled_connectors = [c for c in active_connectors if c.get("enabled", True)]
-        active_connector_ids = set(conn['id'] for conn in enabled_connectors)
-        filtered_assets = []
-        
-        
-        enabled_s3_connectors = any(conn.get('type') == 'Amazon S3' and conn.get('enabled', True) for conn in enabled_connectors)
-        enabled_starburst_connectors = any(conn.get('type') == 'Starburst Galaxy' and conn.get('enabled', True) for conn in enabled_connectors)
-        enabled_bigquery_connectors = any(conn.get('type') == 'BigQuery' and conn.get('enabled', True) for conn in enabled_connectors)
-        
-        
-        starburst_asset_ids = [a.get('connector_id', '') for a in discovered_assets if a.get('connector_id', '').startswith('starburst_')]
-        
-        for asset in discovered_assets:
-            asset_connector_id = asset.get('connector_id', '')
-            
-            if asset_connector_id in active_connector_ids:
-                filtered_assets.append(asset)
-            elif asset_connector_id.startswith('s3_') and enabled_s3_connectors:
-                filtered_assets.append(asset)
-            elif asset_connector_id.startswith('starburst_') and enabled_starburst_connectors:
-                filtered_assets.append(asset)
-            elif asset_connector_id.startswith('bq_') and enabled_bigquery_connectors:
-                filtered_assets.append(asset)
-            elif 'test' in asset_connector_id.lower() and enabled_s3_connectors:
-                filtered_assets.append(asset)
-        
-        starburst_count = len([a for a in filtered_assets if a.get('connector_id', '').startswith('starburst_')])
-        
-        if search:
-            search_lower = search.lower()
-            filtered_assets = [
-                asset for asset in filtered_assets
-                if (search_lower in asset.get('name', '').lower() or
-                    search_lower in asset.get('type', '').lower() or
-                    search_lower in asset.get('catalog', '').lower())
-            ]
-        
-        if catalog:
-            filtered_assets = [
-                asset for asset in filtered_assets
-                if asset.get('catalog') == catalog
-            ]
-        
-        if asset_type:
-            filtered_assets = [
-                asset for asset in filtered_assets
-                if asset.get('type') == asset_type
-            ]
-        
-        def get_sort_key(asset):
-            sort_order = asset.get('sort_order')
-            if sort_order is not None:
-                try:
-                    sort_order_int = int(sort_order)
-                    return (1, sort_order_int)
-                except (ValueError, TypeError):
-                    pass
-            
-            discovered = get_discovered_at(asset)
-            if isinstance(discovered, datetime):
-                timestamp_ms = int(discovered.timestamp() * 1000)
-                return (0, timestamp_ms)
-            
-            return (-1, 0)
-        
-        def get_discovered_at(asset):
-            discovered = asset.get('discovered_at')
-            if discovered is None:
-                return datetime.min
-            
-            if isinstance(discovered, datetime):
-                return discovered
-            
-            if isinstance(discovered, str):
-                try:
-                    if 'Z' in discovered or '+' in discovered:
-                        cleaned = discovered.replace('Z', '+00:00')
-                        if '+' not in cleaned and '-' in cleaned and 'T' in cleaned:
-                            cleaned = discovered + '+00:00'
-                        try:
-                            return datetime.fromisoformat(cleaned)
-                        except:
-                            cleaned_no_micro = cleaned.split('.')[0] + '+00:00' if '+' in cleaned else cleaned.split('.')[0]
-                            return datetime.fromisoformat(cleaned_no_micro)
-                    
-                    cleaned = discovered.split('.')[0] if '.' in discovered else discovered
-                    cleaned = cleaned.replace('Z', '').replace('+00:00', '').strip()
-                    
-                    if 'T' in cleaned:
-                        try:
-                            if '.' in cleaned:
-                                return datetime.strptime(cleaned, '%Y-%m-%dT%H:%M:%S.%f')
-                            else:
-                                return datetime.strptime(cleaned, '%Y-%m-%dT%H:%M:%S')
-                        except:
-                            try:
-                                return datetime.fromisoformat(cleaned)
-                            except:
-                                cleaned_no_micro = cleaned.split('.')[0]
-                                return datetime.strptime(cleaned_no_micro, '%Y-%m-%dT%H:%M:%S')
-                    elif ' ' in cleaned:
-                        try:
-                            if '.' in cleaned:
-                                return datetime.strptime(cleaned, '%Y-%m-%d %H:%M:%S.%f')
-                            else:
-                                return datetime.strptime(cleaned, '%Y-%m-%d %H:%M:%S')
-                        except:
-                            cleaned_no_micro = cleaned.split('.')[0]
-                            return datetime.strptime(cleaned_no_micro, '%Y-%m-%d %H:%M:%S')
-                    else:
-                        return datetime.strptime(cleaned, '%Y-%m-%d')
-                except Exception as e:
-                    print(f"  Error parsing discovered_at '{discovered}': {e}")
-                    return datetime.min
-            
-            return datetime.min
-        
-        try:
-            filtered_assets.sort(key=get_sort_key, reverse=True)
-            
-            test_assets_at_top = [a for a in filtered_assets[:10] if 'TEST_FILE' in a.get('name', '')]
-            
-            if len(filtered_assets) > 0:
-                for i, asset in enumerate(filtered_assets[:5], 1):
-                    name = asset.get('name', 'Unknown')[:50]
-                    discovered = asset.get('discovered_at', 'No date')
-                    print(f"   {i}. {name} - Discovered: {discovered}")
-        except Exception as sort_error:
-            print(f"  Error sorting assets: {sort_error}")
-            import traceback
-            traceback.print_exc()
-            print("  Continuing without sorting...")
-        
-        total_assets = len(filtered_assets)
-        total_pages = math.ceil(total_assets / size) if total_assets > 0 else 0
-        start_idx = page * size
-        end_idx = start_idx + size
-        paginated_assets = filtered_assets[start_idx:end_idx]
-        
-        try:
-            return jsonify({
-                "assets": paginated_assets,
-                "pagination": {
-                    "page": page,
-                    "size": size,
-                    "total": total_assets,
-                    "total_pages": total_pages,
-                    "has_next": page < total_pages - 1,
-                    "has_prev": page > 0
-                }
-            })
-        except Exception as e:
-            print(f" Error in get_assets (returning response): {e}")
-            import traceback
-            traceback.print_exc()
-            return jsonify({'error': f'Error serializing response: {str(e)}'}), 500
-
-    def detect_pii_in_column(column_name: str, column_type: str) -> tuple[bool, Optional[str]]:
-        column_name_lower = column_name.lower()
-        
-        if any(pattern in column_name_lower for pattern in ['email', 'e_mail', 'mail']):
-            return True, "EMAIL"
-        
-        if any(pattern in column_name_lower for pattern in ['first_name', 'firstname', 'last_name', 'lastname', 
-                                                              'full_name', 'fullname', 'name', 'customer_name']):
-            return True, "NAME"
-        
-        if any(pattern in column_name_lower for pattern in ['phone', 'mobile', 'cell', 'telephone', 'contact_number']):
-            return True, "PHONE"
-        
-        if any(pattern in column_name_lower for pattern in ['address', 'street', 'city', 'zipcode', 'zip_code', 'postal']):
-            return True, "ADDRESS"
+        args = request.args
+        page = max(0, int(args.get("page", 0)))
+        size = min(MAX_ASSETS_PAGE_SIZE, max(1, int(args.get("size", 50))))
+        search = args.get("search")
+        catalog = args.get("catalog")
+        asset_type = args.get("asset_type")
         
-        if any(pattern in column_name_lower for pattern in ['ssn', 'social_security', 'national_id', 'passport', 'license']):
-            return True, "SENSITIVE_ID"
+        active_connector_ids, enabled_types, _, _ = connector_scope()
+        enabled_s3_connectors = 'Amazon S3' in enabled_types
+        active_prefixes = tuple(
+            f'{prefix}_' for prefix, connector_type in CONNECTOR_ID_PREFIX_TYPES.items()
+            if connector_type in enabled_types
+        )
         
-        if any(pattern in column_name_lower for pattern in ['credit_card', 'card_number', 'ccn', 'payment_card']):
-            return True, "CREDIT_CARD"
+        def assets_page_response(paginated_assets, total_assets):
+            total_pages = -(-total_assets // size)
+            try:
+                return ojson({
+                    "assets": paginated_assets,
+                    "pagination": {
+                        "page": page,
+                        "size": size,
+                        "total": total_assets,
+                        "total_pages": total_pages,
+                        "has_next": page < total_pages - 1,
+                        "has_prev": page > 0
+                    }
+                })
+            except Exception as e:
+                print(f" Error in get_assets (returning response): {e}")
+                traceback.print_exc()
+                return jsonify({'error': f'Error serializing response: {str(e)}'}), 500
         
-        if any(pattern in column_name_lower for pattern in ['birth_date', 'birthdate', 'dob', 'date_of_birth']):
-            return True, "DATE_OF_BIRTH"
+        with app.app_context():
+            page_result = db_helpers.query_assets(
+                active_connector_ids, active_prefixes, enabled_s3_connectors,
+                search=search, catalog=catalog, asset_type=asset_type,
+                limit=size, offset=page * size
+            )
+        if page_result is not None:
+            return assets_page_response(*page_result)
         
-        if any(pattern in column_name_lower for pattern in ['account_number', 'account_no', 'bank_account']):
-            return True, "ACCOUNT_NUMBER"
+        with app.app_context():
+            discovered_assets = load_assets()
         
-        return False, None
+        return assets_page_response(*db_helpers.page_assets(
+            discovered_assets, active_connector_ids, active_prefixes, enabled_s3_connectors,
+            search=search, catalog=catalog, asset_type=asset_type,
+            limit=size, offset=page * size, parse_discovered_at=_parse_discovered_at
+        ))
 
     @app.route("/api/assets/<path:asset_id>", methods=["GET", "PUT", "PATCH"])
     def get_asset_detail(asset_id: str):
-        nonlocal active_connectors, discovered_assets
-        
         if request.method in ["PUT", "PATCH"]:
             try:
                 data = request.get_json()
@@ -3394,13 +4098,7 @@ def create_app():
                     return jsonify({"error": "No data provided"}), 400
                 
                 with app.app_context():
-                    discovered_assets = load_assets()
-                
-                asset = None
-                for a in discovered_assets:
-                    if a.get("id") == asset_id:
-                        asset = a
-                        break
+                    asset = db_helpers.get_asset(asset_id)
                 
                 if not asset:
                     return jsonify({"error": "Asset not found"}), 404
@@ -3443,13 +4141,15 @@ def create_app():
                 
                 if db_helpers.save_asset(db_asset):
                     with app.app_context():
-                        discovered_assets = load_assets()
+                        updated_asset = db_helpers.get_asset(asset_id)
                     
-                    updated_asset = None
-                    for a in discovered_assets:
-                        if a.get("id") == asset_id:
-                            updated_asset = a
-                            break
+                    if updated_asset is not None:
+                        cached_asset = find_asset(asset_id)
+                        if cached_asset is not None:
+                            cached_asset.clear()
+                            cached_asset.update(updated_asset)
+                        else:
+                            discovered_assets.append(updated_asset)
                     
                     return jsonify({
                         "success": True,
@@ -3461,42 +4161,32 @@ def create_app():
                     
             except Exception as e:
                 print(f"Error updating asset metadata: {e}")
-                import traceback
                 traceback.print_exc()
                 return jsonify({"error": str(e)}), 500
         
-        active_connector_ids = set(conn['id'] for conn in active_connectors)
+        _, _, active_connector_ids, conn_types = connector_scope()
         
-        asset = None
-        for a in discovered_assets:
-            if a["id"] == asset_id:
-                asset_connector_id = a.get("connector_id", "")
-                if asset_connector_id in active_connector_ids:
-                    asset = a
-                    break
-                elif asset_connector_id.startswith('s3_') and any(conn.get('type') == 'Amazon S3' for conn in active_connectors):
-                    asset = a
-                    break
-                elif asset_connector_id.startswith('starburst_') and any(conn.get('type') == 'Starburst Galaxy' for conn in active_connectors):
-                    asset = a
-                    break
-                elif asset_connector_id.startswith('bq_') and any(conn.get('type') == 'BigQuery' for conn in active_connectors):
-                    asset = a
-                    break
+        asset = find_asset(asset_id)
+        if asset is None:
+            with app.app_context():
+                asset = db_helpers.get_asset(asset_id)
+            if asset is not None:
+                discovered_assets.append(asset)
+                mark_assets_changed()
+        if asset is not None:
+            asset_connector_id = asset.get("connector_id") or ""
+            prefix_type = CONNECTOR_ID_PREFIX_TYPES.get(asset_connector_id.partition('_')[0])
+            if not (asset_connector_id in active_connector_ids
+                    or (prefix_type is not None and prefix_type in conn_types)):
+                asset = None
         
         if not asset:
             abort(404, "Asset not found")
         
-        detailed_asset = asset.copy()
-        
-        if "columns" not in detailed_asset:
-            if asset.get("columns"):
-                detailed_asset["columns"] = asset.get("columns", [])
-            elif isinstance(asset.get("extra_data"), dict) and asset.get("extra_data", {}).get("columns"):
-                detailed_asset["columns"] = asset.get("extra_data", {}).get("columns", [])
+        missing_metadata = {}
         
-        if "technical_metadata" not in detailed_asset:
-            detailed_asset["technical_metadata"] = {
+        if "technical_metadata" not in asset:
+            missing_metadata["technical_metadata"] = {
                 "asset_id": asset["id"],
                 "asset_type": asset["type"],
                 "created_at": asset.get("discovered_at"),
@@ -3506,8 +4196,8 @@ def create_app():
                 "format": "BigQuery Native" if asset.get("connector_id", "").startswith("bq_") else "Starburst" if asset.get("connector_id", "").startswith("starburst_") else "N/A"
             }
         
-        if "operational_metadata" not in detailed_asset:
-            detailed_asset["operational_metadata"] = {
+        if "operational_metadata" not in asset:
+            missing_metadata["operational_metadata"] = {
                 "last_modified": asset.get("discovered_at", datetime.now().isoformat()),
                 "last_accessed": datetime.now().isoformat(),
                 "access_count": "N/A",
@@ -3516,8 +4206,8 @@ def create_app():
                 "data_quality_score": 90
             }
         
-        if "business_metadata" not in detailed_asset:
-            detailed_asset["business_metadata"] = {
+        if "business_metadata" not in asset:
+            missing_metadata["business_metadata"] = {
                 "description": asset.get("description", "No description available"),
                 "business_owner": "Unknown",
                 "department": "N/A",
@@ -3528,7 +4218,9 @@ def create_app():
         
         columns = []
         asset_type = (asset.get("type") or "").upper()
-        stored_columns = detailed_asset.get("columns", []) or asset.get("columns", [])
+        stored_columns = asset.get("columns")
+        if "columns" not in asset and isinstance(asset.get("extra_data"), dict):
+            stored_columns = asset["extra_data"].get("columns")
         
         if stored_columns and len(stored_columns) > 0:
             for col in stored_columns:
@@ -3537,15 +4229,14 @@ def create_app():
                     
                 col_name = col.get("name", "")
                 col_type = col.get("type", "STRING")
-                col_mode = col.get("mode", "NULLABLE")
+                
                 col_nullable = col.get("nullable")
                 if col_nullable is None:
+                    col_mode = col.get("mode", "NULLABLE")
                     col_nullable = col_mode in ["NULLABLE", "REPEATED"] if col_mode else True
-                
-                pii_detected = col.get("pii_detected", False)
-                pii_type = col.get("pii_type")
-                
-                if not pii_detected:
+                if "pii_detected" in col:
+                    pii_detected, pii_type = col["pii_detected"], col.get("pii_type")
+                else:
                     pii_detected, pii_type = detect_pii_in_column(col_name, col_type)
                 
                 columns.append({
@@ -3575,8 +4266,6 @@ def create_app():
                         "pii_type": pii_type
                     })
         
-        detailed_asset["columns"] = columns
-        
         connector_id = asset.get("connector_id", "")
         pipeline_stage = asset.get("technical_metadata", {}).get("pipeline_stage")
         is_pipeline_asset = pipeline_stage is not None
@@ -3601,45 +4290,17 @@ def create_app():
             upstream_assets = []
             downstream_assets = []
             
-            for other_asset in discovered_assets:
-                other_connector = other_asset.get("connector_id", "")
-                if other_connector == connector_id:
-                    other_name_lower = other_asset.get("name", "").lower()
-                    other_catalog_lower = other_asset.get("catalog", "").lower()
-                    
-                    if stage == "extract":
-                        if "warehouse" in other_catalog_lower:
-                            downstream_assets.append({
-                                "id": other_asset.get("id"),
-                                "name": other_asset.get("name"),
-                                "stage": "transform",
-                                "type": other_asset.get("type")
-                            })
-                    elif stage == "transform":
-                        if "staging" in other_catalog_lower or "raw" in other_name_lower:
-                            upstream_assets.append({
-                                "id": other_asset.get("id"),
-                                "name": other_asset.get("name"),
-                                "stage": "extract",
-                                "type": other_asset.get("type")
-                            })
-                        elif "analytics" in other_catalog_lower:
-                            downstream_assets.append({
-                                "id": other_asset.get("id"),
-                                "name": other_asset.get("name"),
-                                "stage": "load",
-                                "type": other_asset.get("type")
-                            })
-                    elif stage == "load":
-                        if "warehouse" in other_catalog_lower:
-                            upstream_assets.append({
-                                "id": other_asset.get("id"),
-                                "name": other_asset.get("name"),
-                                "stage": "transform",
-                                "type": other_asset.get("type")
-                            })
+            sibling_stages = pipeline_stages_for(connector_id)
+            if sibling_stages:
+                if stage == "extract":
+                    downstream_assets = list(sibling_stages["transform"])
+                elif stage == "transform":
+                    upstream_assets = list(sibling_stages["extract"])
+                    downstream_assets = list(sibling_stages["load"])
+                elif stage == "load":
+                    upstream_assets = list(sibling_stages["transform"])
             
-            detailed_asset["pipeline_metadata"] = {
+            pipeline_metadata = {
                 "is_pipeline_asset": True,
                 "pipeline_type": pipeline_type,
                 "pipeline_stage": stage or pipeline_stage,
@@ -3651,11 +4312,11 @@ def create_app():
                 "pipeline_description": f"Part of {pipeline_type} pipeline - {stage or pipeline_stage} stage"
             }
         else:
-            detailed_asset["pipeline_metadata"] = {
+            pipeline_metadata = {
                 "is_pipeline_asset": False
             }
         
-        return jsonify(detailed_asset)
+        return ojson({**asset, **missing_metadata, "columns": columns, "pipeline_metadata": pipeline_metadata})
 
     @app.route("/api/s3/pending-assets", methods=["GET"])
     def get_pending_assets():
@@ -3664,41 +4325,49 @@ def create_app():
         try:
             connector_id = request.args.get('connector_id')
             
-            query = db.session.query(PendingAsset).filter(
+            query = db.session.query(
+                PendingAsset.id,
+                PendingAsset.name,
+                PendingAsset.type,
+                PendingAsset.catalog,
+                PendingAsset.connector_id,
+                PendingAsset.change_type,
+                PendingAsset.s3_event_type,
+                PendingAsset.asset_id,
+                PendingAsset.asset_data,
+                PendingAsset.created_at
+            ).filter(
                 PendingAsset.status == 'pending'
             )
             
             if connector_id:
                 query = query.filter(PendingAsset.connector_id == connector_id)
-                
-            pending_assets = query.order_by(PendingAsset.created_at.desc()).all()
             
             result = []
-            for asset in pending_assets:
-                asset_dict = {
-                    'id': asset.id,
-                    'name': asset.name,
-                    'type': asset.type,
-                    'catalog': asset.catalog,
-                    'connector_id': asset.connector_id,
-                    'change_type': asset.change_type,
-                    's3_event_type': asset.s3_event_type,
-                    'asset_id': asset.asset_id,
-                    'asset_data': asset.asset_data,
-                    'created_at': asset.created_at.isoformat() if asset.created_at else None
-                }
-                result.append(asset_dict)
+            append = result.append
+            for (pending_id, name, asset_type, catalog, asset_connector_id, change_type,
+                 s3_event_type, asset_id, asset_data, created_at) in query.order_by(PendingAsset.created_at.desc()).yield_per(500):
+                append({
+                    'id': pending_id,
+                    'name': name,
+                    'type': asset_type,
+                    'catalog': catalog,
+                    'connector_id': asset_connector_id,
+                    'change_type': change_type,
+                    's3_event_type': s3_event_type,
+                    'asset_id': asset_id,
+                    'asset_data': asset_data,
+                    'created_at': created_at.isoformat() if created_at else None
+                })
                 
-            return jsonify({'pending_assets': result, 'count': len(result)}), 200
+            return ojson({'pending_assets': result, 'count': len(result)})
         except Exception as e:
             print(f"Error getting pending assets: {e}")
-            import traceback
             traceback.print_exc()
             return jsonify({'error': str(e)}), 500
 
     def accept_pending_asset_old():
         from database import PendingAsset
-        nonlocal discovered_assets
         
         try:
             data = request.json
@@ -3735,10 +4404,10 @@ def create_app():
                     except Exception as e:
                         print(f"Warning: Could not delete asset {pending_asset.asset_id} from database: {e}")
                     
-                    discovered_assets = db_helpers.load_assets()
+                    if asset_deleted:
+                        discovered_assets[:] = [a for a in discovered_assets if a.get('id') != pending_asset.asset_id]
+                        mark_assets_changed()
                     app.config['discovered_assets'] = discovered_assets
-                    save_assets()
-                    print(f" Reloaded {len(discovered_assets)} assets from database after removing asset")
                     
                     return jsonify({
                         'success': True, 
@@ -3775,19 +4444,22 @@ def create_app():
                     save_success = db_helpers.save_asset(asset_data)
                     if save_success:
                         print(f" Saved asset {asset_data.get('id')} to database")
+                        saved_asset = db_helpers.get_asset(asset_data['id'])
+                        if saved_asset:
+                            cached_asset = find_asset(asset_data['id'])
+                            if cached_asset is not None:
+                                cached_asset.clear()
+                                cached_asset.update(saved_asset)
+                            else:
+                                discovered_assets.append(saved_asset)
                     else:
                         print(f" Failed to save asset {asset_data.get('id')} to database")
-                        import traceback
-                        traceback.print_exc()
                 
                 pending_asset.status = 'accepted'
                 pending_asset.processed_at = datetime.utcnow()
                 db.session.commit()
                 
-                discovered_assets = db_helpers.load_assets()
                 app.config['discovered_assets'] = discovered_assets
-                save_assets()
-                print(f" Reloaded {len(discovered_assets)} assets from database after adding new asset")
                 
                 return jsonify({
                     'success': True, 
@@ -3798,7 +4470,6 @@ def create_app():
             with app.app_context():
                 db.session.rollback()
             print(f"Error accepting pending asset: {e}")
-            import traceback
             traceback.print_exc()
             return jsonify({'error': str(e)}), 500
 
@@ -3844,14 +4515,15 @@ def create_app():
 
     @app.route("/api/connectors/<string:connector_id>/toggle", methods=["POST"])
     def toggle_connector(connector_id: str):
-        nonlocal active_connectors
-        connector = next((c for c in active_connectors if c["id"] == connector_id), None)
+        nonlocal active_connectors, connector_scope_cache
+        connector = find_connector(connector_id)
         if not connector:
             abort(404, "Connector not found")
         
         was_enabled = connector.get("enabled", False)
         connector["enabled"] = not connector["enabled"]
         is_now_enabled = connector["enabled"]
+        connector_scope_cache = (None, 0, None)
         
         save_connectors()
         
@@ -3870,48 +4542,28 @@ def create_app():
 
     @app.route("/api/connectors/<string:connector_id>", methods=["DELETE"])
     def delete_connector(connector_id: str):
-        nonlocal active_connectors, discovered_assets
-        
-        connector = None
-        for i, conn in enumerate(active_connectors):
-            if conn["id"] == connector_id:
-                connector = conn
-                break
+        nonlocal active_connectors
         
+        connector = find_connector(connector_id)
         if not connector:
             abort(404, "Connector not found")
         
-        assets_before = len(discovered_assets)
-        assets_to_delete = [asset for asset in discovered_assets if asset.get("connector_id") == connector_id]
-        assets_deleted = len(assets_to_delete)
-        
-        
         db_success = db_helpers.delete_connector(connector_id)
         assets_db_success = db_helpers.delete_assets_by_connector(connector_id)
         
         pending_assets_deleted = 0
         try:
             from database import PendingAsset
-            with app.app_context():
-                pending_assets_deleted = db.session.query(PendingAsset).filter(
-                    PendingAsset.connector_id == connector_id
-                ).delete()
-                db.session.commit()
-                if pending_assets_deleted > 0:
-                    print(f" Deleted {pending_assets_deleted} pending asset(s) for connector {connector_id}")
-        except Exception as e:
-            print(f" Warning: Failed to delete pending assets for connector {connector_id}: {e}")
-        
-        try:
-            from database import PendingAsset
-            with app.app_context():
-                pending_count = db.session.query(PendingAsset).filter(
-                    PendingAsset.connector_id == connector_id
-                ).delete()
-                db.session.commit()
-                if pending_count > 0:
-                    print(f" Deleted {pending_count} pending asset(s) for connector {connector_id}")
+            from sqlalchemy import delete
+            pending_assets_deleted = db.session.execute(
+                delete(PendingAsset).where(PendingAsset.connector_id == connector_id)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.session.commit()
+            if pending_assets_deleted > 0:
+                print(f" Deleted {pending_assets_deleted} pending asset(s) for connector {connector_id}")
         except Exception as e:
+            db.session.rollback()
             print(f" Warning: Failed to delete pending assets for connector {connector_id}: {e}")
         
         if not db_success:
@@ -3919,15 +4571,20 @@ def create_app():
         if not assets_db_success:
             print(f" Warning: Failed to delete assets for connector {connector_id} from database")
         
-        active_connectors = [conn for conn in active_connectors if conn["id"] != connector_id]
-        discovered_assets = [asset for asset in discovered_assets if asset.get("connector_id") != connector_id]
+        kept_assets = []
+        assets_deleted = 0
+        for asset in discovered_assets:
+            if asset.get("connector_id") != connector_id:
+                kept_assets.append(asset)
+            else:
+                assets_deleted += 1
+        discovered_assets[:] = kept_assets
+        mark_assets_changed()
         
+        active_connectors = [conn for conn in active_connectors if conn["id"] != connector_id]
         app.config['active_connectors'] = active_connectors
         app.config['discovered_assets'] = discovered_assets
         
-        assets_after = len(discovered_assets)
-        
-        
         return jsonify({
             "message": f"Connector '{connector['name']}' and {assets_deleted} associated assets have been deleted successfully",
             "assets_deleted": assets_deleted,
@@ -4005,10 +4662,23 @@ def create_app():
     @app.route("/api/scheduler/sync-now", methods=["POST"])
     def trigger_sync_now():
         try:
-            sync_connectors()
-            return jsonify({"message": "Sync completed", "assets_count": len(discovered_assets)}), 200
+            if scheduler.running:
+                job = scheduler.add_job(
+                    sync_connectors,
+                    'date',
+                    run_date=datetime.now(),
+                    id='sync_now',
+                    name='Manual Connector Sync',
+                    replace_existing=True,
+                    max_instances=1,
+                    coalesce=True
+                )
+                job_id = job.id
+            else:
+                socketio.start_background_task(sync_connectors)
+                job_id = None
+            return jsonify({"message": "Sync started", "job_id": job_id, "assets_count": len(discovered_assets)}), 202
         except Exception as e:
-            import traceback
             traceback.print_exc()
             return jsonify({"message": f"Error during sync: {str(e)}"}), 500
 
@@ -4032,11 +4702,7 @@ def create_app():
                 return jsonify({"error": "Missing required fields"}), 400
             
             table_full_id = f"{project_id}.{dataset_id}.{table_id}"
-            asset = None
-            for a in discovered_assets:
-                if a.get('id') == table_full_id:
-                    asset = a
-                    break
+            asset = find_asset(table_full_id)
             
             if not asset:
                 return jsonify({"error": f"Table {table_full_id} not found in discovered assets. Please run asset discovery first."}), 404
@@ -4070,17 +4736,12 @@ def create_app():
                 return jsonify({"error": "Missing required fields"}), 400
             
             table_full_id = f"starburst.{catalog}.{schema_name}.{table_name}"
-            asset = None
-            for a in discovered_assets:
-                if a.get('id') == table_full_id:
-                    asset = a
-                    break
+            asset = find_asset(table_full_id)
             
             if not asset:
                 return jsonify({"error": f"Table {catalog}.{schema_name}.{table_name} not found in discovered assets. Please run asset discovery first."}), 404
             
-            import requests
-            import base64
+            from api.starburst import get_starburst_access_token, invalidate_starburst_access_token, starburst_session, starburst_get_with_fallback
             
             try:
                 starburst_connector = next((c for c in active_connectors if c.get('type') == 'Starburst Galaxy' and c.get('enabled')), None)
@@ -4099,14 +4760,10 @@ def create_app():
                     
                     if not access_token:
                         if client_id and client_secret:
-                            token_url = f"{base_url}/oauth/v2/token"
-                            auth_string = f"{client_id}:{client_secret}"
-                            auth_b64 = base64.b64encode(auth_string.encode()).decode()
-                            token_headers = {'Authorization': f'Basic {auth_b64}', 'Content-Type': 'application/x-www-form-urlencoded'}
-                            token_response = requests.post(token_url, headers=token_headers, data='grant_type=client_credentials', timeout=30, verify=False)
-                            
-                            if token_response.status_code == 200:
-                                access_token = token_response.json().get('access_token')
+                            access_token = get_starburst_access_token(
+                                config.get('account_domain'), client_id, client_secret,
+                                base_url=base_url, verify=False
+                            )
                     
                     headers = {}
                     auth = None
@@ -4120,7 +4777,9 @@ def create_app():
                     if access_token or auth:
                         
                         catalogs_url = f"{base_url}/public/api/v1/catalog"
-                        cat_response = requests.get(catalogs_url, headers=headers, timeout=30)
+                        cat_response = starburst_session.get(catalogs_url, headers=headers, timeout=30)
+                        if cat_response.status_code == 401 and client_id and client_secret:
+                            invalidate_starburst_access_token(config.get('account_domain'), client_id, client_secret, base_url=base_url)
                         if cat_response.status_code == 200:
                             catalogs_data = cat_response.json()
                             catalogs_list = catalogs_data.get('result', []) if isinstance(catalogs_data, dict) else catalogs_data
@@ -4133,12 +4792,11 @@ def create_app():
                                     break
                             
                             if catalog_id:
-                                schemas_url = f"{base_url}/public/api/v1/catalog/{catalog_id}/schema"
-                                sch_response = requests.get(schemas_url, headers=headers, auth=auth, timeout=30, verify=False)
-                                
-                                if sch_response.status_code != 200:
-                                    schemas_url = f"{base_url}/v1/catalog/{catalog}/schema"
-                                    sch_response = requests.get(schemas_url, headers=headers, auth=auth, timeout=30, verify=False)
+                                sch_response = starburst_get_with_fallback(
+                                    f"{base_url}/public/api/v1/catalog/{catalog_id}/schema",
+                                    f"{base_url}/v1/catalog/{catalog}/schema",
+                                    headers=headers, auth=auth, timeout=30, verify=False
+                                )
                                 if sch_response.status_code == 200:
                                     schemas_data = sch_response.json()
                                     schemas_list = schemas_data.get('result', []) if isinstance(schemas_data, dict) else schemas_data
@@ -4152,12 +4810,11 @@ def create_app():
                                             break
                                     
                                     if schema_id:
-                                        columns_url = f"{base_url}/public/api/v1/catalog/{catalog_id}/schema/{schema_id}/table/{table_name}/column"
-                                        columns_response = requests.get(columns_url, headers=headers, auth=auth, timeout=30, verify=False)
-                                        
-                                        if columns_response.status_code != 200:
-                                            columns_url = f"{base_url}/v1/catalog/{catalog}/schema/{schema_name}/table/{table_name}"
-                                            columns_response = requests.get(columns_url, headers=headers, auth=auth, timeout=30, verify=False)
+                                        columns_response = starburst_get_with_fallback(
+                                            f"{base_url}/public/api/v1/catalog/{catalog_id}/schema/{schema_id}/table/{table_name}/column",
+                                            f"{base_url}/v1/catalog/{catalog}/schema/{schema_name}/table/{table_name}",
+                                            headers=headers, auth=auth, timeout=30, verify=False
+                                        )
                                 
                                         if columns_response.status_code == 200:
                                             columns_data = columns_response.json()
@@ -4278,484 +4935,437 @@ def create_app():
 
     scheduler = BackgroundScheduler(daemon=True)
     scheduler_running = False
+    sync_lock = threading.Lock()
+    connector_assets_lock = threading.Lock()
 
-    def sync_connectors():
-        nonlocal active_connectors, discovered_assets
+    def refresh_connector_assets(connector_id):
+        fresh_assets = db_helpers.load_assets_by_connector(connector_id)
+        with connector_assets_lock:
+            discovered_assets[:] = [a for a in discovered_assets if a.get('connector_id') != connector_id] + fresh_assets
+            app.config['discovered_assets'] = discovered_assets
+            mark_assets_changed()
+        return len(fresh_assets)
+
+    def sync_one_connector(connector):
+        if not connector.get("enabled", False):
+            print(f" [{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] Skipping disabled connector: {connector.get('name', 'Unknown')}")
+            return
         
-        # Reload connectors from database to get latest state
-        try:
-            loaded_connectors = load_connectors()
-            if loaded_connectors:
-                active_connectors = loaded_connectors
-        except Exception as e:
-            print(f"  Error reloading connectors: {e}")
+        connector_type = connector.get("type", "").lower()
+        connector_id = connector.get("id", "")
+        connector_name = connector.get("name", "Unknown")
         
-        if not active_connectors:
-            print("  No connectors configured, skipping sync")
-            return
+        print(f" [{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] Processing connector: {connector_name} (type: {connector.get('type')}, lower: {connector_type})")
         
-        print(f" [{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] Starting continuous API sync for {len(active_connectors)} connectors...")
+        current_time = datetime.now().strftime('%H:%M:%S.%f')[:-3]
+        print(f" [{current_time}] Fetching API data for {connector_name} (Type: {connector_type})...")
         
-        # Debug: Log connector types
-        connector_types = [c.get("type", "Unknown") for c in active_connectors]
-        print(f" [{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] Connector types found: {connector_types}")
+        # Don't update last_run here - it's updated AFTER successful rediscovery for each connector type
+        # This was causing Azure Blob Storage to always skip because last_run was set to "now" before checking
         
-        for connector in active_connectors:
-            if not connector.get("enabled", False):
-                print(f" [{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] Skipping disabled connector: {connector.get('name', 'Unknown')}")
-                continue
+        if connector_type == "bigquery":
+            print(f" [{current_time}] Fetching BigQuery API for {connector_name}...")
             
-            connector_type = connector.get("type", "").lower()
-            connector_id = connector.get("id", "")
-            connector_name = connector.get("name", "Unknown")
+            config = connector.get("config", {})
+            service_account_json = config.get("service_account_json")
+            project_id = config.get("project_id")
             
-            print(f" [{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] Processing connector: {connector_name} (type: {connector.get('type')}, lower: {connector_type})")
-            
-            current_time = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-            print(f" [{current_time}] Fetching API data for {connector_name} (Type: {connector_type})...")
-            
-            # Don't update last_run here - it's updated AFTER successful rediscovery for each connector type
-            # This was causing Azure Blob Storage to always skip because last_run was set to "now" before checking
-            
-            if connector_type == "bigquery":
-                print(f" [{current_time}] Fetching BigQuery API for {connector_name}...")
-                
-                config = connector.get("config", {})
-                service_account_json = config.get("service_account_json")
-                project_id = config.get("project_id")
-                
-                if service_account_json and project_id:
-                    try:
-                        service_account_info = json.loads(service_account_json)
-                        credentials = service_account.Credentials.from_service_account_info(
-                            service_account_info,
-                            scopes=["https://www.googleapis.com/auth/bigquery.readonly"]
-                        )
-                        client = bigquery.Client(credentials=credentials, project=project_id)
-                        
-                        new_assets = []
-                        datasets = list(client.list_datasets())
-                        
-                        for dataset in datasets:
-                            dataset_id = dataset.dataset_id
-                            dataset_ref = client.dataset(dataset_id)
-                            
-                            tables = list(client.list_tables(dataset_ref))
-                            
-                            for table_item in tables:
-                                try:
-                                    table_ref = dataset_ref.table(table_item.table_id)
-                                    table = client.get_table(table_ref)
-                                    
-                                    asset_id = f"{project_id}.{dataset_id}.{table_item.table_id}"
-                                    
-                                    columns = []
-                                    for field in table.schema:
-                                        columns.append({
-                                            "name": field.name,
-                                            "type": field.field_type,
-                                            "mode": field.mode,
-                                            "description": field.description or ""
-                                        })
-                                    
-                                    extra_data = {
-                                        "source_system": "BigQuery",
-                                        "dataset": dataset_id,  
-                                        "project_id": project_id,
-                                        "columns": columns,
-                                        "row_count": table.num_rows,
-                                        "size": table.num_bytes,
-                                        "created": table.created.isoformat() if table.created else None,
-                                        "modified": table.modified.isoformat() if table.modified else None
-                                    }
-                                    
-                                    if table_item.table_type == "VIEW" and hasattr(table, 'view_query'):
-                                        extra_data["sql"] = table.view_query
-                                        extra_data["definition"] = table.view_query
-                                        extra_data["view_definition"] = table.view_query
-                                    
-                                    asset = {
-                                        "id": asset_id,
-                                        "name": table_item.table_id,
-                                        "type": table_item.table_type,
-                                        "catalog": dataset_id,  
-                                        "connector_id": connector_id,
-                                        "extra_data": extra_data
-                                    }
-                                    
-                                    new_assets.append(asset)
-                                
-                                except Exception as table_error:
-                                    print(f"  Error fetching table {table_item.table_id}: {table_error}")
-                                    continue
-                        
-                        for asset in new_assets:
-                            db_helpers.save_asset(asset)
-                        
-                        discovered_assets[:] = load_assets()
-                        
-                        connector["assets_count"] = len(new_assets)
-                        connector["status"] = "active"
-                        connector["last_run"] = datetime.now().isoformat()  # Update last_run after successful discovery
-                        print(f" [{current_time}] BigQuery connector {connector_name} discovered {len(new_assets)} assets")
+            if service_account_json and project_id:
+                try:
+                    service_account_info = json_loads(service_account_json)
+                    credentials = service_account.Credentials.from_service_account_info(
+                        service_account_info,
+                        scopes=["https://www.googleapis.com/auth/bigquery.readonly"]
+                    )
+                    client = bigquery.Client(credentials=credentials, project=project_id)
                     
-                    except Exception as bq_error:
-                        print(f" [{current_time}] Error discovering BigQuery assets: {bq_error}")
-                        import traceback
-                        traceback.print_exc()
-                        connector["assets_count"] = 0
-                        connector["status"] = "error"
-                else:
-                    print(f"  [{current_time}] BigQuery connector {connector_name} missing credentials")
-                    connector["assets_count"] = 0
-                    connector["status"] = "error"
-            
-            elif connector_type == "starburst galaxy":
-                print(f" [{current_time}] Fetching Starburst API for {connector_name}...")
-                
-                config = connector.get("config", {})
-                account_domain = config.get("account_domain")
-                
-                client_id = config.get("client_id")
-                client_secret = config.get("client_secret") or config.get("secret_key")
-                access_token = config.get("access_token")
-                
-                if account_domain and (access_token or (client_id and client_secret)):
-                    try:
-                        from api.starburst import discover_all_starburst_connectors, get_starburst_access_token
-                        
-                        if not access_token and client_id and client_secret:
-                            print(f" [{current_time}] Exchanging client credentials for access token...")
-                            access_token = get_starburst_access_token(account_domain, client_id, client_secret)
-                            if not access_token:
-                                print(f" [{current_time}] Failed to get access token")
-                                connector["assets_count"] = 0
-                                connector["status"] = "error"
-                                continue
-                        
-                        print(f" [{current_time}] Starting Starburst discovery for {connector_name}...")
-                        connectors_info = discover_all_starburst_connectors(account_domain, access_token)
-                        print(f" [{current_time}] Got {len(connectors_info)} catalogs from Starburst")
-                        
-                        total_tables_discovered = 0
-                        for cat_info in connectors_info:
-                            for schema_info in cat_info.get('schemas', []):
-                                total_tables_discovered += len(schema_info.get('tables', []))
-                        print(f" [{current_time}] Discovered {total_tables_discovered} total tables from Starburst")
-                        
-                        new_assets = []
-                        for catalog_info in connectors_info:
-                            catalog_id = catalog_info['catalog_id']
-                            catalog_name = catalog_info['catalog_name']
-                            schema_count = len(catalog_info.get('schemas', []))
-                            tables_in_catalog = sum(len(s.get('tables', [])) for s in catalog_info.get('schemas', []))
-                            print(f" [{current_time}] Processing catalog {catalog_name}: {schema_count} schemas, {tables_in_catalog} tables")
-                            
-                            for schem_info in catalog_info.get('schemas', []):
-                                schema_name = schem_info['schema_name']
-                                tables_in_schema = len(schem_info.get('tables', []))
-                                
-                                for table_info in schem_info.get('tables', []):
-                                    table_name = table_info['table_name']
-                                    table_type = table_info.get('table_type', 'TABLE')
-                                    
-                                    asset_id = f"{account_domain}.{catalog_name}.{schema_name}.{table_name}"
-                                    
-                                    columns = []
-                                    for col in table_info.get('columns', []):
-                                        columns.append({
-                                            "name": col.get('name', ''),
-                                            "type": col.get('type', ''),
-                                            "nullable": col.get('nullable', True),
-                                            "description": col.get('description', ''),
-                                            "tags": col.get('tags', [])
-                                        })
-                                    
-                                    extra_data = {
-                                        "source_system": "Starburst Galaxy",
-                                        "columns": columns,
-                                        "catalog_id": catalog_id,
-                                        "catalog_type": catalog_info.get('catalog_type'),
-                                        "connector_type": catalog_info.get('connector_type'),
-                                        "account_domain": account_domain,
-                                        "technical_metadata": {
-                                            "asset_id": asset_id,
-                                            "asset_type": table_type.upper(),
-                                            "location": f"{account_domain}/{catalog_name}/{schema_name}/{table_name}",
-                                            "format": "Starburst Table",
-                                            "source_system": "Starburst Galaxy",
-                                            "schema_name": schema_name,
-                                            "table_name": table_name,
-                                            "column_count": len(columns),
-                                            "owner": "account_admin"
-                                        },
-                                        "business_metadata": {
-                                            "description": "",
-                                            "business_owner": "account_admin",
-                                            "owner": "account_admin",
-                                            "department": schema_name,
-                                            "classification": "internal",
-                                            "sensitivity_level": "low",
-                                            "tags": []
-                                        },
-                                        "operational_metadata": {
-                                            "status": "active",
-                                            "owner": "account_admin",
-                                            "last_modified": datetime.now().isoformat(),
-                                            "last_accessed": datetime.now().isoformat(),
-                                            "access_count": "N/A",
-                                            "data_quality_score": 95
-                                        }
-                                    }
-                                    
-                                    asset = {
-                                        "id": asset_id,
-                                        "name": table_name,
-                                        "type": table_type.upper(),
-                                        "catalog": catalog_name,
-                                        "schema": schema_name,
-                                        "connector_id": connector_id,
-                                        "discovered_at": datetime.now().isoformat(),
-                                        "status": "active",
-                                        "extra_data": extra_data
-                                    }
-                                    
-                                    new_assets.append(asset)
-                        
-                        print(f" [{current_time}] Processed {len(new_assets)} assets from {len(connectors_info)} catalogs (expected ~{total_tables_discovered} tables)")
-                        
-                        print(f" [{current_time}] Saving {len(new_assets)} assets to MySQL...")
-                        saved_count = 0
-                        failed_count = 0
-                        failed_assets = []
-                        error_details = []
-                        
-                        for idx, asset in enumerate(new_assets):
-                            if not asset.get('id'):
-                                print(f"  [{current_time}] Skipping asset with no ID: {asset.get('name', 'Unknown')}")
-                                failed_count += 1
-                                failed_assets.append(f"no_id:{asset.get('name', 'Unknown')}")
-                                continue
-                            
-                            db_asset = {
-                                'id': asset.get('id'),
-                                'name': asset.get('name', 'Unknown'),
-                                'type': asset.get('type', 'Table'),
-                                'catalog': asset.get('catalog'),
-                                'schema': asset.get('schema'),
-                                'connector_id': asset.get('connector_id'),
-                                'discovered_at': asset.get('discovered_at', datetime.now().isoformat()),
-                                'status': asset.get('status', 'active'),
-                                'extra_data': asset
-                            }
-                            
-                            if not db_asset.get('name'):
-                                db_asset['name'] = db_asset['id'].split('.')[-1] if '.' in db_asset['id'] else 'Unknown'
-                            
-                            try:
-                                success = db_helpers.save_asset(db_asset)
-                                if success:
-                                    saved_count += 1
-                                    if saved_count % 50 == 0:
-                                        print(f" [{current_time}] Saved {saved_count}/{len(new_assets)} assets so far...")
-                                else:
-                                    failed_count += 1
-                                    failed_assets.append(db_asset.get('id', 'Unknown'))
-                                    error_msg = f"save_asset returned False"
-                                    error_details.append(f"{db_asset.get('id', 'Unknown')}: {error_msg}")
-                                    if connector.get('type') == 'Starburst Galaxy' or failed_count <= 20:
-                                        print(f"  [{current_time}] Failed to save asset {idx+1}/{len(new_assets)}: {db_asset.get('id', 'Unknown')}")
-                            except Exception as save_error:
-                                failed_count += 1
-                                failed_assets.append(db_asset.get('id', 'Unknown'))
-                                error_msg = str(save_error)
-                                error_details.append(f"{db_asset.get('id', 'Unknown')}: {error_msg}")
-                                if connector.get('type') == 'Starburst Galaxy' or failed_count <= 20:
-                                    print(f" [{current_time}] Exception saving asset {idx+1}/{len(new_assets)} {db_asset.get('id', 'Unknown')}: {save_error}")
-                                    import traceback
-                                    if connector.get('type') == 'Starburst Galaxy' and failed_count <= 5:
-                                        traceback.print_exc()
-                        
-                        print(f" [{current_time}] Saved {saved_count}/{len(new_assets)} assets ({failed_count} failed) for connector {connector_name}")
-                        if failed_count > 0:
-                            print(f"  [{current_time}] Failed asset count: {failed_count}")
-                            if error_details and len(error_details) <= 10:
-                                print(f"  [{current_time}] Error details:")
-                                for err in error_details[:10]:
-                                    print(f"     - {err}")
-                            if failed_count <= 50:
-                                print(f"  [{current_time}] Failed asset IDs: {failed_assets[:50]}")
-                            else:
-                                print(f"  [{current_time}] First 50 failed asset IDs: {failed_assets[:50]}")
-                                print(f"  [{current_time}] ... and {failed_count - 50} more")
-                        
-                        print(f" [{current_time}] Reloading assets from MySQL...")
-                        discovered_assets[:] = load_assets()
-                        
-                        connector_assets_count = len([a for a in discovered_assets if a.get('connector_id') == connector_id])
-                        connector["assets_count"] = connector_assets_count
-                        connector["status"] = "active"
-                        connector["last_run"] = datetime.now().isoformat()  # Update last_run after successful discovery
-                        print(f" [{current_time}] Starburst connector {connector_name} has {connector_assets_count} total assets")
-                        print(f" [{current_time}] Total assets in memory: {len(discovered_assets)}")
+                    datasets = list(client.list_datasets())
                     
-                    except Exception as starburst_error:
-                        print(f" [{current_time}] Error discovering Starburst assets: {starburst_error}")
-                        import traceback
-                        traceback.print_exc()
-                        connector["assets_count"] = 0
-                        connector["status"] = "error"
-                else:
-                    print(f"  [{current_time}] Starburst connector {connector_name} missing credentials")
-                    connector["assets_count"] = 0
-                    connector["status"] = "error"
-            
-            elif connector_type == "azure blob storage" or connector_type == "azure data storage":
-                connector_type_display = "Azure Data Storage" if connector_type == "azure data storage" else "Azure Blob Storage"
-                print(f" [{current_time}] Checking {connector_type_display} connector: {connector_name}...")
-                
-                config = connector.get("config", {})
-                account_name = config.get("account_name") or config.get("accountName")
-                account_key = config.get("account_key") or config.get("accountKey")
-                connection_string = config.get("connection_string") or config.get("connectionString")
-                container_name = config.get("container_name") or config.get("containerName")
-                share_name = config.get("share_name") or config.get("shareName")
-                
-                # Check if we should run rediscovery (every 5 minutes by default)
-                last_run = connector.get("last_run")
-                rediscovery_interval = config.get("rediscovery_interval_minutes", 5)  # Default 5 minutes
-                
-                print(f"  [{current_time}] Rediscovery interval: {rediscovery_interval} minutes, Last run: {last_run}")
-                
-                if last_run:
-                    try:
-                        last_run_dt = datetime.fromisoformat(last_run.replace('Z', '+00:00'))
-                        time_since_last_run = (datetime.now() - last_run_dt.replace(tzinfo=None)).total_seconds() / 60
-                        
-                        print(f"  [{current_time}] Time since last run: {time_since_last_run:.2f} minutes")
-                        
-                        if time_since_last_run < rediscovery_interval:
-                            print(f"  [{current_time}] ⏸️ Skipping rediscovery - only {time_since_last_run:.2f} minutes since last run (interval: {rediscovery_interval} min)")
-                            continue
-                        else:
-                            print(f"  [{current_time}] ✅ Time interval met ({time_since_last_run:.2f} >= {rediscovery_interval} min), proceeding with rediscovery...")
-                    except Exception as e:
-                        print(f"  [{current_time}] Error parsing last_run timestamp: {e}, proceeding with rediscovery...")
-                else:
-                    print(f"  [{current_time}] ⚠️ No last_run timestamp found, proceeding with initial rediscovery...")
+                    table_items = []
+                    for dataset in datasets:
+                        dataset_ref = client.dataset(dataset.dataset_id)
+                        for table_item in client.list_tables(dataset_ref):
+                            table_items.append((dataset_ref, table_item))
+                    
+                    with ThreadPoolExecutor(max_workers=BIGQUERY_TABLE_WORKERS) as executor:
+                        new_assets = [
+                            asset for asset in executor.map(
+                                lambda item: _bigquery_table_asset(client, item[0], item[1], project_id, connector_id),
+                                table_items
+                            )
+                            if asset is not None
+                        ]
+                    
+                    db_helpers.save_assets_bulk(new_assets, preserve=('discovered_at', 'sort_order'))
+                    
+                    refresh_connector_assets(connector_id)
+                    
+                    connector["assets_count"] = len(new_assets)
+                    connector["status"] = "active"
+                    connector["last_run"] = datetime.now().isoformat()  # Update last_run after successful discovery
+                    print(f" [{current_time}] BigQuery connector {connector_name} discovered {len(new_assets)} assets")
                 
-                if not connection_string and not (account_name and account_key):
-                    print(f"  [{current_time}] {connector_type_display} connector {connector_name} missing credentials")
+                except Exception as bq_error:
+                    print(f" [{current_time}] Error discovering BigQuery assets: {bq_error}")
+                    traceback.print_exc()
                     connector["assets_count"] = 0
                     connector["status"] = "error"
-                    continue
-                
+            else:
+                print(f"  [{current_time}] BigQuery connector {connector_name} missing credentials")
+                connector["assets_count"] = 0
+                connector["status"] = "error"
+        
+        elif connector_type == "starburst galaxy":
+            print(f" [{current_time}] Fetching Starburst API for {connector_name}...")
+            
+            config = connector.get("config", {})
+            account_domain = config.get("account_domain")
+            
+            client_id = config.get("client_id")
+            client_secret = config.get("client_secret") or config.get("secret_key")
+            access_token = config.get("access_token")
+            
+            if account_domain and (access_token or (client_id and client_secret)):
                 try:
-                    if connector_type == "azure data storage":
-                        from api.azure_unified import discover_azure_all_assets
-                        print(f"  [{current_time}] Starting Azure Data Storage discovery (Blob, Files, Tables, Queues)...")
-                        result = discover_azure_all_assets(
-                            account_name=account_name,
-                            account_key=account_key,
-                            connection_string=connection_string,
-                            container_name=container_name,
-                            share_name=share_name
-                        )
-                        assets = result.get('all_assets', [])
-                        summary = result.get('summary', {})
-                        print(f"  [{current_time}] Discovered {len(assets)} total assets (Blob: {summary.get('blob_assets', 0)}, Files: {summary.get('file_assets', 0)}, Tables: {summary.get('table_assets', 0)}, Queues: {summary.get('queue_assets', 0)})")
-                    else:
-                        from api.azure_blob import discover_azure_blob_assets_structured
-                        print(f"  [{current_time}] Starting Azure Blob Storage discovery...")
-                        structured_data = discover_azure_blob_assets_structured(
-                            account_name=account_name,
-                            account_key=account_key,
-                            connection_string=connection_string,
-                            container_name=container_name
-                        )
-                        assets = structured_data.get('all_assets', [])
-                        containers = structured_data.get('containers', [])
-                        print(f"  [{current_time}] Discovered {len(assets)} assets across {len(containers)} container(s)")
+                    from api.starburst import discover_all_starburst_connectors, get_starburst_access_token, invalidate_starburst_access_token
                     
-                    # Log discovered asset names for debugging
-                    if len(assets) > 0:
-                        print(f"  [{current_time}] Discovered asset names: {[a.get('name') for a in assets[:10]]}")
-                        if len(assets) > 10:
-                            print(f"  [{current_time}] ... and {len(assets) - 10} more")
+                    if not access_token and client_id and client_secret:
+                        print(f" [{current_time}] Exchanging client credentials for access token...")
+                        access_token = get_starburst_access_token(account_domain, client_id, client_secret)
+                        if not access_token:
+                            print(f" [{current_time}] Failed to get access token")
+                            connector["assets_count"] = 0
+                            connector["status"] = "error"
+                            return
                     
-                    existing_assets = db_helpers.load_assets()
-                    existing_asset_ids = {asset.get('id') for asset in existing_assets if asset.get('id')}
+                    print(f" [{current_time}] Starting Starburst discovery for {connector_name}...")
+                    connectors_info = discover_all_starburst_connectors(account_domain, access_token)
+                    print(f" [{current_time}] Got {len(connectors_info)} catalogs from Starburst")
                     
-                    print(f"  [{current_time}] Existing assets in DB: {len(existing_asset_ids)}")
+                    total_tables_discovered = 0
+                    for cat_info in connectors_info:
+                        for schema_info in cat_info.get('schemas', []):
+                            total_tables_discovered += len(schema_info.get('tables', []))
+                    print(f" [{current_time}] Discovered {total_tables_discovered} total tables from Starburst")
                     
                     new_assets = []
-                    updated_count = 0
-                    
-                    for asset in assets:
-                        asset['connector_id'] = connector_id
-                        asset['discovered_at'] = datetime.now().isoformat()
-                        asset['status'] = 'active'
+                    for catalog_info in connectors_info:
+                        catalog_id = catalog_info['catalog_id']
+                        catalog_name = catalog_info['catalog_name']
+                        schema_count = len(catalog_info.get('schemas', []))
+                        tables_in_catalog = sum(len(s.get('tables', [])) for s in catalog_info.get('schemas', []))
+                        print(f" [{current_time}] Processing catalog {catalog_name}: {schema_count} schemas, {tables_in_catalog} tables")
                         
-                        asset_id = asset.get('id')
-                        asset_name = asset.get('name', 'Unknown')
-                        
-                        if asset_id:
-                            if asset_id not in existing_asset_ids:
+                        for schem_info in catalog_info.get('schemas', []):
+                            schema_name = schem_info['schema_name']
+                            tables_in_schema = len(schem_info.get('tables', []))
+                            
+                            for table_info in schem_info.get('tables', []):
+                                table_name = table_info['table_name']
+                                table_type = table_info.get('table_type', 'TABLE')
+                                
+                                asset_id = f"{account_domain}.{catalog_name}.{schema_name}.{table_name}"
+                                
+                                columns = []
+                                for col in table_info.get('columns', []):
+                                    pii_detected, pii_type = detect_pii_in_column(col.get('name', ''), col.get('type', ''))
+                                    columns.append({
+                                        "name": col.get('name', ''),
+                                        "type": col.get('type', ''),
+                                        "nullable": col.get('nullable', True),
+                                        "description": col.get('description', ''),
+                                        "pii_detected": pii_detected,
+                                        "pii_type": pii_type,
+                                        "tags": col.get('tags', [])
+                                    })
+                                
+                                extra_data = {
+                                    "source_system": "Starburst Galaxy",
+                                    "columns": columns,
+                                    "catalog_id": catalog_id,
+                                    "catalog_type": catalog_info.get('catalog_type'),
+                                    "connector_type": catalog_info.get('connector_type'),
+                                    "account_domain": account_domain,
+                                    "technical_metadata": {
+                                        "asset_id": asset_id,
+                                        "asset_type": table_type.upper(),
+                                        "location": f"{account_domain}/{catalog_name}/{schema_name}/{table_name}",
+                                        "format": "Starburst Table",
+                                        "source_system": "Starburst Galaxy",
+                                        "schema_name": schema_name,
+                                        "table_name": table_name,
+                                        "column_count": len(columns),
+                                        "owner": "account_admin"
+                                    },
+                                    "business_metadata": {
+                                        "description": "",
+                                        "business_owner": "account_admin",
+                                        "owner": "account_admin",
+                                        "department": schema_name,
+                                        "classification": "internal",
+                                        "sensitivity_level": "low",
+                                        "tags": []
+                                    },
+                                    "operational_metadata": {
+                                        "status": "active",
+                                        "owner": "account_admin",
+                                        "last_modified": datetime.now().isoformat(),
+                                        "last_accessed": datetime.now().isoformat(),
+                                        "access_count": "N/A",
+                                        "data_quality_score": 95
+                                    }
+                                }
+                                
+                                asset = {
+                                    "id": asset_id,
+                                    "name": table_name,
+                                    "type": table_type.upper(),
+                                    "catalog": catalog_name,
+                                    "schema": schema_name,
+                                    "connector_id": connector_id,
+                                    "discovered_at": datetime.now().isoformat(),
+                                    "status": "active",
+                                    "extra_data": extra_data
+                                }
+                                
                                 new_assets.append(asset)
-                                existing_asset_ids.add(asset_id)
-                                print(f"  [{current_time}] 🆕 NEW asset found: {asset_name} (ID: {asset_id[:50]}...)")
-                            else:
-                                # Update existing asset
-                                try:
-                                    db_helpers.save_asset(asset)
-                                    updated_count += 1
-                                except Exception as e:
-                                    print(f"  [{current_time}] Error updating asset {asset_id}: {e}")
-                        else:
-                            print(f"  [{current_time}] ⚠️  Asset missing ID: {asset_name}")
                     
-                    print(f"  [{current_time}] Found {len(new_assets)} new asset(s) to save")
+                    print(f" [{current_time}] Processed {len(new_assets)} assets from {len(connectors_info)} catalogs (expected ~{total_tables_discovered} tables)")
+                    
+                    print(f" [{current_time}] Saving {len(new_assets)} assets to MySQL...")
+                    failed_assets = []
+                    error_details = []
+                    db_assets = []
                     
-                    # Save new assets
-                    saved_count = 0
                     for asset in new_assets:
-                        try:
-                            if db_helpers.save_asset(asset):
-                                saved_count += 1
-                                print(f"  [{current_time}] ✅ Saved new asset: {asset.get('name', 'Unknown')}")
-                            else:
-                                print(f"  [{current_time}] ❌ Failed to save asset: {asset.get('name', 'Unknown')} (save_asset returned False)")
-                        except Exception as e:
-                            print(f"  [{current_time}] ❌ Error saving asset {asset.get('id', 'Unknown')}: {e}")
-                            import traceback
-                            traceback.print_exc()
+                        if not asset.get('id'):
+                            print(f"  [{current_time}] Skipping asset with no ID: {asset.get('name', 'Unknown')}")
+                            failed_assets.append(f"no_id:{asset.get('name', 'Unknown')}")
+                            continue
+                        
+                        db_asset = {
+                            'id': asset.get('id'),
+                            'name': asset.get('name', 'Unknown'),
+                            'type': asset.get('type', 'Table'),
+                            'catalog': asset.get('catalog'),
+                            'schema': asset.get('schema'),
+                            'connector_id': asset.get('connector_id'),
+                            'discovered_at': asset.get('discovered_at', datetime.now().isoformat()),
+                            'status': asset.get('status', 'active'),
+                            'extra_data': asset
+                        }
+                        
+                        if not db_asset.get('name'):
+                            db_asset['name'] = db_asset['id'].split('.')[-1] if '.' in db_asset['id'] else 'Unknown'
+                        
+                        db_assets.append(db_asset)
+                    
+                    saved_count = db_helpers.save_assets_bulk(db_assets, preserve=('sort_order',))
+                    if db_assets and saved_count == 0:
+                        failed_assets.extend(db_asset['id'] for db_asset in db_assets)
+                        error_details.append(f"save_assets_bulk saved 0 of {len(db_assets)} assets")
+                    failed_count = len(new_assets) - saved_count
                     
-                    discovered_assets[:] = load_assets()
+                    print(f" [{current_time}] Saved {saved_count}/{len(new_assets)} assets ({failed_count} failed) for connector {connector_name}")
+                    if failed_count > 0:
+                        print(f"  [{current_time}] Failed asset count: {failed_count}")
+                        if error_details and len(error_details) <= 10:
+                            print(f"  [{current_time}] Error details:")
+                            for err in error_details[:10]:
+                                print(f"     - {err}")
+                        if failed_count <= 50:
+                            print(f"  [{current_time}] Failed asset IDs: {failed_assets[:50]}")
+                        else:
+                            print(f"  [{current_time}] First 50 failed asset IDs: {failed_assets[:50]}")
+                            print(f"  [{current_time}] ... and {failed_count - 50} more")
                     
-                    connector_assets_count = len([a for a in discovered_assets if a.get('connector_id') == connector_id])
+                    print(f" [{current_time}] Reloading {connector_name} assets from MySQL...")
+                    connector_assets_count = refresh_connector_assets(connector_id)
                     connector["assets_count"] = connector_assets_count
                     connector["status"] = "active"
-                    connector["last_run"] = datetime.now().isoformat()
-                    
-                    # Save connector to database with updated last_run
-                    try:
-                        db_helpers.save_connector(connector)
-                    except Exception as save_err:
-                        print(f"  [{current_time}] Error saving connector after rediscovery: {save_err}")
-                    
-                    print(f"  [{current_time}] ✅ {connector_type_display} connector {connector_name}: {saved_count} new, {updated_count} updated, {connector_assets_count} total assets")
+                    connector["last_run"] = datetime.now().isoformat()  # Update last_run after successful discovery
+                    print(f" [{current_time}] Starburst connector {connector_name} has {connector_assets_count} total assets")
+                    print(f" [{current_time}] Total assets in memory: {len(discovered_assets)}")
                 
-                except Exception as azure_error:
-                    print(f"  [{current_time}] Error rediscovering {connector_type_display} assets: {azure_error}")
-                    import traceback
+                except Exception as starburst_error:
+                    print(f" [{current_time}] Error discovering Starburst assets: {starburst_error}")
+                    error_response = getattr(starburst_error, 'response', None)
+                    if error_response is not None and error_response.status_code == 401 and client_id and client_secret:
+                        invalidate_starburst_access_token(account_domain, client_id, client_secret)
                     traceback.print_exc()
                     connector["assets_count"] = 0
                     connector["status"] = "error"
+            else:
+                print(f"  [{current_time}] Starburst connector {connector_name} missing credentials")
+                connector["assets_count"] = 0
+                connector["status"] = "error"
+        
+        elif connector_type == "azure blob storage" or connector_type == "azure data storage":
+            connector_type_display = "Azure Data Storage" if connector_type == "azure data storage" else "Azure Blob Storage"
+            print(f" [{current_time}] Checking {connector_type_display} connector: {connector_name}...")
+            
+            config = connector.get("config", {})
+            account_name = config.get("account_name") or config.get("accountName")
+            account_key = config.get("account_key") or config.get("accountKey")
+            connection_string = config.get("connection_string") or config.get("connectionString")
+            container_name = config.get("container_name") or config.get("containerName")
+            share_name = config.get("share_name") or config.get("shareName")
+            
+            # Check if we should run rediscovery (every 5 minutes by default)
+            last_run = connector.get("last_run")
+            rediscovery_interval = config.get("rediscovery_interval_minutes", 5)  # Default 5 minutes
             
+            print(f"  [{current_time}] Rediscovery interval: {rediscovery_interval} minutes, Last run: {last_run}")
+            
+            if last_run:
+                try:
+                    last_run_dt = datetime.fromisoformat(last_run.replace('Z', '+00:00'))
+                    time_since_last_run = (datetime.now() - last_run_dt.replace(tzinfo=None)).total_seconds() / 60
+                    
+                    print(f"  [{current_time}] Time since last run: {time_since_last_run:.2f} minutes")
+                    
+                    if time_since_last_run < rediscovery_interval:
+                        print(f"  [{current_time}] ⏸️ Skipping rediscovery - only {time_since_last_run:.2f} minutes since last run (interval: {rediscovery_interval} min)")
+                        return
+                    else:
+                        print(f"  [{current_time}] ✅ Time interval met ({time_since_last_run:.2f} >= {rediscovery_interval} min), proceeding with rediscovery...")
+                except Exception as e:
+                    print(f"  [{current_time}] Error parsing last_run timestamp: {e}, proceeding with rediscovery...")
             else:
-                print(f"  [{current_time}] Unknown connector type: {connector_type}")
+                print(f"  [{current_time}] ⚠️ No last_run timestamp found, proceeding with initial rediscovery...")
             
-            save_connectors()
+            if not connection_string and not (account_name and account_key):
+                print(f"  [{current_time}] {connector_type_display} connector {connector_name} missing credentials")
+                connector["assets_count"] = 0
+                connector["status"] = "error"
+                return
+            
+            try:
+                if connector_type == "azure data storage":
+                    from api.azure_unified import discover_azure_all_assets
+                    print(f"  [{current_time}] Starting Azure Data Storage discovery (Blob, Files, Tables, Queues)...")
+                    result = discover_azure_all_assets(
+                        account_name=account_name,
+                        account_key=account_key,
+                        connection_string=connection_string,
+                        container_name=container_name,
+                        share_name=share_name
+                    )
+                    assets = result.get('all_assets', [])
+                    summary = result.get('summary', {})
+                    print(f"  [{current_time}] Discovered {len(assets)} total assets (Blob: {summary.get('blob_assets', 0)}, Files: {summary.get('file_assets', 0)}, Tables: {summary.get('table_assets', 0)}, Queues: {summary.get('queue_assets', 0)})")
+                else:
+                    from api.azure_blob import discover_azure_blob_assets_structured
+                    print(f"  [{current_time}] Starting Azure Blob Storage discovery...")
+                    structured_data = discover_azure_blob_assets_structured(
+                        account_name=account_name,
+                        account_key=account_key,
+                        connection_string=connection_string,
+                        container_name=container_name
+                    )
+                    assets = structured_data.get('all_assets', [])
+                    containers = structured_data.get('containers', [])
+                    print(f"  [{current_time}] Discovered {len(assets)} assets across {len(containers)} container(s)")
+                
+                # Log discovered asset names for debugging
+                if len(assets) > 0:
+                    print(f"  [{current_time}] Discovered asset names: {[a.get('name') for a in assets[:10]]}")
+                    if len(assets) > 10:
+                        print(f"  [{current_time}] ... and {len(assets) - 10} more")
+                
+                existing_assets = db_helpers.load_assets()
+                existing_asset_ids = {asset.get('id') for asset in existing_assets if asset.get('id')}
+                
+                print(f"  [{current_time}] Existing assets in DB: {len(existing_asset_ids)}")
+                
+                new_assets = []
+                updated_assets = []
+                
+                for asset in assets:
+                    asset['connector_id'] = connector_id
+                    asset['discovered_at'] = datetime.now().isoformat()
+                    asset['status'] = 'active'
+                    
+                    asset_id = asset.get('id')
+                    asset_name = asset.get('name', 'Unknown')
+                    
+                    if asset_id:
+                        if asset_id not in existing_asset_ids:
+                            new_assets.append(asset)
+                            existing_asset_ids.add(asset_id)
+                            print(f"  [{current_time}] 🆕 NEW asset found: {asset_name} (ID: {asset_id[:50]}...)")
+                        else:
+                            updated_assets.append(asset)
+                    else:
+                        print(f"  [{current_time}] ⚠️  Asset missing ID: {asset_name}")
+                
+                print(f"  [{current_time}] Found {len(new_assets)} new asset(s) to save")
+                
+                # Save new assets, then refresh existing ones without touching their
+                # stored extra_data (business_metadata from PUT lives there)
+                saved_count = 0
+                updated_count = 0
+                if new_assets:
+                    if db_helpers.save_assets_bulk(new_assets, preserve=('sort_order',)):
+                        saved_count = len(new_assets)
+                    else:
+                        print(f"  [{current_time}] ❌ Failed to save {len(new_assets)} new asset(s)")
+                if updated_assets:
+                    if db_helpers.save_assets_bulk(updated_assets, preserve=('sort_order', 'extra_data', 'schema_name')):
+                        updated_count = len(updated_assets)
+                    else:
+                        print(f"  [{current_time}] ❌ Failed to update {len(updated_assets)} existing asset(s)")
+                
+                connector_assets_count = refresh_connector_assets(connector_id)
+                connector["assets_count"] = connector_assets_count
+                connector["status"] = "active"
+                connector["last_run"] = datetime.now().isoformat()
+                
+                print(f"  [{current_time}] ✅ {connector_type_display} connector {connector_name}: {saved_count} new, {updated_count} updated, {connector_assets_count} total assets")
+            
+            except Exception as azure_error:
+                print(f"  [{current_time}] Error rediscovering {connector_type_display} assets: {azure_error}")
+                traceback.print_exc()
+                connector["assets_count"] = 0
+                connector["status"] = "error"
+        
+        else:
+            print(f"  [{current_time}] Unknown connector type: {connector_type}")
+
+    def sync_connectors():
+        if not sync_lock.acquire(blocking=False):
+            print("  Connector sync already in progress, skipping")
+            return
+        try:
+            run_connector_sync()
+        finally:
+            sync_lock.release()
+
+    def run_connector_sync():
+        nonlocal active_connectors, discovered_assets
+        
+        # Reload connectors from database to get latest state
+        try:
+            loaded_connectors = load_connectors()
+            if loaded_connectors:
+                active_connectors = loaded_connectors
+        except Exception as e:
+            print(f"  Error reloading connectors: {e}")
+        
+        if not active_connectors:
+            print("  No connectors configured, skipping sync")
+            return
+        
+        print(f" [{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] Starting continuous API sync for {len(active_connectors)} connectors...")
+        
+        # Debug: Log connector types
+        connector_types = [c.get("type", "Unknown") for c in active_connectors]
+        print(f" [{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] Connector types found: {connector_types}")
+        
+        with ThreadPoolExecutor(max_workers=CONNECTOR_SYNC_WORKERS) as executor:
+            list(executor.map(sync_one_connector, list(active_connectors)))
+        
+        save_connectors()
         
         completion_time = datetime.now().strftime('%H:%M:%S.%f')[:-3]
         print(f" [{completion_time}] Continuous API sync completed - {len(active_connectors)} connectors, {len(discovered_assets)} total assets")
@@ -4773,7 +5383,9 @@ def create_app():
             trigger=IntervalTrigger(seconds=1),  
             id='continuous_sync',
             name='Continuous API Sync (Always Fetching Every Second)',
-            replace_existing=True
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
         )
         
         scheduler.start()
@@ -4799,7 +5411,6 @@ def create_app():
         print(" GCS Event Processor initialized and started")
     except Exception as e:
         print(f"  Failed to start GCS Event Processor: {e}")
-        import traceback
         traceback.print_exc()
 
     try:
@@ -4807,7 +5418,6 @@ def create_app():
         print(" Background scheduler started for continuous connector sync")
     except Exception as e:
         print(f"  Failed to start background scheduler: {e}")
-        import traceback
         traceback.print_exc()
 
     app.config['socketio_instance'] = socketio
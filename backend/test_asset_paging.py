@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the in-memory asset paging matches the SQL asset query
+"""
+import sys
+import os
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, Asset
+from db_helpers import _query_asset_page, _asset_to_dict, page_assets
+
+CONNECTORS = ['bq_prod', 'bq_dev', 'azure_blob_main', 's3_lake', 'test_sandbox', 'starburst_mesh']
+CATALOGS = ['sales', 'finance', None]
+TYPES = ['Table', 'View', 'File']
+
+def build_session():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    base_time = datetime(2024, 1, 1, 12, 0, 0)
+    for i in range(60):
+        session.add(Asset(
+            id=f"asset_{i}",
+            name=f"Orders_{i}" if i % 4 == 0 else f"customer_events_{i}",
+            type=TYPES[i % len(TYPES)],
+            catalog=CATALOGS[i % len(CATALOGS)],
+            connector_id=CONNECTORS[i % len(CONNECTORS)],
+            discovered_at=None if i % 7 == 0 and i % 3 else base_time + timedelta(minutes=i * 13 % 60, seconds=i),
+            sort_order=None if i % 3 == 0 else 1000 - i,
+        ))
+    session.commit()
+    return session
+
+def test_asset_paging_matches_sql():
+    """Compare SQL filtering/ordering with the in-memory fallback"""
+    print("=" * 60)
+    print("Testing SQL vs in-memory asset paging")
+    print("=" * 60)
+
+    session = build_session()
+    assets = [_asset_to_dict(asset) for asset in session.query(Asset).all()]
+
+    scopes = [
+        (['bq_prod', 'bq_dev'], (), False),
+        (['starburst_mesh'], ('azure_blob_',), False),
+        ([], ('s3_',), True),
+        (CONNECTORS, (), False),
+    ]
+    filters = [
+        {},
+        {'search': 'ORDERS'},
+        {'catalog': 'sales'},
+        {'asset_type': 'View', 'search': 'events'},
+    ]
+    pages = [(50, 0), (5, 0), (5, 5), (3, 40)]
+
+    failures = 0
+    for connector_ids, prefixes, include_test in scopes:
+        for kwargs in filters:
+            for limit, offset in pages:
+                sql_page, sql_total = _query_asset_page(
+                    session, connector_ids, prefixes, include_test,
+                    kwargs.get('search'), kwargs.get('catalog'), kwargs.get('asset_type'), limit, offset
+                )
+                mem_page, mem_total = page_assets(
+                    assets, connector_ids, prefixes, include_test, limit=limit, offset=offset, **kwargs
+                )
+                sql_ids = [asset['id'] for asset in sql_page]
+                mem_ids = [asset['id'] for asset in mem_page]
+                if sql_ids != mem_ids or sql_total != mem_total:
+                    failures += 1
+                    print(f"❌ {connector_ids} {prefixes} test={include_test} {kwargs} limit={limit} offset={offset}")
+                    print(f"   SQL:    {sql_total} {sql_ids}")
+                    print(f"   Memory: {mem_total} {mem_ids}")
+
+    session.close()
+    if failures:
+        print(f"\n❌ {failures} mismatching page(s)")
+        return False
+    print("\n✅ In-memory paging matches the SQL query")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if test_asset_paging_matches_sql() else 1)
@@ -0,0 +1,9 @@
+from concurrent.futures import FIRST_COMPLETED, as_completed, wait
+def bounded_completions(pool, fn, items, window):
+    pending = set()
+    for item in items:
+        pending.add(pool.submit(fn, item))
+        if len(pending) >= window:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from done
+    yield from as_completed(pending)
@@ -111,6 +111,10 @@ const ConnectorsPage = () => {
       setDiscoveryProgress(prev => [...prev, data.message]);
     });
 
+    socket.on('progress_batch', (data) => {
+      setDiscoveryProgress(prev => [...prev, ...data.messages]);
+    });
+
     socket.on('complete', (data) => {
       console.log('✅ SocketIO Complete:', data);
       setTestResult({
@@ -126,6 +130,11 @@ const ConnectorsPage = () => {
       fetchMyConnections();
     });
 
+    socket.on('persisted', (data) => {
+      console.log('💾 SocketIO Persisted:', data);
+      fetchMyConnections();
+    });
+
     socket.on('error', (data) => {
       console.error('❌ SocketIO Error:', data);
       setTestResult({
@@ -145,7 +154,9 @@ const ConnectorsPage = () => {
         socket.off('disconnect');
         socket.off('connect_error');
         socket.off('progress');
+        socket.off('progress_batch');
         socket.off('complete');
+        socket.off('persisted');
         socket.off('error');
         // Disconnect the socket
         socket.disconnect();